@@ -0,0 +1,97 @@
+"""
+Compare `get` and `has` with and without the key index on deep and wide files.
+
+    $ poetry run python benchmarks/bench_index.py
+"""
+import tempfile
+from io import StringIO
+from pathlib import Path
+from timeit import repeat
+
+import tomlkit
+from ruamel.yaml import YAML
+
+from config_file import ConfigFile
+
+DEPTH = 12
+SECTIONS = 500
+KEYS_PER_SECTION = 20
+LOOKUPS = 10_000
+
+
+def deep_document() -> dict:
+    """Sections nested DEPTH deep, with a few keys at every level."""
+    document: dict = {}
+    section = document
+    for level in range(DEPTH):
+        section.update({f"key_{key}": key for key in range(5)})
+        section = section.setdefault(f"level_{level}", {})
+
+    section["leaf"] = "value"
+    return document
+
+
+def wide_document() -> dict:
+    return {
+        f"section_{section}": {f"key_{key}": key for key in range(KEYS_PER_SECTION)}
+        for section in range(SECTIONS)
+    }
+
+
+def write_files(directory: Path, name: str, contents: dict) -> dict:
+    yaml_buffer = StringIO()
+    YAML().dump(contents, yaml_buffer)
+
+    paths = {
+        "yaml": directory / f"{name}.yaml",
+        "toml": directory / f"{name}.toml",
+    }
+    paths["yaml"].write_text(yaml_buffer.getvalue())
+    paths["toml"].write_text(tomlkit.dumps(contents))
+    return paths
+
+
+def best_of(statement) -> float:
+    return min(repeat(statement, number=1, repeat=5)) / LOOKUPS
+
+
+def measure(config: ConfigFile, hit: str, miss: str) -> tuple:
+    def get():
+        for _ in range(LOOKUPS):
+            config.get(hit)
+
+    def has_hit():
+        for _ in range(LOOKUPS):
+            config.has(hit)
+
+    def has_miss():
+        for _ in range(LOOKUPS):
+            config.has(miss)
+
+    return best_of(get), best_of(has_hit), best_of(has_miss)
+
+
+def main() -> None:
+    deep_key = ".".join([f"level_{level}" for level in range(DEPTH)] + ["leaf"])
+    documents = {
+        "deep": (deep_document(), deep_key, deep_key.replace("leaf", "missing")),
+        "wide": (wide_document(), "section_250.key_10", "section_250.missing"),
+    }
+
+    print(f"deep: {DEPTH} levels, wide: {SECTIONS} sections of {KEYS_PER_SECTION}")
+    print("microseconds per call\n")
+    print(f"{'file':<12}{'index':<8}{'get hit':>10}{'has hit':>10}{'has miss':>10}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, (contents, hit, miss) in documents.items():
+            for extension, path in write_files(Path(directory), name, contents).items():
+                for index in (False, True):
+                    timings = measure(ConfigFile(path, index=index), hit, miss)
+                    print(
+                        f"{name + '.' + extension:<12}{str(index):<8}"
+                        + "".join(f"{timing * 1e6:>10.2f}" for timing in timings)
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Compare the functions of `config_file.nested_lookup`, which walk through
+documents with an explicit stack, against the recursive walks they used to
+each have, on deep and wide documents. Also compare looking up or altering
+several keys at once against looking them up and updating them one at a time,
+and making a small change to a copy of a document by copying only what is
+changed against a deep copy.
+
+    $ poetry run python benchmarks/bench_nested_lookup.py
+"""
+import copy
+import sys
+import tracemalloc
+from timeit import repeat
+from typing import Any
+
+from config_file.nested_lookup import (
+    get_all_keys,
+    get_occurrence_of_value,
+    nested_alter,
+    nested_lookup,
+    nested_update,
+)
+
+
+def recursive_nested_lookup(key, document):
+    """How `nested_lookup` used to walk through a document."""
+
+    def lookup(document):
+        if isinstance(document, list):
+            for d in document:
+                for result in lookup(d):
+                    yield result
+
+        if isinstance(document, dict):
+            for k, v in document.items():
+                if key == k:
+                    yield v
+                if isinstance(v, dict):
+                    for result in lookup(v):
+                        yield result
+                elif isinstance(v, list):
+                    for d in v:
+                        for result in lookup(d):
+                            yield result
+
+    return list(lookup(document))
+
+
+def recursive_get_all_keys(dictionary):
+    """How `get_all_keys` used to walk through a document."""
+    result_list = []
+
+    def recursion(document):
+        if isinstance(document, list):
+            for list_items in document:
+                recursion(list_items)
+        elif isinstance(document, dict):
+            for key, value in document.items():
+                result_list.append(key)
+                recursion(value)
+
+    recursion(dictionary)
+    return result_list
+
+
+def recursive_get_occurrence_of_value(dictionary, keyword):
+    """How `get_occurrence_of_value` used to walk through a document."""
+    occurrence = [0]
+
+    def recursion(dictionary):
+        if keyword in list(dictionary.values()):
+            occurrence[0] += list(dictionary.values()).count(keyword)
+        for value in dictionary.values():
+            if isinstance(value, dict):
+                recursion(value)
+            elif isinstance(value, list):
+                for list_items in value:
+                    if hasattr(list_items, "items"):
+                        recursion(list_items)
+                    elif list_items == keyword:
+                        occurrence[0] += 1
+
+    recursion(dictionary)
+    return occurrence[0]
+
+
+def recursive_nested_update(document, key, value):
+    """How `nested_update(in_place=True)` used to walk through a document."""
+    if isinstance(document, list):
+        for list_items in document:
+            recursive_nested_update(list_items, key, value)
+    elif isinstance(document, dict):
+        for dict_key, dict_value in document.items():
+            if dict_key == key:
+                document[key] = value
+            recursive_nested_update(dict_value, key, value)
+    return document
+
+
+def lookup_and_update_alter(document, keys, callback):
+    """How `nested_alter` used to alter several keys."""
+    document = copy.deepcopy(document)
+    for key in keys:
+        for k, values in nested_lookup(key, document, with_keys=True).items():
+            document = nested_update(
+                document, k, [callback(v) for v in values], treat_as_element=False
+            )
+    return document
+
+
+def deep(depth: int) -> dict:
+    """Sections nested depth deep, each with a few keys and a list."""
+    document: Any = {"name": "leaf", "port": 0}
+    for level in range(depth):
+        document = {
+            "name": f"level {level}",
+            "port": level,
+            "hosts": ["a", "b"],
+            "child": document,
+        }
+    return document
+
+
+def wide(sections: int) -> dict:
+    """Many sections of many keys, nested two deep, with lists of sections."""
+    return {
+        f"section_{section}": {
+            "name": f"section {section}",
+            "port": section,
+            "servers": [{"name": f"server {index}", "port": 0} for index in range(5)],
+            **{f"key_{key}": key for key in range(20)},
+        }
+        for section in range(sections)
+    }
+
+
+BENCHMARKS = [
+    (
+        "nested_lookup",
+        lambda d: recursive_nested_lookup("name", d),
+        lambda d: nested_lookup("name", d),
+    ),
+    ("get_all_keys", recursive_get_all_keys, get_all_keys),
+    (
+        "get_occurrence_of_value",
+        lambda d: recursive_get_occurrence_of_value(d, 0),
+        lambda d: get_occurrence_of_value(d, 0),
+    ),
+    (
+        "nested_update(in_place=True)",
+        lambda d: recursive_nested_update(d, "port", 1),
+        lambda d: nested_update(d, "port", 1, in_place=True),
+    ),
+]
+
+
+def best_of(function, document) -> float:
+    return min(repeat(lambda: function(document), number=1, repeat=10))
+
+
+def peak_memory(function, document) -> int:
+    tracemalloc.start()
+    function(document)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    # The recursive walks need a frame or two per level of the document.
+    depth = sys.getrecursionlimit() // 3
+    documents = [(f"{depth} deep", deep(depth)), ("2000 wide", wide(2000))]
+
+    print(f"{'':<30}{'document':<12}{'recursive':>12}{'stack':>12}{'speedup':>10}")
+    for name, recursive, iterative in BENCHMARKS:
+        for label, document in documents:
+            old = best_of(recursive, document)
+            new = best_of(iterative, document)
+            print(
+                f"{name:<30}{label:<12}{old * 1e3:>9.2f} ms{new * 1e3:>9.2f} ms"
+                f"{old / new:>9.1f}x"
+            )
+
+    document = wide(2000)
+    keys = ["name", "port", "key_3", "key_7", "key_19"]
+    separately = best_of(lambda d: [nested_lookup(key, d) for key in keys], document)
+    together = best_of(lambda d: nested_lookup(keys, d), document)
+    print(f"\n{len(keys)} keys of 2000 wide, looked up one at a time: ", end="")
+    print(f"{separately * 1e3:.2f} ms, all at once: {together * 1e3:.2f} ms")
+
+    def callback(value):
+        return value if isinstance(value, str) else -value
+
+    assert lookup_and_update_alter(document, keys, callback) == nested_alter(
+        document, keys, callback
+    )
+    separately = best_of(lambda d: lookup_and_update_alter(d, keys, callback), document)
+    together = best_of(lambda d: nested_alter(d, keys, callback), document)
+    print(f"{len(keys)} keys of 2000 wide, altered one at a time: ", end="")
+    print(f"{separately * 1e3:.2f} ms, all at once: {together * 1e3:.2f} ms")
+
+    document["section_7"]["servers"][3]["weight"] = 1
+    print("\none key of 2000 wide, updated in a copy:")
+    for label, share_unchanged in [("deep copy", False), ("share_unchanged", True)]:
+
+        def update(d):
+            return nested_update(d, "weight", 2, share_unchanged=share_unchanged)
+
+        seconds = best_of(update, document)
+        memory = peak_memory(update, document) / 1024
+        print(f"  {label:<20}{seconds * 1e3:>9.2f} ms{memory:>12.1f} KiB")
+
+    too_deep = deep(sys.getrecursionlimit() * 10)
+    label = f"{sys.getrecursionlimit() * 10} deep"
+    try:
+        recursive_nested_lookup("name", too_deep)
+    except RecursionError:
+        print(f"\nrecursive nested_lookup {label}: RecursionError")
+
+    seconds = best_of(lambda d: nested_lookup("name", d), too_deep)
+    print(f"nested_lookup {label}: {seconds * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compare `parse_literal` against `ast.literal_eval` on long list and dict values.
+
+    $ poetry run python benchmarks/bench_parse_literal.py
+"""
+import ast
+import tracemalloc
+from timeit import repeat
+
+from config_file.parsers.parse_literal import parse_literal
+
+SIZES = [10, 1_000, 10_000]
+
+
+def literals(size: int) -> dict:
+    return {
+        "hosts": repr([f"host-{index}.example.com" for index in range(size)]),
+        "ports": repr(list(range(8000, 8000 + size))),
+        "mixed": repr(
+            [[index, index / 4, index % 2 == 0, None] for index in range(size)]
+        ),
+        "dict": repr({f"key_{index}": f"value {index}" for index in range(size)}),
+    }
+
+
+def best_of(parse, literal: str) -> float:
+    return min(repeat(lambda: parse(literal), number=1, repeat=5))
+
+
+def peak_memory(parse, literal: str) -> int:
+    tracemalloc.start()
+    parse(literal)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    print(
+        f"{'value':<8}{'items':>8}{'literal_eval':>16}{'parse_literal':>16}"
+        f"{'speedup':>10}{'peak memory':>16}"
+    )
+
+    for size in SIZES:
+        for name, literal in literals(size).items():
+            assert parse_literal(literal) == ast.literal_eval(literal)
+
+            evaluated = best_of(ast.literal_eval, literal)
+            parsed = best_of(parse_literal, literal)
+            memory = peak_memory(ast.literal_eval, literal) / peak_memory(
+                parse_literal, literal
+            )
+            print(
+                f"{name:<8}{size:>8}{evaluated * 1e3:>13.2f} ms{parsed * 1e3:>13.2f} ms"
+                f"{evaluated / parsed:>9.1f}x{memory:>15.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Compare `parse_value` against parsing every dict and list recursively into a
+copy, as it used to, on whole sections of files.
+
+    $ poetry run python benchmarks/bench_parse_tree.py
+"""
+import sys
+import tracemalloc
+from timeit import repeat
+from typing import Any
+
+from config_file.parsers.parse_value import parse_string, parse_value
+
+SECTIONS = 200
+KEYS_PER_SECTION = 20
+
+
+def recursive_parse_value(value: Any) -> Any:
+    """How `parse_value` used to parse dicts and lists."""
+    if isinstance(value, dict):
+        return {key: recursive_parse_value(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [recursive_parse_value(item) for item in value]
+
+    if isinstance(value, str):
+        return parse_string(value)
+
+    return value
+
+
+def trees() -> dict:
+    typed = [5, -5.5, True, "a string", [1, 2, 3], {"key": "value"}]
+    strings = ["5", "-5.5", "true", "a string", "[1, 2, 3]", "{'key': 'value'}"]
+
+    def tree(values: list) -> dict:
+        return {
+            f"section_{section}": {
+                f"key_{key}": values[key % len(values)]
+                for key in range(KEYS_PER_SECTION)
+            }
+            for section in range(SECTIONS)
+        }
+
+    mixed = tree(typed)
+    mixed["strings"] = tree(strings)["section_0"]
+
+    return {
+        "typed (json, yaml, toml)": tree(typed),
+        "strings (ini)": tree(strings),
+        "typed, one string section": mixed,
+    }
+
+
+def deep(depth: int) -> list:
+    value: Any = ["5"]
+    for _ in range(depth):
+        value = [value]
+    return value
+
+
+def best_of(parse, value: Any) -> float:
+    return min(repeat(lambda: parse(value), number=1, repeat=5))
+
+
+def peak_memory(parse, value: Any) -> int:
+    tracemalloc.start()
+    parse(value)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    print(
+        f"{'tree':<28}{'recursive':>12}{'parse_value':>14}{'speedup':>10}"
+        f"{'peak memory':>16}"
+    )
+
+    for name, tree in trees().items():
+        assert recursive_parse_value(tree) == parse_value(tree)
+
+        recursive = best_of(recursive_parse_value, tree)
+        iterative = best_of(parse_value, tree)
+        memory = peak_memory(recursive_parse_value, tree) / peak_memory(
+            parse_value, tree
+        )
+        print(
+            f"{name:<28}{recursive * 1e3:>9.2f} ms{iterative * 1e3:>11.2f} ms"
+            f"{recursive / iterative:>9.1f}x{memory:>15.1f}x"
+        )
+
+    depth = sys.getrecursionlimit() * 10
+    try:
+        recursive_parse_value(deep(depth))
+    except RecursionError:
+        print(f"\nrecursive parsing of {depth} nested lists: RecursionError")
+
+    iterative = best_of(parse_value, deep(depth))
+    print(f"parse_value of {depth} nested lists: {iterative * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compare `parse_value` against checking every `can_be_parsed_as_*` function in
+turn, as it used to, over a mix of values typical of INI files.
+
+    $ poetry run python benchmarks/bench_parse_value.py
+"""
+import ast
+from timeit import repeat
+from typing import Any
+
+from config_file.parsers.parse_value import (
+    can_be_parsed_as_bool,
+    can_be_parsed_as_dict,
+    can_be_parsed_as_float,
+    can_be_parsed_as_int,
+    can_be_parsed_as_list,
+    parse_value,
+    strtobool,
+)
+
+# Roughly how often each kind of value shows up in the INI files we've seen.
+VALUES = (
+    ["8080", "30", "0", "-1", "100000"] * 6
+    + ["0.5", "-2.75", ".25"] * 3
+    + ["true", "false", "True", "FALSE"] * 4
+    + ["localhost", "/var/log/app.log", "INFO", "utf-8", "postgres://db/app"] * 8
+    + ["[1, 2, 3]", "['a', 'b']", "{'retries': 3, 'backoff': 1.5}"] * 2
+    + ["", "  padded value  ", "[not a list", "{not: a dict}"]
+)
+ROUNDS = 200
+
+
+def chained_parse_value(value: Any) -> Any:
+    """How `parse_value` used to parse a value."""
+    if isinstance(value, dict):
+        return {key: chained_parse_value(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [chained_parse_value(item) for item in value]
+
+    if can_be_parsed_as_int(value):
+        return int(value.strip()) if isinstance(value, str) else int(value)
+
+    if can_be_parsed_as_float(value):
+        return float(value.strip()) if isinstance(value, str) else float(value)
+
+    if can_be_parsed_as_bool(value):
+        return bool(value) if isinstance(value, bool) else bool(strtobool(value))
+
+    if can_be_parsed_as_dict(value):
+        return chained_parse_value(ast.literal_eval(value.strip()))
+
+    if can_be_parsed_as_list(value):
+        return chained_parse_value(ast.literal_eval(value.strip()))
+
+    return value
+
+
+def main() -> None:
+    # The chain can't parse empty values, so they are left out for it.
+    chained_values = [value for value in VALUES if value]
+
+    def best_of(parse, values) -> float:
+        def run():
+            for _ in range(ROUNDS):
+                for value in values:
+                    parse(value)
+
+        return min(repeat(run, number=1, repeat=5)) / (ROUNDS * len(values))
+
+    chained = best_of(chained_parse_value, chained_values)
+    scanned = best_of(parse_value, chained_values)
+
+    assert all(
+        chained_parse_value(value) == parse_value(value) for value in chained_values
+    )
+
+    print(f"{len(VALUES)} values, microseconds per value\n")
+    print(f"{'can_be_parsed_as_* chain':<28}{chained * 1e6:>8.2f}")
+    print(f"{'parse_value':<28}{scanned * 1e6:>8.2f}")
+    print(f"{'speedup':<28}{chained / scanned:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compare cold start times of parsing a file against loading its sidecar snapshot.
+
+    $ poetry run python benchmarks/bench_sidecar.py
+"""
+import configparser
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from timeit import repeat
+
+import tomlkit
+from ruamel.yaml import YAML
+
+from config_file import ConfigFile
+
+SECTIONS = 200
+KEYS_PER_SECTION = 20
+
+
+def document() -> dict:
+    return {
+        f"section_{section}": {
+            f"key_{key}": [key, f"value {key}", key / 2, key % 2 == 0][key % 4]
+            for key in range(KEYS_PER_SECTION)
+        }
+        for section in range(SECTIONS)
+    }
+
+
+def write_files(directory: Path) -> dict:
+    contents = document()
+
+    ini = configparser.ConfigParser()
+    ini.read_dict(contents)
+    ini_buffer = StringIO()
+    ini.write(ini_buffer)
+
+    yaml_buffer = StringIO()
+    YAML().dump(contents, yaml_buffer)
+
+    files = {
+        "ini": ini_buffer.getvalue(),
+        "json": json.dumps(contents, indent=4),
+        "yaml": yaml_buffer.getvalue(),
+        "toml": tomlkit.dumps(contents),
+    }
+
+    paths = {}
+    for extension, text in files.items():
+        paths[extension] = directory / f"config.{extension}"
+        paths[extension].write_text(text)
+
+    return paths
+
+
+def best_of(statement, number: int = 5) -> float:
+    return min(repeat(statement, number=number, repeat=3)) / number
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_files(Path(directory))
+        snapshot_dir = Path(directory) / "snapshots"
+
+        print(f"{SECTIONS} sections of {KEYS_PER_SECTION} keys each\n")
+        print(f"{'format':<8}{'parse':>12}{'snapshot':>12}{'speedup':>10}")
+
+        for extension, path in paths.items():
+            ConfigFile(path, sidecar=snapshot_dir)
+
+            parse = best_of(lambda: ConfigFile(path))
+            snapshot = best_of(lambda: ConfigFile(path, sidecar=snapshot_dir))
+
+            print(
+                f"{extension:<8}{parse * 1000:>10.2f}ms{snapshot * 1000:>10.2f}ms"
+                f"{parse / snapshot:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Compare converting every value of an INI file once at load, with `typed=True`,
+against parsing the values on every `get(parse_types=True)`.
+
+    $ poetry run python benchmarks/bench_typed.py
+"""
+import configparser
+import tempfile
+from pathlib import Path
+from timeit import repeat
+
+from config_file import ConfigFile
+
+SECTIONS = 200
+KEYS_PER_SECTION = 20
+
+
+def write_file(directory: Path) -> Path:
+    values = ["5", "-5.5", "true", "a string", "[1, 2, 3]", "{'key': 'value'}"]
+    parser = configparser.ConfigParser()
+    parser.read_dict(
+        {
+            f"section_{section}": {
+                f"key_{key}": values[key % len(values)]
+                for key in range(KEYS_PER_SECTION)
+            }
+            for section in range(SECTIONS)
+        }
+    )
+
+    path = directory / "typed.ini"
+    with path.open("w") as file:
+        parser.write(file)
+
+    return path
+
+
+def best_of(statement) -> float:
+    return min(repeat(statement, number=1, repeat=5))
+
+
+def report(label: str, seconds: float) -> None:
+    print(f"{label:<48}{seconds * 1e3:>10.2f} ms")
+
+
+def main() -> None:
+    keys = [
+        f"section_{section}.key_{key}"
+        for section in range(SECTIONS)
+        for key in range(KEYS_PER_SECTION)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_file(Path(directory))
+
+        def load_and_read(typed: bool, parse_types: bool) -> None:
+            config = ConfigFile(path, typed=typed)
+            for key in keys:
+                config.get(key, parse_types=parse_types)
+
+        def read_again(config: ConfigFile, parse_types: bool) -> float:
+            return best_of(
+                lambda: [config.get(key, parse_types=parse_types) for key in keys]
+            )
+
+        load = best_of(lambda: ConfigFile(path))
+        typed_load = best_of(lambda: ConfigFile(path, typed=True))
+
+        print(f"{SECTIONS} sections of {KEYS_PER_SECTION} keys\n")
+        report("load", load)
+        report("load with typed=True", typed_load)
+        report("  one-time conversion", typed_load - load)
+        print()
+        report(
+            "load, get(parse_types=True) every key",
+            best_of(lambda: load_and_read(False, True)),
+        )
+        report(
+            "load with typed=True, get() every key",
+            best_of(lambda: load_and_read(True, False)),
+        )
+        print()
+        report(
+            "get(parse_types=True) every key again, cached",
+            read_again(ConfigFile(path), True),
+        )
+        report(
+            "get() every key again with typed=True",
+            read_again(ConfigFile(path, typed=True), False),
+        )
+
+
+if __name__ == "__main__":
+    main()
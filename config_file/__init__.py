@@ -1,6 +1,16 @@
 from .config_file import ConfigFile
-from .exceptions import ParsingError
+from .exceptions import MissingKeysError, ParsingError
+from .frozen import FrozenConfig
+from .key_path import KeyPath
+from .layered import LayeredConfig
 
 __version__ = "0.13.1"
 
-__all__ = ["ConfigFile", "ParsingError"]
+__all__ = [
+    "ConfigFile",
+    "FrozenConfig",
+    "KeyPath",
+    "LayeredConfig",
+    "MissingKeysError",
+    "ParsingError",
+]
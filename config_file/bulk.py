@@ -0,0 +1,59 @@
+"""Helpers for loading many configuration files at once."""
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from config_file.config_file_path import ConfigFilePath
+from config_file.exceptions import ParsingError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from config_file.config_file import ConfigFile
+
+
+class LoadManyResult(NamedTuple):
+    """
+    The outcome of `ConfigFile.load_many`.
+
+    Attributes:
+        configs: A ConfigFile for every path, in the order the paths were
+            given, or None for the paths that could not be loaded.
+        errors: The error raised while loading a path, keyed by the index
+            of the path.
+        elapsed: How long, in seconds, loading all the files took.
+    """
+
+    configs: List[Optional["ConfigFile"]]
+    errors: Dict[int, Exception]
+    elapsed: float
+
+    @property
+    def files_per_second(self) -> float:
+        """The throughput of loading the files."""
+        return len(self.configs) / self.elapsed if self.elapsed else 0.0
+
+
+def parse_file(path: str) -> Union[Tuple[str, dict, float], Exception]:
+    """
+    Read and parse a single file, for use in a worker thread or process.
+
+    Errors are returned instead of raised so one file failing does not
+    affect the others in the same chunk of work.
+
+    Args:
+        path: The path of the file to parse.
+
+    Returns:
+        The contents of the file, the parsed contents, and how long it
+        took to parse them, or the error that occurred.
+    """
+    started = perf_counter()
+
+    try:
+        parser = ConfigFilePath(path).validate().parser
+    except ParsingError as error:
+        # The wrapped decode errors of the parsing libraries do not
+        # all survive being pickled back from a worker process.
+        return ParsingError(str(error))
+    except Exception as error:
+        return error
+
+    return parser.file_contents, parser.parsed_content, perf_counter() - started
@@ -0,0 +1,124 @@
+"""A process-wide cache of parsed configuration files."""
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, NamedTuple, Optional
+
+from config_file.config_file_path import ConfigFilePath
+from config_file.parsers.abstract_parser import AbstractParser
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ParsedDocumentCache:
+    """
+    A bounded, least recently used cache of parsed files.
+
+    Entries are keyed by the parser used and the file's fingerprint
+    (device, inode, modification time, and size), so an entry is
+    only reused while the file on disk is unchanged. A file rewritten
+    with the same size within the resolution of the filesystem's
+    modification times can not be told apart from the cached one.
+
+    Every parser handed out shares the cached parsed content and
+    only copies it the first time it is modified, so one parser's
+    changes are never seen by another.
+
+    Args:
+        maxsize: The maximum amount of parsed files to keep.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.__maxsize = maxsize
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock = Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        with self.__lock:
+            self.__maxsize = maxsize
+            self.__evict()
+
+    def load(
+        self,
+        path: ConfigFilePath,
+        loader: Optional[Callable[[ConfigFilePath], AbstractParser]] = None,
+    ) -> AbstractParser:
+        """
+        Retrieve a parser for the file at path, parsing the file
+        only if it is not already cached.
+
+        Args:
+            path: The path of the file to parse.
+            loader: How to read and parse the file if it is not cached.
+                Defaults to parsing the file with its parser class.
+
+        Raises:
+            FileNotFoundError: If the path does not exist.
+            ValueError: If the extension of the file is not recognized.
+            ParsingError: If the file could not be parsed.
+
+        Returns:
+            A parser for the file, sharing its parsed content with the cache.
+        """
+        parser_class = path.parser_class
+        key = (parser_class, path.fingerprint())
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+            else:
+                self.__misses += 1
+
+        if entry is None:
+            parser = loader(path) if loader else parser_class(path.contents)
+            entry = (parser.file_contents, parser.parsed_content)
+
+            # Only cache what was read if the file did not change while
+            # reading it, otherwise the fingerprint may not match the contents.
+            if path.fingerprint() == key[1]:
+                with self.__lock:
+                    self.__entries[key] = entry
+                    self.__evict()
+
+        return parser_class.from_parsed_content(*entry)
+
+    def info(self) -> CacheInfo:
+        """Report the statistics of the cache."""
+        with self.__lock:
+            return CacheInfo(
+                self.__hits,
+                self.__misses,
+                self.__evictions,
+                self.__maxsize,
+                len(self.__entries),
+            )
+
+    def clear(self) -> None:
+        """Remove every entry from the cache and reset its statistics."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = self.__misses = self.__evictions = 0
+
+    def __evict(self) -> None:
+        while len(self.__entries) > self.__maxsize:
+            self.__entries.popitem(last=False)
+            self.__evictions += 1
+
+
+# The cache shared by every ConfigFile created with `cache=True`.
+document_cache = ParsedDocumentCache()
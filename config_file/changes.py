@@ -0,0 +1,78 @@
+"""
+Tries of changes to apply to parsed content all at once.
+
+A trie of changes maps the name of every key that changes to the
+node of its own changes. A node's SET entry sets the key to its
+value, and a DELETE entry deletes the key, before the changes of
+the keys inside of it are applied. e.g. deleting `section` and then
+setting `section.key` to 5 is:
+
+    {"section": {DELETE: True, "key": {SET: 5}}}
+"""
+from collections import abc
+from contextlib import suppress
+from typing import Any, Iterable
+
+SET: Any = object()
+DELETE: Any = object()
+
+
+def trie_node(trie: dict, keys: Iterable[Any]) -> dict:
+    """Find the node of a trie for the given key, adding it if needed."""
+    node = trie
+    for key in keys:
+        node = node.setdefault(key, {})
+
+    return node
+
+
+def has_nested_changes(node: dict) -> bool:
+    """Whether keys inside of the key of the node change."""
+    return len(node) > (SET in node) + (DELETE in node)
+
+
+def check_changes(content: Any, changes: dict) -> None:
+    """
+    Raise the error applying a trie of changes to content would raise,
+    without changing content, so that none of the changes are applied
+    unless all of them can be.
+
+    Only the sections and lists that change are copied, and only
+    shallowly, so that deleting items from lists moves the items after
+    them like applying the changes does.
+
+    Args:
+        content: The parsed content the changes would be applied to.
+        changes: The changes to check.
+
+    Raises:
+        IndexError: If a key is set past the end of a list.
+        TypeError: If a key is set in a value that is neither a section
+            nor a list, or in a list with a key that is not an index.
+    """
+    nodes = [(content, changes)]
+    while nodes:
+        section, node = nodes.pop()
+        if isinstance(section, abc.MutableMapping):
+            section = dict(section)
+        elif isinstance(section, abc.MutableSequence):
+            section = list(section)
+
+        for name, child in node.items():
+            if name is SET or name is DELETE:
+                continue
+
+            if DELETE in child:
+                with suppress(KeyError, IndexError):
+                    del section[name]
+
+            if SET in child:
+                section[name] = child[SET]
+
+            if has_nested_changes(child):
+                try:
+                    value = section[name]
+                except KeyError:
+                    section[name] = value = {}
+
+                nodes.append((value, child))
@@ -1,14 +1,50 @@
+import asyncio
+import copy
+import os
+from collections import abc
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from shutil import copyfile
-from typing import Any, Union
-
+from time import perf_counter, time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from config_file.bulk import LoadManyResult, parse_file
+from config_file.cache import document_cache
 from config_file.config_file_path import ConfigFilePath
+from config_file.exceptions import MissingKeysError
+from config_file.frozen import FrozenConfig
+from config_file.key_path import Key, KeyPath, to_key_path
+from config_file.parsers.abstract_parser import AbstractParser
 from config_file.parsers.parse_value import parse_value
+from config_file.sidecar import load_parser
+from config_file.transaction import Transaction
+from config_file.typed_values import TypedCacheInfo, TypedValueCache
 from config_file.utils import Default
+from config_file.watcher import ConfigWatcher, default_watcher
 
 
 class ConfigFile:
-    def __init__(self, file_path: Union[str, Path]) -> None:
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        lazy: bool = False,
+        cache: bool = False,
+        sidecar: Union[bool, str, Path] = False,
+        index: bool = False,
+        typed: bool = False,
+    ) -> None:
         """
         Stores the config file path and expands it if needed, reads in
         the file contents, and determines what parser should be used for
@@ -16,6 +52,35 @@ class ConfigFile:
 
         Args:
             file_path: The path to your configuration file.
+            lazy: Defer reading and parsing the file until the first time
+                  its contents are needed (e.g. the first `get`, `has`, or
+                  index into the ConfigFile). Construction then only
+                  validates the path with a single stat call.
+
+                  Since parsing is deferred, a ParsingError or ValueError
+                  for an unsupported extension is raised on first access
+                  instead of from the constructor.
+            cache: Share the parsed file with every other ConfigFile created
+                   with `cache=True` for the same, unchanged, file in this
+                   process. Only the first one reads and parses the file;
+                   the parsed contents are copied the first time a ConfigFile
+                   modifies them or hands out one of their sections or lists.
+                   See `config_file.cache.document_cache`.
+            sidecar: Keep a snapshot of the parsed file on disk and load that
+                     instead of parsing the file again while the contents of
+                     the file are unchanged. True stores the snapshot as a
+                     hidden file next to the file, or a directory can be given
+                     to store snapshots in. Snapshots are pickles, so only use
+                     locations that no one else can write to.
+            index: Keep an index of every key by its full path, making `get`
+                   and `has` a single dictionary lookup however deeply the key
+                   is nested. The index is built on the first lookup and takes
+                   memory proportional to the amount of keys in the file.
+            typed: Parse the values of every key into their native types once,
+                   right after parsing the file, as `get(parse_types=True)`
+                   would, so a plain `get` returns them. Saving the file
+                   writes them back the way they were read. Only INI files
+                   are converted, the other formats already have native types.
 
         Raises:
             ValueError: If the specified file path does not have an extension
@@ -24,7 +89,190 @@ class ConfigFile:
             ParsingError: If the file_path could not be parsed.
         """
         self.__path = ConfigFilePath(file_path).validate()
-        self.__parser = self.__path.parser
+        self.__cache = cache
+        self.__sidecar = sidecar
+        self.__index = index
+        self.__typed = typed
+        self.__loaded_parser: Optional[AbstractParser] = None
+        self.__parsed_at: Optional[float] = None
+        self.__parse_duration: Optional[float] = None
+        self.__saved_fingerprint: Optional[Tuple[int, int, int, int]] = None
+        self.__typed_values = TypedValueCache()
+
+        if not lazy:
+            self.__load()
+
+    @property
+    def __parser(self) -> AbstractParser:
+        if self.__loaded_parser is None:
+            self.__load()
+
+        # __load always leaves a parser behind, or raises.
+        assert self.__loaded_parser is not None
+        return self.__loaded_parser
+
+    def __load(self) -> None:
+        """
+        Read and parse the file, recording when it happened and how long
+        it took. If the file has already been parsed, the existing parser
+        is reset to the current contents of the file instead.
+        """
+        started = perf_counter()
+
+        if self.__loaded_parser is None:
+            self.__loaded_parser = self.__parse()
+        else:
+            self.__loaded_parser.reset_internal_contents(self.__path.contents)
+
+        self.__parse_duration = perf_counter() - started
+        self.__parsed_at = time()
+
+    def __parse(self) -> AbstractParser:
+        """Create a parser for the file, as configured in the constructor."""
+        if self.__cache:
+            parser = document_cache.load(self.__path, self.__read)
+        else:
+            parser = self.__read(self.__path)
+
+        if self.__index:
+            parser.use_index()
+        if self.__typed:
+            parser.use_types()
+
+        return parser
+
+    def __timed_parse(self) -> Tuple[AbstractParser, float]:
+        started = perf_counter()
+        return self.__parse(), perf_counter() - started
+
+    def __adopt(self, parser: AbstractParser, parse_duration: float) -> None:
+        """Use a parser for the file that was created elsewhere."""
+        self.__loaded_parser = parser
+        self.__parse_duration = parse_duration
+        self.__parsed_at = time()
+
+    @classmethod
+    def load_many(
+        cls,
+        paths: Iterable[Union[str, Path]],
+        executor: Union[str, Executor, None] = "process",
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> LoadManyResult:
+        """
+        Load many configuration files in parallel.
+
+        Parsing YAML and TOML is CPU bound, so by default the files are
+        parsed in a pool of processes and the parsed contents are sent
+        back instead of parsing the files again. With the default
+        multiprocessing start method on Windows and macOS, this needs to
+        be called from under an `if __name__ == "__main__":` guard.
+
+        Errors loading a file do not stop the others from being loaded.
+        They are collected in the result instead of being raised.
+
+        Args:
+            paths: The paths of the configuration files.
+            executor: "process" to parse in a process pool, "thread" to
+                parse in a thread pool, None to parse one file at a time
+                in the current thread, or an existing Executor to use.
+            max_workers: The amount of workers for a process or thread pool.
+                Defaults to the pool's default.
+            chunksize: How many files to send to a worker process at a time.
+                Larger chunks lower the overhead of many small files. Defaults
+                to splitting the files into four chunks per worker.
+
+        Raises:
+            ValueError: If the executor is not recognized.
+
+        Returns:
+            The loaded ConfigFiles, in the same order as paths, the errors
+            that occurred, and the throughput.
+        """
+        started = perf_counter()
+        paths = list(paths)
+
+        if chunksize is None:
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(paths) // (workers * 4))
+
+        if executor is None:
+            results = list(map(parse_file, map(str, paths)))
+        elif isinstance(executor, Executor):
+            results = list(
+                executor.map(parse_file, map(str, paths), chunksize=chunksize)
+            )
+        elif executor in ("process", "thread"):
+            pool_class = (
+                ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+            )
+            with pool_class(max_workers) as pool:
+                results = list(
+                    pool.map(parse_file, map(str, paths), chunksize=chunksize)
+                )
+        else:
+            raise ValueError(f"Unrecognized executor `{executor}` to load files with.")
+
+        configs: List[Optional[ConfigFile]] = []
+        errors: Dict[int, Exception] = {}
+        for index, (path, result) in enumerate(zip(paths, results)):
+            if isinstance(result, Exception):
+                errors[index] = result
+                configs.append(None)
+                continue
+
+            file_contents, parsed_content, parse_duration = result
+            try:
+                config = cls(path, lazy=True)
+            except Exception as error:
+                # The file was removed or replaced since it was parsed.
+                errors[index] = error
+                configs.append(None)
+                continue
+
+            parser = config.__path.parser_class.from_parsed_content(
+                file_contents, parsed_content, shared=False
+            )
+            config.__adopt(parser, parse_duration)
+            configs.append(config)
+
+        return LoadManyResult(configs, errors, perf_counter() - started)
+
+    def __read(self, path: ConfigFilePath) -> AbstractParser:
+        if self.__sidecar is False:
+            return path.parser
+
+        snapshot_dir = None if self.__sidecar is True else self.__sidecar
+        return load_parser(path, snapshot_dir)
+
+    @property
+    def is_parsed(self) -> bool:
+        """Whether the file has been read and parsed yet."""
+        return self.__loaded_parser is not None
+
+    @property
+    def parsed_at(self) -> Optional[float]:
+        """
+        When the file was last parsed, in seconds since the epoch,
+        or None if it has not been parsed yet.
+        """
+        return self.__parsed_at
+
+    @property
+    def parse_duration(self) -> Optional[float]:
+        """
+        How long, in seconds, it took to read and parse the file the
+        last time it was parsed, or None if it has not been parsed yet.
+        """
+        return self.__parse_duration
+
+    @property
+    def saved_fingerprint(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        The fingerprint of the file, see `ConfigFilePath.fingerprint`,
+        right after this ConfigFile last wrote it, or None if it has not.
+        """
+        return self.__saved_fingerprint
 
     @property
     def path(self) -> Path:
@@ -34,14 +282,53 @@ class ConfigFile:
     def original_path(self) -> Path:
         return Path(self.__path.original_path)
 
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Whether there may be changes that have not been saved yet.
+
+        Once a section or list has been retrieved through the array
+        notation, e.g. `config['section']`, or `get()`, it can be modified
+        without the ConfigFile knowing. From then on, the whole file is
+        stringified to tell whether it changed since it was read or last
+        saved. Use `peek()` to retrieve them only to read them, or
+        `reload()` to keep track of changes again.
+        """
+        if not self.is_parsed or not self.__parser.is_dirty:
+            return False
+
+        # Without a version, the file may have been modified through what
+        # was handed out, which only shows in what it stringifies to.
+        return (
+            self.__parser.version is not None
+            or str(self) != self.__parser.file_contents
+        )
+
+    @property
+    def version(self) -> Optional[int]:
+        """
+        A number that changes whenever the file is modified or reloaded,
+        which can be used to tell whether anything derived from it is
+        out of date.
+
+        Once a section or list has been retrieved through the array
+        notation or `get()`, the file can be modified without the
+        ConfigFile knowing, so it has no version anymore and this is None.
+        """
+        return self.__parser.version
+
     def __getitem__(self, key: str) -> Any:
-        return self.__parser.parsed_content[key]
+        return self.__parser[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
-        self.__parser.parsed_content[key] = value
+        version = self.__parser.version
+        self.__parser[key] = value
+        self.__changed([KeyPath((key,))], version)
 
     def __delitem__(self, key: str) -> None:
-        del self.__parser.parsed_content[key]
+        version = self.__parser.version
+        del self.__parser[key]
+        self.__changed([KeyPath((key,))], version)
 
     def __contains__(self, key: str) -> bool:
         return self.has(key)
@@ -54,7 +341,7 @@ class ConfigFile:
 
     def get(
         self,
-        key: str,
+        key: Key,
         parse_types: bool = False,
         return_type: Any = None,
         default: Any = Default(None),
@@ -62,6 +349,11 @@ class ConfigFile:
         """
         Retrieve the value of a key.
 
+        Sections and lists are returned as-is rather than copied, so
+        modifying them modifies the file, which is always considered
+        dirty from then on, see `is_dirty`. Use `set()` or `delete()` to
+        modify the file in a way that it can keep track of.
+
         Args:
             key: The key to retrieve.
             parse_types: Automatically parse ints, floats, booleans, dicts, and
@@ -71,6 +363,11 @@ class ConfigFile:
                          e.g. If you are retrieving a section, all values in that
                          section will be parsed.
 
+                         The parsed value is cached until the key, a section
+                         leading to it, or a key inside of it is changed.
+                         Dicts and lists are returned as copies of it, so
+                         modifying them changes neither the cache nor the file.
+
             return_type: The type to coerce the return value to.
             default: The default value to return if the value of the key is empty.
 
@@ -82,19 +379,133 @@ class ConfigFile:
             ValueError: If the value is not able to be coerced into return_type.
         """
         try:
-            key_value = self.__parser.get(key)
+            if parse_types:
+                key_value = self.__typed_value(key, self.__parser.peek)
+            else:
+                key_value = self.__parser.get(key)
         except KeyError as error:
             if isinstance(default, Default) and default.value is None:
                 raise error
             else:
-                key_value = default
-
-        if parse_types:
-            key_value = parse_value(key_value)
+                key_value = parse_value(default) if parse_types else default
 
         return return_type(key_value) if return_type else key_value
 
-    def set(self, key: str, value: Any) -> None:
+    def peek(self, key: Key, default: Any = Default(None)) -> Any:
+        """
+        Retrieve the value of a key only to read it.
+
+        Unlike with `get()`, the file does not consider itself dirty
+        after handing out a section or list, so they must not be modified.
+
+        Args:
+            key: The key to retrieve.
+            default: The value to return if the key does not exist.
+
+        Returns:
+            The value of the key.
+
+        Raises:
+            KeyError: If the key does not exist and no default was given.
+        """
+        try:
+            return self.__parser.peek(key)
+        except KeyError:
+            if isinstance(default, Default) and default.value is None:
+                raise
+
+            return default
+
+    def __typed_value(self, key: Key, retrieve: Callable[[Key], Any]) -> Any:
+        """
+        Retrieve the parsed value of a key from the cache of typed values,
+        parsing the value retrieve returns for it if it is not cached.
+
+        The cached value can be shared with the file, or with earlier
+        calls, so dicts and lists are handed out as copies of it.
+        """
+        value = self.__typed_values.get(
+            to_key_path(key),
+            self.__parser.version,
+            lambda: parse_value(retrieve(key)),
+        )
+        if isinstance(value, (abc.MutableMapping, abc.MutableSequence)):
+            return copy.deepcopy(value)
+
+        return value
+
+    def __changed(self, keys: Iterable[Key], version: Optional[int]) -> None:
+        """
+        Forget the typed values that changing keys affected.
+
+        Args:
+            keys: The keys that were set or deleted.
+            version: The version of the file before they were.
+        """
+        self.__typed_values.invalidate(
+            [to_key_path(key) for key in keys], version, self.__parser.version
+        )
+
+    def typed_cache_info(self) -> TypedCacheInfo:
+        """Report the statistics of the cache of `get(parse_types=True)`."""
+        return self.__typed_values.info()
+
+    def get_many(
+        self,
+        keys: Iterable[Key],
+        parse_types: bool = False,
+        return_type: Any = None,
+        default: Any = Default(None),
+    ) -> Dict[Key, Any]:
+        """
+        Retrieve the values of many keys at once.
+
+        Keys that share sections are retrieved together, so each
+        section is only looked up once. Every missing key is reported
+        at the same time rather than failing on the first one.
+
+        Args:
+            keys: The keys to retrieve.
+            parse_types: Automatically parse ints, floats, booleans, dicts,
+                         and lists, as with `get()`.
+            return_type: The type to coerce every value to.
+            default: The default value to use for every key that does not exist.
+
+        Returns:
+            The value of every key, in the order of keys.
+
+        Raises:
+            MissingKeysError: If keys do not exist and no default was given.
+                              It holds the missing keys and the values of
+                              the ones that exist.
+            ValueError: If a value is not able to be coerced into return_type.
+        """
+        keys = list(keys)
+        # Typed values are copied before they are handed out.
+        values = (self.__parser.peek_many if parse_types else self.__parser.get_many)(
+            keys
+        )
+
+        missing = [key for key in keys if key not in values]
+        if missing and isinstance(default, Default) and default.value is None:
+            raise MissingKeysError(
+                missing, self.__parser.get_many(keys) if parse_types else values
+            )
+
+        result = {}
+        for key in keys:
+            if parse_types and key in values:
+                value = self.__typed_value(key, values.__getitem__)
+            elif parse_types:
+                value = parse_value(default)
+            else:
+                value = values.get(key, default)
+
+            result[key] = return_type(value) if return_type else value
+
+        return result
+
+    def set(self, key: Key, value: Any) -> None:
         """Sets the value of a key.
 
         If the given key does not exist, it will be automatically
@@ -111,9 +522,62 @@ class ConfigFile:
             key: The section, sub-section, or key to delete.
             value: The value to set the key to.
         """
+        version = self.__parser.version
         self.__parser.set(key, value)
+        self.__changed([key], version)
+
+    def set_many(self, values: Mapping[Key, Any]) -> None:
+        """
+        Set the values of many keys at once.
+
+        Keys that share sections are set together, so each section
+        is only looked up once. Missing keys and sections are created
+        as with `set()`, and a section is set before the keys inside
+        of it. If one of the keys can not be set, none of them are.
+
+        Args:
+            values: The value to set every key to.
+
+        Raises:
+            IndexError: If a key is set past the end of a list.
+            TypeError: If a key is set in a value that is neither
+                a section nor a list.
+        """
+        version = self.__parser.version
+        self.__parser.set_many(values)
+        self.__changed(values, version)
 
-    def delete(self, key: str) -> None:
+    @contextmanager
+    def transaction(self, save: bool = False) -> Iterator[Transaction]:
+        """
+        Make changes that are either all applied or not at all.
+
+        Changes made through the transaction are kept to the side and
+        applied in a single pass once the with block is exited. If an
+        error is raised in the with block, or one of the changes can not
+        be applied once it is exited, they are all discarded instead and
+        the ConfigFile is left untouched.
+
+        e.g.
+            with config.transaction(save=True) as transaction:
+                transaction.set("section.key", 5)
+                transaction.delete("other_section")
+
+        Args:
+            save: Save the ConfigFile after applying the changes.
+
+        Returns:
+            The transaction to make the changes through. It can also
+            retrieve keys as they are with the changes made so far.
+        """
+        transaction = Transaction(self.__parser)
+        yield transaction
+        transaction.commit()
+
+        if save:
+            self.save()
+
+    def delete(self, key: Key) -> None:
         """Deletes a section or key.
 
         Args:
@@ -123,9 +587,11 @@ class ConfigFile:
             KeyError: If a key is attempted to be deleted that
             does not exist.
         """
+        version = self.__parser.version
         self.__parser.delete(key)
+        self.__changed([key], version)
 
-    def has(self, key: str, wild: bool = False) -> bool:
+    def has(self, key: Key, wild: bool = False) -> bool:
         """
         Check if a section, sub-section, or key exists.
 
@@ -148,6 +614,43 @@ class ConfigFile:
         """
         return self.__parser.has(key, wild=wild)
 
+    def find(self, name: Any) -> List[KeyPath]:
+        """
+        Find every key with the given name, however deeply it is nested.
+
+        Searching the file with this, or more than once with `has(wild=True)`,
+        indexes every key by its name so that later searches don't have to
+        go through the whole file again.
+
+        Args:
+            name: The name of the keys to find.
+
+        Returns:
+            The path to every key with the name. Sections inside of lists
+            are included, with their index in the list as part of the path.
+        """
+        return self.__parser.find(name)
+
+    def snapshot(self) -> FrozenConfig:
+        """
+        Take a read-only view of the file as it is now, which later
+        changes to the file do not show up in.
+
+        Taking a snapshot does not copy the file. The snapshot shares
+        every section with the file until the section is modified, which
+        copies it and the sections leading to it first. So a snapshot can
+        be read from other threads, without locking, while this one keeps
+        modifying the file. Take the snapshots in the thread modifying the
+        file, and hand them to the others, e.g. by assigning the latest
+        one to an attribute they read it from.
+
+        Snapshots are hashable, and compare equal when their contents do.
+
+        Returns:
+            The snapshot of the file.
+        """
+        return self.__parser.snapshot()
+
     def restore_original(self, original_path: Union[str, Path, None] = None) -> None:
         """Restores the original the configuration file.
 
@@ -175,7 +678,140 @@ class ConfigFile:
 
         self.__path.unlink()
         copyfile(original_path, self.__path)
-        self.__parser.reset_internal_contents(self.__path.contents)
+
+        if self.is_parsed:
+            self.__load()
+
+    def reload(self) -> None:
+        """
+        Read and parse the file again, discarding any unsaved changes.
+
+        Raises:
+            ParsingError: If the file could not be parsed.
+        """
+        self.__load()
+
+    def watch(
+        self,
+        callback: Callable[["ConfigFile"], None],
+        watcher: Optional[ConfigWatcher] = None,
+    ) -> None:
+        """
+        Reload this ConfigFile whenever its file changes on disk and
+        call callback with it afterwards.
+
+        See `config_file.watcher.ConfigWatcher` for how changes are
+        detected, and which thread reloads the ConfigFile and calls callback.
+
+        Args:
+            callback: The function to call with this ConfigFile after reloading.
+            watcher: The watcher to use. Defaults to a shared watcher that
+                polls every second in a background thread.
+        """
+        (watcher or default_watcher()).watch(self, callback)
+
+    def unwatch(
+        self,
+        callback: Optional[Callable[["ConfigFile"], None]] = None,
+        watcher: Optional[ConfigWatcher] = None,
+    ) -> None:
+        """
+        Stop calling callback when the file changes.
+
+        Args:
+            callback: The callback to remove. Defaults to all of them.
+            watcher: The watcher the callback was registered with.
+        """
+        (watcher or default_watcher()).unwatch(self, callback)
+
+    async def aload(self, executor: Optional[Executor] = None) -> "ConfigFile":
+        """
+        Read and parse the file in an executor, without blocking the
+        event loop, discarding any unsaved changes.
+
+        Concurrent calls for the same file, from ConfigFiles created
+        with the same `cache`, `sidecar`, and `index` options, share a single
+        read and parse. Each ConfigFile still gets its own copy of the
+        parsed file, only copied when it is first modified.
+
+        Args:
+            executor: The executor to run in. Defaults to the event
+                loop's default executor.
+
+        Raises:
+            ValueError: If the extension of the file is not recognized.
+            ParsingError: If the file could not be parsed.
+
+        Returns:
+            This ConfigFile, so it can be awaited on creation, like
+            `config = await ConfigFile(path, lazy=True).aload()`.
+        """
+        loop = asyncio.get_event_loop()
+        key = (
+            loop,
+            str(self.__path),
+            self.__cache,
+            self.__sidecar,
+            self.__index,
+            self.__typed,
+        )
+
+        load = _in_flight_loads.get(key)
+        if load is None:
+            load = _in_flight_loads[key] = _InFlightLoad(
+                loop.run_in_executor(executor, self.__timed_parse)
+            )
+            load.future.add_done_callback(lambda _: _in_flight_loads.pop(key, None))
+
+        load.waiters += 1
+        # Shielded so one caller being cancelled does not cancel the others.
+        parser, parse_duration = await asyncio.shield(load.future)
+
+        self.__adopt(copy.copy(parser) if load.waiters > 1 else parser, parse_duration)
+        return self
+
+    async def asave(self, executor: Optional[Executor] = None) -> None:
+        """
+        Save your configuration changes, like `save()`, but stringify
+        and write the file in an executor, without blocking the event loop.
+
+        The ConfigFile must not be modified until saving is done.
+
+        Args:
+            executor: The executor to run in. Defaults to the event
+                loop's default executor.
+        """
+        if not self.is_parsed or not self.__parser.is_dirty:
+            return
+
+        loop = asyncio.get_event_loop()
+        file_contents = await loop.run_in_executor(executor, self.__write)
+        self.__parser.mark_clean(file_contents)
+
+    async def __aenter__(self) -> "ConfigFile":
+        """Load the file, if it is not already, without blocking."""
+        if not self.is_parsed:
+            await self.aload()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Save any changes, without blocking, unless an error was raised."""
+        if exc_type is None:
+            await self.asave()
+
+    def __write(self) -> str:
+        file_contents = str(self)
+        # A file that was modified without it knowing, see `is_dirty`, or
+        # whose changes undid each other, is written the same as it was.
+        if file_contents == self.__parser.file_contents:
+            return file_contents
+
+        with open(str(self.__path), "w") as config_file:
+            config_file.write(file_contents)
+
+        self.__saved_fingerprint = self.__path.fingerprint()
+        return file_contents
 
     def save(self) -> None:
         """
@@ -184,6 +820,25 @@ class ConfigFile:
         This writes the file back out, including any changes
         you've made, to the specified path given from this
         object's constructor.
+
+        Nothing is done if there are no changes to save, and the file
+        is not written if it would be written the same as it was read
+        or last saved.
         """
-        with open(str(self.__path), "w") as config_file:
-            config_file.write(str(self))
+        if not self.is_parsed or not self.__parser.is_dirty:
+            return
+
+        self.__parser.mark_clean(self.__write())
+
+
+class _InFlightLoad:
+    """A read and parse of a file that coroutines are waiting on."""
+
+    def __init__(self, future: "asyncio.Future") -> None:
+        self.future = future
+        self.waiters = 0
+
+
+# The loads started by `ConfigFile.aload` that have not finished yet,
+# keyed by event loop, path, and the options that change how it is loaded.
+_in_flight_loads: Dict[tuple, _InFlightLoad] = {}
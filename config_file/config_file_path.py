@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
-from typing import Type
+from stat import S_ISDIR
+from typing import Tuple, Type
 
 from config_file.parsers.abstract_parser import AbstractParser
 from config_file.parsers.ini_parser import IniParser
@@ -47,15 +48,14 @@ class ConfigFilePath(type(Path())):
         return extension[1:]
 
     @property
-    def parser(self) -> Type[AbstractParser]:
-        """Determine what parser should be used for this file.
+    def parser_class(self) -> Type[AbstractParser]:
+        """Determine what parser class should be used for this file.
 
         Raises:
             ValueError: If the extension of the file is not recognized.
-            ParsingError: If the contents could not be parsed.
 
         Returns:
-            The instantiated parser that should be used for this file.
+            The parser class that should be used for this file.
         """
         if self.extension == "":
             raise ValueError(
@@ -64,18 +64,31 @@ class ConfigFilePath(type(Path())):
             )
 
         if self.extension == "ini":
-            return IniParser(self.contents)
+            return IniParser
         elif self.extension == "json":
-            return JsonParser(self.contents)
+            return JsonParser
         elif self.extension == "yaml" or self.extension == "yml":
-            return YamlParser(self.contents)
+            return YamlParser
         elif self.extension == "toml":
-            return TomlParser(self.contents)
+            return TomlParser
         else:
             raise ValueError(
                 f"File path at `{self}` contains an unrecognized file type."
             )
 
+    @property
+    def parser(self) -> AbstractParser:
+        """Determine what parser should be used for this file.
+
+        Raises:
+            ValueError: If the extension of the file is not recognized.
+            ParsingError: If the contents could not be parsed.
+
+        Returns:
+            The instantiated parser that should be used for this file.
+        """
+        return self.parser_class(self.contents)
+
     @property
     def contents(self) -> str:
         """Retrieve the contents of the file.
@@ -86,10 +99,28 @@ class ConfigFilePath(type(Path())):
         with open(self, "r") as file:
             return file.read()
 
+    def fingerprint(self) -> Tuple[int, int, int, int]:
+        """Stat the file and summarize its identity and state.
+
+        Two fingerprints of the same path are equal as long as the
+        file has not been replaced, modified, or resized in between.
+
+        Raises:
+            FileNotFoundError: If the path does not exist.
+
+        Returns:
+            The device, inode, modification time in nanoseconds,
+            and size of the file.
+        """
+        stat = self.stat()
+        return stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
     def validate(self) -> "ConfigFilePath":
         """Validates that the current path exists, is a directory,
         and expands any home tidles.
 
+        This is done with a single stat call on the path.
+
         Raises:
             FileNotFoundError: If the path does not exist.
             ValueError: If the path leads to a directory.
@@ -100,12 +131,14 @@ class ConfigFilePath(type(Path())):
         if len(self.parts) >= 1 and self.parts[0] == "~":
             self = ConfigFilePath(self.expanduser())
 
-        if not self.exists():
+        try:
+            mode = self.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError):
             raise FileNotFoundError(
                 f"The specified config file ({self}) does not exist."
-            )
+            ) from None
 
-        if self.is_dir():
+        if S_ISDIR(mode):
             raise ValueError(f"The specified config file ({self}) is a directory")
 
         return self
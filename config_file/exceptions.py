@@ -7,3 +7,22 @@ class ParsingError(ValueError):
     it for the package to only raise a ParsingError
     if a error occurs in those instances.
     """
+
+
+class MissingKeysError(KeyError):
+    """
+    Some of the keys retrieved at once do not exist.
+
+    Args:
+        keys: The keys that do not exist.
+        found: The values of the keys that do exist.
+    """
+
+    def __init__(self, keys: list, found: dict) -> None:
+        super().__init__(keys)
+        self.keys = keys
+        self.found = found
+
+    def __str__(self) -> str:
+        missing = ", ".join(str(key) for key in self.keys)
+        return f"cannot `get` {missing} because they do not exist."
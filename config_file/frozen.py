@@ -0,0 +1,136 @@
+"""Read-only views of parsed content that nothing modifies anymore."""
+from collections import abc
+from typing import Any, Iterator, Optional
+
+from config_file.key_path import Key, to_key_path
+from config_file.utils import Default
+
+
+class FrozenConfig(abc.Mapping):
+    """
+    A read-only view of a section of a configuration file, as it was
+    when the snapshot it is part of was taken, see `ConfigFile.snapshot`.
+
+    Sections and lists inside of it are returned as read-only views
+    too, rather than copied, and sets as frozensets. Snapshots compare
+    equal, and hash the same, when their contents are equal.
+
+    Args:
+        section: The section to view. It must never be modified again.
+    """
+
+    __slots__ = ("__section", "__hash")
+
+    def __init__(self, section: abc.Mapping) -> None:
+        self.__section = section
+        self.__hash: Optional[int] = None
+
+    def __getitem__(self, name: Any) -> Any:
+        return freeze(self.__section[name])
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.__section)
+
+    def __len__(self) -> int:
+        return len(self.__section)
+
+    def __hash__(self) -> int:
+        if self.__hash is None:
+            self.__hash = hash(frozenset(self.items()))
+
+        return self.__hash
+
+    def __repr__(self) -> str:
+        return f"FrozenConfig({dict(self.__section)!r})"
+
+    def get(self, key: Key, default: Any = Default(None)) -> Any:
+        """
+        Retrieve the value of a key.
+
+        Args:
+            key: The key to retrieve, which can be dotted.
+            default: The value to return if the key does not exist.
+
+        Raises:
+            KeyError: If the key does not exist and no default was given.
+
+        Returns:
+            The value of the key.
+        """
+        value: Any = self.__section
+        try:
+            for name in to_key_path(key):
+                value = value[name]
+        except (KeyError, IndexError, TypeError):
+            if isinstance(default, Default) and default.value is None:
+                raise KeyError(f"cannot `get` {key} because it does not exist.")
+
+            return default
+
+        return freeze(value)
+
+    def has(self, key: Key) -> bool:
+        """Check if a key, which can be dotted, exists."""
+        try:
+            self.get(key)
+            return True
+        except KeyError:
+            return False
+
+
+class FrozenList(abc.Sequence):
+    """
+    A read-only view of a list in a configuration file, see `FrozenConfig`.
+
+    Args:
+        values: The list to view. It must never be modified again.
+    """
+
+    __slots__ = ("__values", "__hash")
+
+    def __init__(self, values: abc.Sequence) -> None:
+        self.__values = values
+        self.__hash: Optional[int] = None
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return FrozenList(self.__values[index])
+
+        return freeze(self.__values[index])
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, abc.Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(
+            value == other_value for value, other_value in zip(self, other)
+        )
+
+    def __hash__(self) -> int:
+        if self.__hash is None:
+            self.__hash = hash(tuple(self))
+
+        return self.__hash
+
+    def __repr__(self) -> str:
+        return f"FrozenList({list(self.__values)!r})"
+
+
+def freeze(value: Any) -> Any:
+    """
+    Wrap sections and lists in read-only views, and copy sets, such as
+    yaml's `!!set`, into frozensets, leaving other values as-is.
+    """
+    if isinstance(value, abc.Mapping):
+        return FrozenConfig(value)
+
+    if isinstance(value, abc.Sequence) and not isinstance(value, (str, bytes)):
+        return FrozenList(value)
+
+    if isinstance(value, abc.Set):
+        return frozenset(freeze(item) for item in value)
+
+    return value
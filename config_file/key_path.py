@@ -0,0 +1,77 @@
+"""Keys split up into the names of the sections leading to them."""
+from functools import lru_cache
+from typing import Iterable, Union
+
+
+class KeyPath(tuple):
+    """
+    A key split up into the names of the sections that lead to it,
+    e.g. "section.sub_section.key" -> ("section", "sub_section", "key").
+
+    A KeyPath can be used anywhere a dotted key can, and splitting the key
+    up is then skipped entirely. Build the ones you use frequently once and
+    reuse them.
+
+    Dots that are part of a name are escaped with a backslash, and so
+    are backslashes right before a dot, e.g. "hosts.example\\.com" ->
+    ("hosts", "example.com"). Any other backslash is kept as-is.
+
+    Args:
+        key: The dotted key, or the names of the sections and key.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, key: Union[str, Iterable[str]] = "") -> "KeyPath":
+        if isinstance(key, str):
+            return _parse(key)
+
+        return super().__new__(cls, key)
+
+    def __str__(self) -> str:
+        return ".".join(
+            str(name).replace("\\", "\\\\").replace(".", "\\.") for name in self
+        )
+
+    def __repr__(self) -> str:
+        return f"KeyPath({str(self)!r})"
+
+
+# A key is either written out with dots or already split up.
+Key = Union[str, KeyPath]
+
+
+def to_key_path(key: Key) -> KeyPath:
+    """
+    Split up a key, reusing the result for keys that were seen recently.
+
+    Args:
+        key: The key to split up.
+
+    Returns:
+        The split up key.
+    """
+    return key if isinstance(key, KeyPath) else _parse(key)
+
+
+@lru_cache(maxsize=1024)
+def _parse(key: str) -> KeyPath:
+    if "\\" not in key:
+        return tuple.__new__(KeyPath, key.split("."))
+
+    names = []
+    name = []
+    characters = iter(key)
+    for character in characters:
+        if character == "\\":
+            following = next(characters, "")
+            # Only dots and backslashes are escaped, anything else is literal.
+            name.append(following if following in (".", "\\") else "\\" + following)
+        elif character == ".":
+            names.append("".join(name))
+            name = []
+        else:
+            name.append(character)
+
+    names.append("".join(name))
+    return tuple.__new__(KeyPath, names)
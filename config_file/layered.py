@@ -0,0 +1,287 @@
+"""Configuration combined from several layers, without merging them."""
+from collections import abc
+from itertools import chain
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from config_file.config_file import ConfigFile
+from config_file.key_path import Key, KeyPath, to_key_path
+from config_file.utils import Default
+
+# A layer is either a file or a mapping, e.g. built-in defaults.
+Layer = Union[ConfigFile, Mapping]
+
+# The value of a key that does not exist.
+_MISSING: Any = object()
+
+
+class LayeredConfig:
+    """
+    Configuration combined from several layers, e.g. built-in defaults,
+    a site file, a host file, and environment overrides, without
+    merging them together.
+
+    A key is retrieved from the first layer that has it, like a
+    `collections.ChainMap`. Sections are combined the same way, as a
+    `LayeredSection` view of the section in every layer that has it,
+    so nothing is ever copied. Keys that were retrieved are cached until
+    one of the layers changes.
+
+    Changes made through a ConfigFile layer are noticed on their own.
+    Changes made to a mapping layer directly aren't, so call `invalidate`
+    after making them. Changes made through the LayeredConfig are always
+    noticed, and only ever made to a single layer.
+
+    Args:
+        layers: The layers by their name, the one that takes priority first.
+        write_to: The name of the layer changes are made to by default.
+            Defaults to the first layer.
+
+    Raises:
+        ValueError: If there are no layers, or write_to is not one of them.
+    """
+
+    def __init__(self, layers: Mapping[str, Layer], write_to: Optional[str] = None):
+        if not layers:
+            raise ValueError("A LayeredConfig needs at least one layer.")
+
+        self.__layers = dict(layers)
+        self.__write_to = next(iter(self.__layers)) if write_to is None else write_to
+        if self.__write_to not in self.__layers:
+            raise ValueError(f"There is no layer named {self.__write_to}.")
+
+        self.__resolved: Dict[KeyPath, Tuple[Optional[str], Any]] = {}
+        self.__versions: Optional[tuple] = None
+
+    @property
+    def layers(self) -> Mapping[str, Layer]:
+        """The layers by their name, the one that takes priority first."""
+        return dict(self.__layers)
+
+    def get(self, key: Key, default: Any = Default(None)) -> Any:
+        """
+        Retrieve the value of a key from the first layer that has it.
+
+        Args:
+            key: The key to retrieve.
+            default: The value to return if no layer has the key.
+
+        Raises:
+            KeyError: If no layer has the key and no default was given.
+
+        Returns:
+            The value of the key, or a LayeredSection if it is a section.
+        """
+        value = self.__resolve(key)[1]
+        if value is not _MISSING:
+            return value
+
+        if isinstance(default, Default) and default.value is None:
+            raise KeyError(f"cannot `get` {key} because no layer has it.")
+
+        return default
+
+    def has(self, key: Key) -> bool:
+        """Check if any of the layers has a key."""
+        return self.__resolve(key)[1] is not _MISSING
+
+    def source(self, key: Key) -> str:
+        """
+        Find out which layer the value of a key comes from.
+
+        Args:
+            key: The key to find.
+
+        Raises:
+            KeyError: If no layer has the key.
+
+        Returns:
+            The name of the layer. For a section, the name of the
+            first of the layers it is combined from.
+        """
+        name = self.__resolve(key)[0]
+        if name is None:
+            raise KeyError(f"cannot find the source of {key} because no layer has it.")
+
+        return name
+
+    def set(self, key: Key, value: Any, layer: Optional[str] = None) -> None:
+        """
+        Set the value of a key in a single layer.
+
+        Args:
+            key: The key to set.
+            value: The value to set the key to.
+            layer: The name of the layer to set it in.
+                Defaults to the layer given as write_to.
+
+        Raises:
+            KeyError: If there is no layer with the given name.
+            TypeError: If the layer is a mapping that can not be changed.
+        """
+        layer = self.__write_to if layer is None else layer
+        target = self.__layers[layer]
+        if isinstance(target, ConfigFile):
+            target.set(key, value)
+        elif not isinstance(target, abc.MutableMapping):
+            raise TypeError(f"cannot `set` {key} because {layer} is read-only.")
+        else:
+            keys = to_key_path(key)
+            section: MutableMapping = target
+            for name in keys[:-1]:
+                section = section.setdefault(name, {})
+
+            section[keys[-1]] = value
+
+        self.invalidate()
+
+    def delete(self, key: Key, layer: Optional[str] = None) -> None:
+        """
+        Delete a section or key from a single layer. Other
+        layers that have it keep it, and still provide it.
+
+        Args:
+            key: The key to delete.
+            layer: The name of the layer to delete it from.
+                Defaults to the layer given as write_to.
+
+        Raises:
+            KeyError: If there is no layer with the given name,
+                or the layer does not have the key.
+        """
+        target = self.__layers[self.__write_to if layer is None else layer]
+        if isinstance(target, ConfigFile):
+            target.delete(key)
+        else:
+            keys = to_key_path(key)
+            section = _lookup(target, keys[:-1])
+            if not isinstance(section, abc.MutableMapping) or keys[-1] not in section:
+                raise KeyError(f"The specified key '{key}' to delete was not found.")
+
+            del section[keys[-1]]
+
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forget every key that was retrieved, after changing a layer."""
+        self.__resolved = {}
+        self.__versions = None
+
+    def __resolve(self, key: Key) -> Tuple[Optional[str], Any]:
+        """Find the name of the layer a key comes from and its value."""
+        keys = to_key_path(key)
+        versions = tuple(
+            layer.version if isinstance(layer, ConfigFile) else 0
+            for layer in self.__layers.values()
+        )
+        if versions != self.__versions:
+            self.__resolved = {}
+            # A layer that has no version can change at any time.
+            self.__versions = None if None in versions else versions
+
+        resolved = self.__resolved.get(keys)
+        if resolved is None:
+            resolved = _resolve(self.__layers.items(), keys)
+            if self.__versions is not None:
+                self.__resolved[keys] = resolved
+
+        return resolved
+
+
+class LayeredSection(abc.Mapping):
+    """
+    A read-only view of a section combined from several layers, where
+    a key is retrieved from the first of them that has it.
+
+    The view is not a copy, so changes made to the sections
+    in the layers show up in it.
+
+    Args:
+        sections: The name of every layer that has the section, and
+            the section in it, the one that takes priority first.
+    """
+
+    def __init__(self, sections: List[Tuple[str, Mapping]]) -> None:
+        self.__sections = sections
+
+    def __getitem__(self, name: Any) -> Any:
+        value = _resolve(self.__sections, (name,))[1]
+        if value is _MISSING:
+            raise KeyError(name)
+
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(dict.fromkeys(chain.from_iterable(s for _, s in self.__sections)))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"LayeredSection({dict(self)!r})"
+
+    def source(self, key: Key) -> str:
+        """Find out which layer the value of a key comes from, see `LayeredConfig`."""
+        name = _resolve(self.__sections, to_key_path(key))[0]
+        if name is None:
+            raise KeyError(f"cannot find the source of {key} because no layer has it.")
+
+        return name
+
+
+def _lookup(layer: Layer, keys: tuple) -> Any:
+    """Retrieve the value at the end of keys from a layer, or _MISSING."""
+    if isinstance(layer, ConfigFile):
+        if not keys:
+            return _MISSING
+
+        # Sections are only read, through a LayeredSection, but lists are
+        # handed out as they are, so the file has to know about them.
+        value = layer.peek(KeyPath(keys), default=_MISSING)
+        if isinstance(value, abc.MutableSequence):
+            value = layer.get(KeyPath(keys))
+
+        return value
+
+    value = layer
+    try:
+        for name in keys:
+            value = value[name]
+    except (KeyError, IndexError, TypeError):
+        return _MISSING
+
+    return value
+
+
+def _resolve(layers: abc.Iterable, keys: tuple) -> Tuple[Optional[str], Any]:
+    """
+    Find the name of the layer a key comes from and its value, or
+    (None, _MISSING). A section is combined from the layers that have
+    it, up until a layer where the key is not a section.
+    """
+    sections: List[Tuple[str, Mapping]] = []
+    for name, layer in layers:
+        value = _lookup(layer, keys)
+        if value is _MISSING:
+            continue
+
+        if not isinstance(value, abc.Mapping):
+            if not sections:
+                return name, value
+            break
+
+        sections.append((name, value))
+
+    if not sections:
+        return None, _MISSING
+
+    return sections[0][0], LayeredSection(sections)
@@ -4,6 +4,8 @@ from collections import defaultdict
 
 __all__ = [
     "get_all_keys",
+    "get_all_key_locations",
+    "has_key",
     "get_occurrences_and_values",
     "get_occurrence_of_value",
     "get_occurrence_of_key",
@@ -13,13 +15,155 @@ __all__ = [
     "nested_lookup",
 ]
 
+# The types of the values that are never walked through, checked before
+# anything else since most values are one of them.
+_LEAVES = frozenset([str, int, float, bool, type(None)])
 
-# TODO: get rid of this global values_list
-values_list = []
+
+def _walk(document, keys=None, sections=False, nested_lists=True, path=None):
+    """
+    Walk through a nested document depth first, in document order, keeping
+    a stack of the dicts and lists being walked through instead of recursing.
+
+    Yields (parent, key, value) for every key of every dict in the document,
+    or only for the keys in keys if they are given. With sections, yields
+    (None, None, document) and then (parent, key, value) for every dict and
+    list in the document instead, where the key of one inside of a list is
+    its index. A dict or list is only walked through once it was yielded, so
+    it can be modified before that, and the one that was yielded is walked
+    through even if it was replaced.
+
+    Args:
+        document: Might be List of Dicts (or) Dict of Lists (or)
+            Dict of List of Dicts etc...
+        keys: A set of the keys to yield, instead of every key.
+        sections: Whether to yield the dicts and lists instead of the keys.
+        nested_lists: Whether to walk through lists directly inside of lists.
+        path: A list to keep updated with the keys and indexes
+            leading to the parent of the value that was yielded.
+    """
+    if sections:
+        yield None, None, document
+
+    if not isinstance(document, (dict, list)):
+        return
+
+    # The dicts and lists being walked through, from the outermost to the
+    # innermost, with an iterator over their children and whether it's a dict.
+    is_dict = isinstance(document, dict)
+    stack = [
+        (document, iter(document.items()) if is_dict else enumerate(document), is_dict)
+    ]
+    while stack:
+        parent, children, is_dict = stack[-1]
+        entries = is_dict and not sections
+        lists = is_dict or nested_lists
+        for name, value in children:
+            if entries and (keys is None or name in keys):
+                yield parent, name, value
+
+            if type(value) in _LEAVES:
+                continue
+
+            if isinstance(value, dict):
+                child_is_dict = True
+            elif lists and isinstance(value, list):
+                child_is_dict = False
+            else:
+                continue
+
+            if sections:
+                yield parent, name, value
+            items = iter(value.items()) if child_is_dict else enumerate(value)
+            stack.append((value, items, child_is_dict))
+            if path is not None:
+                path.append(name)
+            break
+        else:
+            stack.pop()
+            if path is not None and stack:
+                path.pop()
+
+
+class _CopiedPath(list):
+    """
+    The keys and indexes leading to the parent of the value that was
+    yielded by `_walk`, which copies the dicts and lists along them as
+    values are modified, so that the document itself is left unchanged.
+    """
+
+    def __init__(self, document):
+        super().__init__()
+        # The dicts and lists along the path in the document, and the
+        # copies of as many of them as were modified, from the outermost.
+        self.__originals = [document]
+        self.__copies = []
+
+    def append(self, name):
+        super().append(name)
+        self.__originals.append(self.__originals[-1][name])
+
+    def pop(self, *args):
+        self.__originals.pop()
+        depth = len(self.__originals)
+        del self.__copies[depth:]
+        return super().pop(*args)
+
+    def parent(self):
+        """
+        Copy the dicts and lists leading to the parent of the value that
+        was yielded, if they aren't already, and return the copy of the
+        parent, or None if it was replaced or deleted in the copy.
+        """
+        copies = self.__copies
+        originals = self.__originals
+        if not copies:
+            copies.append(copy.copy(originals[0]))
+
+        while len(copies) < len(originals):
+            container = copies[-1]
+            name = self[len(copies) - 1]
+            original = originals[len(copies)]
+            try:
+                if container[name] is not original:
+                    return None
+            except (KeyError, IndexError):
+                return None
+
+            container[name] = copy.copy(original)
+            copies.append(container[name])
+
+        return copies[-1]
+
+    def document(self):
+        """The copy of the document, with everything that was modified."""
+        if not self.__copies:
+            self.__copies.append(copy.copy(self.__originals[0]))
+        return self.__copies[0]
+
+
+def _copy(document, in_place, share_unchanged):
+    """
+    Prepare to modify a document. Returns the document to modify, and the
+    `_CopiedPath` to walk through it with when the document is to be left
+    unchanged by copying only what is modified, or None otherwise.
+    """
+    if in_place:
+        return document, None
+
+    if share_unchanged:
+        return document, _CopiedPath(document)
+
+    return copy.deepcopy(document), None
 
 
 def nested_lookup(key, document, wild=False, with_keys=False):
-    """Lookup a key in a nested document, return a list of values"""
+    """
+    Lookup a key in a nested document, return a list of values
+
+    Several keys can be looked up at once, by giving a list or set
+    of them as the key, walking through the document only once.
+    """
     if with_keys:
         d = defaultdict(list)
         for k, v in _nested_lookup(key, document, wild=wild, with_keys=with_keys):
@@ -28,34 +172,33 @@ def nested_lookup(key, document, wild=False, with_keys=False):
     return list(_nested_lookup(key, document, wild=wild, with_keys=with_keys))
 
 
-def _is_case_insensitive_substring(a, b):
-    """return True if `a` is a case insensitive substring of `b`, else False"""
-    return str(a).lower() in str(b).lower()
+def _nested_lookup(key, document, wild=False, with_keys=False):
+    """Lookup a key, or a list or set of keys, in a nested document, yield a value"""
+    keys = key if isinstance(key, (list, set)) else [key]
+    if not wild:
+        for _, k, v in _walk(document, _key_set(keys)):
+            yield (k, v) if with_keys else v
+        return
+
+    exact = _key_set(keys)
+    lowered = [str(key).lower() for key in keys]
+    for _, k, v in _walk(document):
+        # Matches keys that have any of the keys as a case insensitive substring.
+        name = str(k).lower()
+        if k in exact or any(key in name for key in lowered):
+            yield (k, v) if with_keys else v
 
 
-def _nested_lookup(key, document, wild=False, with_keys=False):
-    """Lookup a key in a nested document, yield a value"""
-    if isinstance(document, list):
-        for d in document:
-            for result in _nested_lookup(key, d, wild=wild, with_keys=with_keys):
-                yield result
-
-    if isinstance(document, dict):
-        for k, v in document.items():
-            if key == k or (wild and _is_case_insensitive_substring(key, k)):
-                if with_keys:
-                    yield k, v
-                else:
-                    yield v
-            if isinstance(v, dict):
-                for result in _nested_lookup(key, v, wild=wild, with_keys=with_keys):
-                    yield result
-            elif isinstance(v, list):
-                for d in v:
-                    for result in _nested_lookup(
-                        key, d, wild=wild, with_keys=with_keys
-                    ):
-                        yield result
+def _key_set(keys):
+    """The keys that could be the key of a dict, as a set."""
+    result = set()
+    for key in keys:
+        try:
+            result.add(key)
+        except TypeError:
+            # The key can't be hashed, so no dict has it.
+            pass
+    return result
 
 
 def get_all_keys(dictionary):
@@ -66,20 +209,7 @@ def get_all_keys(dictionary):
     Returns:
         List of keys in the dictionary
     """
-    result_list = []
-
-    def recrusion(document):
-        if isinstance(document, list):
-            for list_items in document:
-                recrusion(document=list_items)
-        elif isinstance(document, dict):
-            for key, value in document.items():
-                result_list.append(key)
-                recrusion(document=value)
-        return
-
-    recrusion(document=dictionary)
-    return result_list
+    return [key for _, key, _ in _walk(dictionary)]
 
 
 def get_occurrence_of_key(dictionary, key):
@@ -95,6 +225,50 @@ def get_occurrence_of_key(dictionary, key):
     return _get_occurrence(dictionary=dictionary, item="key", keyword=key)
 
 
+def has_key(dictionary, key):
+    """
+    Method to check if a key occurs anywhere in a nested dictionary
+
+    Stops searching at the first occurrence, and counts the same
+    occurrences as get_occurrence_of_key.
+
+    Args:
+        dictionary: Nested dictionary
+        key: Key to search for
+    Return:
+        True if the key occurs with a value other than None (Boolean)
+    """
+    for _, _, document in _walk(dictionary, sections=True, nested_lists=False):
+        if isinstance(document, dict) and document.get(key) is not None:
+            return True
+
+    return False
+
+
+def get_all_key_locations(dictionary):
+    """
+    Method to find where every key occurs in a nested dictionary
+
+    Searches the same dictionaries as get_occurrence_of_key.
+
+    Args:
+        dictionary: Nested dictionary
+    Return:
+        Dict of every key to a dict of the paths where it occurs,
+        as tuples of the keys and list indexes leading to it, to
+        its value at that path
+    """
+    locations = {}
+    path = []
+    document = prefix = None
+    for parent, key, value in _walk(dictionary, nested_lists=False, path=path):
+        if parent is not document:
+            document, prefix = parent, tuple(path)
+        locations.setdefault(key, {})[prefix + (key,)] = value
+
+    return locations
+
+
 def get_occurrences_and_values(items, value):
     """
     Method to get occurrence of a value in a nested list of dictionary
@@ -126,13 +300,10 @@ def get_occurrences_and_values(items, value):
 
 def _get_occurrence_with_values(dictionary, item, keyword):
     occurrence = [0]
+    values = []
+    _count_occurrences(dictionary, item, keyword, occurrence, values)
 
-    result_recursion = _recursion(dictionary, item, keyword, occurrence, True)
-
-    global values_list
-    values_list = []
-
-    return occurrence[0], result_recursion
+    return occurrence[0], values
 
 
 def get_occurrence_of_value(dictionary, value):
@@ -148,28 +319,28 @@ def get_occurrence_of_value(dictionary, value):
     return _get_occurrence(dictionary=dictionary, item="value", keyword=value)
 
 
-def _recursion(dictionary, item, keyword, occurrence, with_values=False):
-    global values_list
-
-    if item == "key":
-        if dictionary.get(keyword) is not None:
-            occurrence[0] += 1
-    elif keyword in list(dictionary.values()):
-        occurrence[0] += list(dictionary.values()).count(keyword)
-        if with_values:
-            values_list.append(dictionary)
-    for key, value in dictionary.items():
-        if isinstance(value, dict):
-            _recursion(value, item, keyword, occurrence, with_values)
-        elif isinstance(value, list):
-            for list_items in value:
-                if hasattr(list_items, "items"):
-                    _recursion(list_items, item, keyword, occurrence, with_values)
-                elif list_items == keyword:
-                    occurrence[0] += 1 if item == "value" else 0
-
-    if values_list:
-        return values_list
+def _count_occurrences(dictionary, item, keyword, occurrence, values=None):
+    """
+    Count the occurrences of a key or value in a nested dictionary,
+    adding them to occurrence[0]. Every dictionary the value occurs
+    in is appended to values, if given.
+    """
+    for _, _, document in _walk(dictionary, sections=True, nested_lists=False):
+        if not isinstance(document, dict):
+            # The values in lists count too, apart from the dicts and lists.
+            if item == "value" and keyword in document:
+                occurrence[0] += sum(
+                    1
+                    for value in document
+                    if not isinstance(value, (dict, list)) and value == keyword
+                )
+        elif item == "key":
+            if document.get(keyword) is not None:
+                occurrence[0] += 1
+        elif keyword in list(document.values()):
+            occurrence[0] += list(document.values()).count(keyword)
+            if values is not None:
+                values.append(document)
 
 
 def _get_occurrence(dictionary, item, keyword):
@@ -184,42 +355,51 @@ def _get_occurrence(dictionary, item, keyword):
         Number of occurrence of the given keyword in the dict
     """
     occurrence = [0]
-    _recursion(dictionary, item, keyword, occurrence)
-
-    global values_list
-    values_list = []
+    _count_occurrences(dictionary, item, keyword, occurrence)
 
     return occurrence[0]
 
 
-def nested_delete(document, key, in_place=False):
-    if not in_place:
-        document = copy.deepcopy(document)
-    return _nested_delete(document=document, key=key)
+def nested_delete(document, key, in_place=False, share_unchanged=False):
+    document, path = _copy(document, in_place, share_unchanged)
+    return _nested_delete(document=document, key=key, path=path)
 
 
-def _nested_delete(document, key):
+def _nested_delete(document, key, path=None):
     """
     Method to delete a key->value pair from a nested document
     Args:
         document: Might be List of Dicts (or) Dict of Lists (or)
          Dict of List of Dicts etc...
         key: Key to delete
+        path: The `_CopiedPath` to copy what is modified along, if the
+            document is to be left unchanged
     Return:
         Returns a document that includes everything but the given key
     """
-    if isinstance(document, list):
-        for list_items in document:
-            _nested_delete(document=list_items, key=key)
-    elif isinstance(document, dict):
-        if document.get(key):
-            del document[key]
-        for dict_key, dict_value in document.items():
-            _nested_delete(document=dict_value, key=key)
-    return document
+    if path is None:
+        for _, _, value in _walk(document, sections=True):
+            if isinstance(value, dict) and value.get(key):
+                del value[key]
+        return document
 
+    # The document itself isn't modified, so its keys can be
+    # deleted from the copies while walking through it.
+    for _, name, value in _walk(document, _key_set([key]), path=path):
+        parent = path.parent() if value else None
+        if parent is not None:
+            del parent[name]
+    return path.document()
 
-def nested_update(document, key, value, in_place=False, treat_as_element=True):
+
+def nested_update(
+    document,
+    key,
+    value,
+    in_place=False,
+    treat_as_element=True,
+    share_unchanged=False,
+):
     """
     Method to update a key->value pair in a nested document
 
@@ -245,6 +425,13 @@ def nested_update(document, key, value, in_place=False, treat_as_element=True):
                 will be set as value to every key that matches.
             Defaults to True (because of backwards portability of the package).
 
+        share_unchanged (bool):
+            True: copy only the dicts and lists leading to the updated
+                keys, and share everything else with the given document,
+                instead of creating a deep copy of it
+            False: create a deep copy of the dict when not in_place
+            Defaults to False
+
     Return:
         Returns a document that has updated key, value pair.
     """
@@ -257,12 +444,11 @@ def nested_update(document, key, value, in_place=False, treat_as_element=True):
     elif treat_as_element:
         value = [value]
 
-    if not in_place:
-        document = copy.deepcopy(document)
-    return _nested_update(document=document, key=key, value=value)
+    document, path = _copy(document, in_place, share_unchanged)
+    return _nested_update(document=document, key=key, value=value, path=path)
 
 
-def _nested_update(document, key, value):
+def _nested_update(document, key, value, path=None):
     """
     Method to update a key->value pair in a nested document.
     If the number of passed values is less than the number of key matches
@@ -272,20 +458,19 @@ def _nested_update(document, key, value):
             Dict of List of Dicts etc...
         key (str): Key to update the value
         value (list): value(s) which should be used for replacement purpouse
+        path: The `_CopiedPath` to copy what is modified along, if the
+            document is to be left unchanged
     Return:
         Returns a document that has updated key, value pair.
     """
-    if isinstance(document, list):
-        for list_items in document:
-            _nested_update(document=list_items, key=key, value=value)
-    elif isinstance(document, dict):
-        for dict_key, dict_value in document.items():
-            if dict_key == key:
-                document[key] = value[0]
-                if len(value) > 1:
-                    value.pop(0)
-            _nested_update(document=dict_value, key=key, value=value)
-    return document
+    for parent, _, _ in _walk(document, _key_set([key]), path=path):
+        if path is not None:
+            parent = path.parent()
+        if parent is not None:
+            parent[key] = value[0]
+        if len(value) > 1:
+            value.pop(0)
+    return document if path is None else path.document()
 
 
 def nested_alter(
@@ -296,10 +481,16 @@ def nested_alter(
     conversion_function=None,
     wild_alter=False,
     in_place=False,
+    share_unchanged=False,
 ):
     """
     Method to alter all values of the occurences of the key "key".
     The provided callback_function is used to alter the scalar values
+
+    A list of keys is altered in a single walk through the document.
+    A value that matches several of them is passed to the callback_function
+    once for each, in their order, and a value that is inside of another
+    one that matches is passed as it is in the document.
     Args:
         document: Might be List of Dicts (or) Dict of Lists (or)
             Dict of List of Dicts etc...
@@ -320,53 +511,43 @@ def nested_alter(
             True: modify the dict in place;
             False: create a deep copy of the dict and modify it
             Defaults to False
+        share_unchanged (bool):
+            True: copy only the dicts and lists leading to the altered
+                keys, and share everything else with the given document,
+                instead of creating a deep copy of it
+            HINT: The values are passed to the callback_function as they
+            are in the given document then, so it must not modify them!
+            False: create a deep copy of the dict when not in_place
+            Defaults to False
     Return:
         Returns a document that has updated key, value pair.
     """
-    # check if a list or scalar value is provided and create a list from
-    # the scalar value
-    # check the length of the list and provide it to _nested_update
-    if isinstance(key, list):
-        key_len = len(key)
-    else:
-        key = [key]
-        key_len = len(key)
+    keys = key if isinstance(key, list) else [key]
 
-    if not in_place:
-        document = copy.deepcopy(document)
+    document, path = _copy(document, in_place, share_unchanged)
     return _nested_alter(
         document=document,
-        keys=key,
+        keys=keys,
         callback_function=callback_function,
         function_parameters=function_parameters,
         conversion_function=conversion_function,
         wild_alter=wild_alter,
-        in_place=in_place,
-        key_len=key_len,
+        path=path,
     )
 
 
-def _call_callback(
-    value_list, callback_function, function_parameters, conversion_function
-):
+def _call_callback(value, callback_function, function_parameters, conversion_function):
     """
     internal helper to call the callback function
     """
-    return_list = []
-    # loop over all values
-    for value in value_list:
-        # apply the conversion function
-        if conversion_function is not None:
-            value = conversion_function(value)
-        # if functions arguments are present, expand the list to variables
-        # via the magic operator *
-        if function_parameters:
-            trans_val = callback_function(value, *function_parameters)
-        else:
-            trans_val = callback_function(value)
-        # append the transformed element to the list
-        return_list.append(trans_val)
-    return return_list
+    # apply the conversion function
+    if conversion_function is not None:
+        value = conversion_function(value)
+    # if functions arguments are present, expand the list to variables
+    # via the magic operator *
+    if function_parameters:
+        return callback_function(value, *function_parameters)
+    return callback_function(value)
 
 
 def _nested_alter(
@@ -376,26 +557,58 @@ def _nested_alter(
     function_parameters,
     conversion_function,
     wild_alter,
-    in_place,
-    key_len,
+    path=None,
 ):
+    """
+    Alter the values of the keys in a single walk through the document,
+    replacing each value as soon as it's found. A value that matches
+    several of the keys is altered once for each of them, in their order.
+    """
     # return data if no callback_function is provided
     if callback_function is None:
         warnings.warn("Please provide a callback_function to nested_alter().")
-        return document
+        return document if path is None else path.document()
 
-    # iterate over all given keys in the list
-    for key in keys:
-        # try to find the key:
-        findings = nested_lookup(key, document, with_keys=True, wild=wild_alter)
-        for k, v in findings.items():
-            trans_val = _call_callback(
-                v, callback_function, function_parameters, conversion_function
-            )
-            # use the transformed value and apply the update to the key
-            # (dont treat the lists as elements here)
-            document = nested_update(
-                document, k, trans_val, in_place=in_place, treat_as_element=False
-            )
-
-    return document
+    if wild_alter:
+        matches = _wild_matches(keys)
+        entries = _walk(document, path=path)
+    else:
+        # How many times each of the keys was given.
+        times = {}
+        for key in keys:
+            try:
+                times[key] = times.get(key, 0) + 1
+            except TypeError:
+                # The key can't be hashed, so no dict has it.
+                pass
+        matches = times.get
+        entries = _walk(document, times, path=path)
+
+    for parent, key, value in entries:
+        count = matches(key)
+        if count:
+            for _ in range(count):
+                value = _call_callback(
+                    value, callback_function, function_parameters, conversion_function
+                )
+            if path is not None:
+                parent = path.parent()
+            if parent is not None:
+                parent[key] = value
+
+    return document if path is None else path.document()
+
+
+def _wild_matches(keys):
+    """Count how many of the keys match a key of a document via wild-match."""
+    lowered = [(key, str(key).lower()) for key in keys]
+
+    def matches(name):
+        lowered_name = str(name).lower()
+        return sum(
+            1
+            for key, lowered_key in lowered
+            if key == name or lowered_key in lowered_name
+        )
+
+    return matches
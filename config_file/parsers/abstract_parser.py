@@ -1,5 +1,13 @@
+import copy
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Type, TypeVar
+
+from config_file.changes import DELETE, SET, check_changes
+from config_file.frozen import FrozenConfig
+from config_file.key_path import Key, KeyPath
+from config_file.nested_lookup import get_all_key_locations
+
+T = TypeVar("T", bound="AbstractParser")
 
 
 class AbstractParser(ABC):
@@ -12,6 +20,7 @@ class AbstractParser(ABC):
 
     Every key is specified in a dot (.) syntax
     e.g. retrieving.some.deeply.nested.value
+    or as a `config_file.key_path.KeyPath`.
 
     If there is no dot in the key, it is assumed we are
     performing an action on a top level key, which could
@@ -25,6 +34,26 @@ class AbstractParser(ABC):
     def __init__(self, file_contents: str) -> None:
         self.file_contents = file_contents
 
+    @classmethod
+    def from_parsed_content(
+        cls: Type[T], file_contents: str, parsed_content: dict, shared: bool = True
+    ) -> T:
+        """Create a parser around content that has already been parsed.
+
+        Parsers that can not reuse parsed content parse
+        file_contents again, which is the default.
+
+        Args:
+            file_contents: The contents of the file that was parsed.
+            parsed_content: The parsed content of file_contents.
+            shared: Whether anything else holds on to parsed_content,
+                in which case the parser must not modify it.
+
+        Returns:
+            The parser for the given contents.
+        """
+        return cls(file_contents)
+
     @property
     @abstractmethod
     def parsed_content(self) -> dict:
@@ -40,6 +69,64 @@ class AbstractParser(ABC):
         """
         raise NotImplementedError
 
+    @property
+    def is_dirty(self) -> bool:
+        """Whether the working file may have changed since it was
+        read in or last marked clean.
+
+        Parsers that do not keep track of changes are always
+        considered dirty.
+
+        Returns:
+            True if the working file may have changed. False otherwise.
+        """
+        return True
+
+    @property
+    def version(self) -> Optional[int]:
+        """A number that changes whenever the working file changes.
+
+        Parsers that do not keep track of changes have no version.
+
+        Returns:
+            The version of the working file, or None.
+        """
+        return None
+
+    def mark_clean(self, file_contents: str) -> None:
+        """Mark the working file as saved, so it is no longer dirty.
+
+        Args:
+            file_contents: The stringified working file that was saved.
+        """
+
+    def use_index(self, enabled: bool = True) -> None:
+        """Keep an index of every key to speed up `get` and `has`.
+
+        Parsers that do not support an index ignore this.
+
+        Args:
+            enabled: Whether to use the index.
+        """
+
+    def use_types(self, enabled: bool = True) -> None:
+        """Parse the values of every key into their native types once.
+
+        Parsers that do not support it ignore this.
+
+        Args:
+            enabled: Whether to convert the values.
+        """
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.parsed_content[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.parsed_content[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        del self.parsed_content[key]
+
     @abstractmethod
     def reset_internal_contents(self, file_contents: str) -> None:
         """Reset the state of this parser to a new file.
@@ -60,7 +147,7 @@ class AbstractParser(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get(self, key: str) -> Any:
+    def get(self, key: Key) -> Any:
         """Retrieve the value of a key from the working file.
 
         Args:
@@ -74,8 +161,26 @@ class AbstractParser(ABC):
         """
         raise NotImplementedError
 
+    def peek(self, key: Key) -> Any:
+        """Retrieve the value of a key from the working file only to read it.
+
+        Unlike with `get`, the value must not be modified, so the parser
+        does not have to consider the working file changed afterwards.
+        Defaults to `get`.
+
+        Args:
+            key: The key to retrieve.
+
+        Returns:
+            Whatever value the given key happens to contain.
+
+        Raises:
+            KeyError: If the key to retrieve does not exist.
+        """
+        return self.get(key)
+
     @abstractmethod
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: Key, value: Any) -> None:
         """Set the value of a key in the working file.
 
         If the key does not exist, it should be created.
@@ -87,7 +192,7 @@ class AbstractParser(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def delete(self, key: str) -> None:
+    def delete(self, key: Key) -> None:
         """Deletes a key from the working file.
 
         Args:
@@ -98,6 +203,100 @@ class AbstractParser(ABC):
         """
         raise NotImplementedError
 
+    def find(self, name: Any) -> List[KeyPath]:
+        """Find every key with the given name in the working file.
+
+        Args:
+            name: The name of the keys to find.
+
+        Returns:
+            The path to every key with the name.
+        """
+        locations = get_all_key_locations(self.parsed_content)
+        return [KeyPath(path) for path in locations.get(name, ())]
+
+    def get_many(self, keys: Iterable[Key]) -> Dict[Key, Any]:
+        """Retrieve the values of many keys from the working file.
+
+        Args:
+            keys: The keys to retrieve.
+
+        Returns:
+            The value of every key that exists, keyed by the key
+            as it was given. Keys that do not exist are left out.
+        """
+        values = {}
+        for key in keys:
+            try:
+                values[key] = self.get(key)
+            except KeyError:
+                pass
+
+        return values
+
+    def peek_many(self, keys: Iterable[Key]) -> Dict[Key, Any]:
+        """Retrieve the values of many keys only to read them, see `peek`.
+
+        Defaults to `get_many`.
+
+        Args:
+            keys: The keys to retrieve.
+
+        Returns:
+            The value of every key that exists, keyed by the key
+            as it was given. Keys that do not exist are left out.
+        """
+        return self.get_many(keys)
+
+    def set_many(self, values: Mapping[Key, Any]) -> None:
+        """Set the values of many keys in the working file.
+
+        Args:
+            values: The value to set every key to.
+        """
+        for key, value in values.items():
+            self.set(key, value)
+
+    def apply_changes(self, changes: dict) -> None:
+        """Apply a trie of changes to the working file.
+
+        See `config_file.changes` for the layout of the trie. Either all
+        of the changes are applied or, if one of them fails, none are.
+
+        Args:
+            changes: The changes to apply.
+
+        Raises:
+            IndexError: If a key is set past the end of a list.
+            TypeError: If a key is set in a value that is neither
+                a section nor a list.
+        """
+        check_changes(self.parsed_content, changes)
+
+        nodes = [((), changes)]
+        while nodes:
+            path, node = nodes.pop()
+            for name, child in node.items():
+                if name is SET or name is DELETE:
+                    continue
+
+                key = KeyPath(path + (name,))
+                if DELETE in child and self.has(key):
+                    self.delete(key)
+
+                if SET in child:
+                    self.set(key, child[SET])
+
+                nodes.append((key, child))
+
+    def snapshot(self) -> FrozenConfig:
+        """Take a read-only view of the working file as it is now.
+
+        Returns:
+            The view, which modifying the working file does not change.
+        """
+        return FrozenConfig(copy.deepcopy(self.parsed_content))
+
     @abstractmethod
     def __str__(self) -> str:
         """
@@ -114,7 +313,7 @@ class AbstractParser(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def has(self, key: str, wild: bool = False) -> bool:
+    def has(self, key: Key, wild: bool = False) -> bool:
         """Check whether the given key is in the parsed working file.
 
         This should not behave like a wild card, as in check
@@ -1,13 +1,52 @@
+import copy
+import re
 from abc import abstractmethod
-from typing import Any, Type
-
+from collections import abc
+from itertools import count
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from config_file.changes import (
+    DELETE,
+    SET,
+    check_changes,
+    has_nested_changes,
+    trie_node,
+)
 from config_file.exceptions import ParsingError
-from config_file.nested_lookup import get_occurrence_of_key
+from config_file.frozen import FrozenConfig
+from config_file.key_path import Key, KeyPath, to_key_path
+from config_file.nested_lookup import get_all_key_locations, has_key
 from config_file.parsers.abstract_parser import AbstractParser
-from config_file.utils import split_on_dot
+
+T = TypeVar("T", bound="BaseParser")
+
+# The start and end offsets of the text of a value in the file contents.
+Span = Tuple[int, int]
+INDENT = re.compile(r"[ \t]*")
+
+# Marks where keys end in a trie of keys, see `get_many`.
+_END = object()
+
+# Every version of the parsed content of any parser gets its own number.
+_versions = count()
 
 
 class BaseParser(AbstractParser):
+    # Whether to keep an index of every key, see `use_index`.
+    __indexing = False
+    # Whether to parse the values of every key, see `use_types`.
+    __typing = False
+
     def __init__(self, file_contents: str):
         """
         The BaseParser implements the AbstractParser for us, as long as the
@@ -25,7 +64,286 @@ class BaseParser(AbstractParser):
             ParsingError: If the decode_error is raised.
         """
         super().__init__(file_contents)
-        self.__parsed_content = self.parse_file_contents()
+        # The sections this parser created or copied, by their id, which
+        # it can modify in place. None if it owns all of them, otherwise
+        # the others are shared, see `__detach`.
+        self.__owned: Optional[Dict[int, Any]]
+        # Whether parts of the parsed content were handed out, see `__release`.
+        self.__untracked: bool
+        self.__use_parsed_content(self.parse_file_contents(), shared=False)
+
+    @classmethod
+    def from_parsed_content(
+        cls: Type[T], file_contents: str, parsed_content: dict, shared: bool = True
+    ) -> T:
+        """
+        Create a parser around content that has already been parsed,
+        without running `loads` again.
+
+        Args:
+            file_contents: The contents of the file that was parsed.
+            parsed_content: The result of running `loads` on file_contents.
+            shared: Whether anything else holds on to parsed_content. The
+                sections of shared content are only copied as this parser
+                modifies them, so other holders of it never see its changes.
+
+        Returns:
+            The parser for the given contents.
+        """
+        parser = cls.__new__(cls)
+        parser.file_contents = file_contents
+        parser.__use_parsed_content(parsed_content, shared)
+        return parser
+
+    def __copy__(self: T) -> T:
+        """
+        Create a parser in the same state as this one that shares its
+        parsed content. Whichever of them modifies the parsed content
+        first takes a copy of the sections it modifies, so neither sees
+        the other's changes.
+        """
+        if self.__untracked:
+            # Parts of the parsed content were handed out and can still be
+            # modified through them, so this parser has to keep its own.
+            parser = self.from_parsed_content(
+                self.file_contents, copy.deepcopy(self.__parsed_content), shared=False
+            )
+            parser.__untracked = True
+            parser.__indexing = self.__indexing
+            parser.__typing = self.__typing
+            return parser
+
+        self.__owned = {}
+        parser = self.from_parsed_content(self.file_contents, self.__parsed_content)
+        parser.__indexing = self.__indexing
+        parser.__typing = self.__typing
+        parser.__changed_keys = (
+            None if self.__changed_keys is None else set(self.__changed_keys)
+        )
+        return parser
+
+    def __use_parsed_content(self, parsed_content: dict, shared: bool) -> None:
+        """Start working with new parsed content, unchanged so far."""
+        self.__parsed_content = parsed_content
+        self.__owned = {} if shared else None
+        self.__snapshot: Optional[FrozenConfig] = None
+        self.__version = next(_versions)
+        self.__untracked = False
+        self.__index: Optional[Dict[tuple, Any]] = None
+        self.__locations: Optional[Dict[Any, Dict[tuple, Any]]] = None
+        self.__wild_searches = 0
+        self.__mark_unchanged()
+
+    def __mark_unchanged(self) -> None:
+        # The keys that were changed in place, or None if something was
+        # added or removed and the whole document has to be dumped again.
+        self.__changed_keys: Optional[set] = set()
+        self.__spans: Optional[Dict[tuple, Span]] = None
+
+    def __detach(self) -> None:
+        """
+        Prepare to modify the parsed content.
+
+        If the parsed content is shared, with a snapshot or another
+        parser, the top level is replaced with a copy. The sections
+        leading to the keys that are modified have to be copied too,
+        using `__own_child`, which leaves everything else shared.
+        """
+        self.__snapshot = None
+        self.__version = next(_versions)
+        if self.__owned is None or id(self.__parsed_content) in self.__owned:
+            return
+
+        if self.can_copy_sections(self.__parsed_content):
+            self.__parsed_content = self.__own(copy.copy(self.__parsed_content))
+        else:
+            self.__parsed_content = copy.deepcopy(self.__parsed_content)
+            self.__owned = None
+            self.__index = None
+            self.__locations = None
+
+    def __own(self, section: Any) -> Any:
+        """Record that a section can be modified in place."""
+        if self.__owned is not None:
+            self.__owned[id(section)] = section
+
+        return section
+
+    def __own_child(self, keys: tuple, section: Any) -> Any:
+        """
+        Retrieve the value at the end of keys from its section, replacing
+        it with a copy first if it is a shared section or list.
+
+        Args:
+            keys: The split up key of the value.
+            section: The section the value is in, which is owned.
+
+        Raises:
+            KeyError: If the key does not exist.
+        """
+        name = keys[-1]
+        value = section[name]
+        if (
+            self.__owned is None
+            or id(value) in self.__owned
+            or not isinstance(value, (abc.MutableMapping, abc.MutableSequence))
+        ):
+            return value
+
+        section[name] = copy.copy(value)
+        value = self.__own(section[name])
+        if self.__index is not None and keys in self.__index:
+            self.__index[keys] = value
+        if self.__locations is not None and keys in self.__locations.get(name, ()):
+            self.__locations[name][keys] = value
+
+        return value
+
+    def __record_change(self, key: Optional[tuple]) -> None:
+        """
+        Record that the value of a key was changed through this parser.
+
+        Args:
+            key: The split up key that was set, or None if the change
+                added or removed keys in a way that can not be patched.
+        """
+        if key is None:
+            self.__changed_keys = None
+        elif self.__changed_keys is not None:
+            self.__changed_keys.add(key)
+
+    def __release(self) -> None:
+        """
+        Prepare to hand out a mutable part of the parsed content.
+
+        Whoever holds it can modify it without this parser knowing,
+        so from now on the parsed content is always considered dirty.
+        """
+        if self.__owned is not None:
+            # Nothing modified through what is handed out may show up
+            # in a snapshot, or another parser, sharing the content.
+            self.__parsed_content = copy.deepcopy(self.__parsed_content)
+            self.__owned = None
+
+        self.__snapshot = None
+        self.__untracked = True
+        self.__index = None
+        self.__locations = None
+
+    def use_index(self, enabled: bool = True) -> None:
+        """
+        Keep an index of the value of every key, by its full path, so that
+        `get` and `has` are a single dictionary lookup however deeply nested
+        the key is.
+
+        The index is built the first time it is needed. Setting or deleting
+        a key that is not a section keeps it up to date; adding or removing
+        sections has it built again on the next lookup. Once a section was
+        handed out by the array notation, or the parsed content itself, it
+        may be modified without the parser knowing, so the index is no
+        longer used.
+
+        Args:
+            enabled: Whether to use the index.
+        """
+        self.__indexing = enabled
+        self.__index = None
+
+    def use_types(self, enabled: bool = True) -> None:
+        """
+        Parse the values of every key into their native types once,
+        right after parsing the file, and again whenever it is reset.
+
+        Only formats that `convert_types` supports are converted,
+        the others already have native types.
+
+        Args:
+            enabled: Whether to convert the values.
+        """
+        self.__typing = enabled
+        if enabled:
+            self.__convert_types()
+
+    @property
+    def uses_types(self) -> bool:
+        """Whether the values of every key were converted, see `use_types`."""
+        return self.__typing
+
+    def __convert_types(self) -> None:
+        converted = self.convert_types(self.__parsed_content)
+        if converted is not None:
+            # The converted content can reuse the sections that didn't change,
+            # so it is shared if the original content was.
+            self.__use_parsed_content(converted, shared=self.__owned is not None)
+
+    def convert_types(self, parsed_content: dict) -> Optional[dict]:
+        """
+        Parse the values of every key into their native types.
+
+        Args:
+            parsed_content: The parsed content to convert. It may be
+                shared, so it must not be modified.
+
+        Returns:
+            The converted parsed content, which can reuse the sections
+            of the original that didn't change, or None by default for formats
+            whose values already have native types. `dumps` has to write
+            the converted values in the same way as the original ones.
+        """
+        return None
+
+    def __key_index(self) -> Optional[Dict[tuple, Any]]:
+        """The index of every key, if it is in use."""
+        if not self.__indexing or self.__untracked:
+            return None
+
+        if self.__index is None:
+            index = {}
+            sections: List[Tuple[tuple, Mapping]] = [((), self.__parsed_content)]
+            while sections:
+                path, section = sections.pop()
+                for name, value in section.items():
+                    key = path + (name,)
+                    index[key] = value
+                    if isinstance(value, abc.Mapping):
+                        sections.append((key, value))
+
+            self.__index = index
+
+        return self.__index
+
+    def __key_locations(self, build: bool) -> Optional[Dict[Any, Dict[tuple, Any]]]:
+        """
+        The paths where every key name occurs, if they can be relied on.
+
+        Args:
+            build: Whether to find the paths if they have not been yet.
+        """
+        if self.__untracked:
+            return None
+
+        if self.__locations is None and build:
+            self.__locations = get_all_key_locations(self.__parsed_content)
+
+        return self.__locations
+
+    def __index_set(self, keys: tuple, section: Any) -> None:
+        """Record the new value of a key that was set in the indexes."""
+        if self.__index is None and self.__locations is None:
+            return
+
+        value = section[keys[-1]]
+        if self.__index is not None:
+            self.__index = _set_in_index(self.__index, keys, value, section)
+        if self.__locations is not None:
+            self.__locations = _set_in_locations(self.__locations, keys, value, section)
+
+    def __index_delete(self, keys: tuple, section: Any) -> None:
+        """Remove a key that was deleted from its section from the indexes."""
+        if self.__index is not None:
+            self.__index = _delete_from_index(self.__index, keys, section)
+        if self.__locations is not None:
+            self.__locations = _delete_from_locations(self.__locations, keys, section)
 
     @abstractmethod
     def loads(self, contents: str) -> dict:
@@ -78,10 +396,183 @@ class BaseParser(AbstractParser):
 
     @property
     def parsed_content(self) -> dict:
+        self.__release()
         return self.__parsed_content
 
+    @property
+    def is_dirty(self) -> bool:
+        return self.__untracked or self.__changed_keys != set()
+
+    @property
+    def version(self) -> Optional[int]:
+        """
+        A number that changes whenever the parsed content is modified
+        or replaced, and that no other version of any parser has.
+
+        Once a section was handed out by the array notation, or the
+        parsed content itself, it may be modified without the parser
+        knowing, so there is no version anymore.
+        """
+        return None if self.__untracked else self.__version
+
+    def mark_clean(self, file_contents: str) -> None:
+        self.file_contents = file_contents
+        self.__mark_unchanged()
+
+    def snapshot(self) -> FrozenConfig:
+        """
+        Take a read-only view of the parsed content as it is now.
+
+        Nothing is copied to take it. Instead, the parsed content is
+        shared with the snapshot, and from then on the sections leading
+        to a key are copied when it is modified, before the copies are
+        modified. The snapshot never changes, and only shares the
+        sections that are still unchanged with the parsed content.
+
+        Once a section was handed out by the array notation, or the
+        parsed content itself, it may be modified without the parser
+        knowing, so the snapshot is a full copy instead.
+
+        Returns:
+            The snapshot, which is reused until the parsed content changes.
+        """
+        if self.__untracked:
+            return FrozenConfig(copy.deepcopy(self.__parsed_content))
+
+        if self.__snapshot is None:
+            self.__snapshot = FrozenConfig(self.__parsed_content)
+            self.__owned = {}
+
+        return self.__snapshot
+
+    def value_spans(self, contents: str) -> Optional[Dict[tuple, Span]]:
+        """
+        Locate the text of the values of keys in the file contents.
+
+        This lets a changed key be written by replacing only the text
+        of its value instead of dumping the whole document again,
+        which keeps the rest of the file exactly as it was.
+
+        Args:
+            contents: The file contents to search.
+
+        Returns:
+            The start and end offset of the text of every key's value,
+            keyed by the split up key. Keys inside of lists do not need
+            to be included. None if the format does not support it, in
+            which case the whole document is always dumped.
+        """
+        return None
+
+    def dumps_value(self, value: Any, indent: str) -> Optional[str]:
+        """
+        Transform a single value into the text it has in the file.
+
+        Args:
+            value: The value to transform.
+            indent: The whitespace the line holding the value starts with.
+
+        Returns:
+            The value as text, or None if it can not be written in place
+            and the whole document has to be dumped instead.
+        """
+        return None
+
+    def can_copy_sections(self, parsed_content: dict) -> bool:
+        """
+        Check whether the sections of the parsed content can be copied
+        one at a time, with `copy.copy`, to modify them without modifying
+        the originals.
+
+        Args:
+            parsed_content: The parsed content to check.
+
+        Returns:
+            True by default. False if the sections are tied together in a
+            way that copying only some of them breaks, in which case all
+            of the parsed content is copied the first time it is modified.
+        """
+        return True
+
+    def __patch(self) -> Optional[str]:
+        """
+        Write the changed keys into the file contents in place.
+
+        Returns:
+            The patched file contents, or None if the changes can't
+            be patched in and the whole document has to be dumped.
+        """
+        if self.__untracked or self.__changed_keys is None:
+            return None
+
+        if not self.__changed_keys:
+            return self.file_contents
+
+        if self.__spans is None:
+            self.__spans = self.value_spans(self.file_contents)
+            if self.__spans is None:
+                return None
+
+        patches = []
+        for key in self.__changed_keys:
+            # A key inside of a changed section is written with the section.
+            if any(key[:end] in self.__changed_keys for end in range(1, len(key))):
+                continue
+
+            span = self.__spans.get(key)
+            if span is None:
+                return None
+
+            try:
+                value = self.__parsed_content
+                for part in key:
+                    value = value[part]
+            except (KeyError, IndexError, TypeError):
+                return None
+
+            line_start = self.file_contents.rfind("\n", 0, span[0]) + 1
+            match = INDENT.match(self.file_contents, line_start, span[0])
+            indent = match.group() if match else ""
+            text = self.dumps_value(value, indent)
+            if text is None:
+                return None
+
+            patches.append((span, text))
+
+        patched = []
+        position = 0
+        for (start, end), text in sorted(patches):
+            patched.append(self.file_contents[position:start])
+            patched.append(text)
+            position = end
+        patched.append(self.file_contents[position:])
+
+        return "".join(patched)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.__parsed_content[key]
+
+        if isinstance(value, (dict, list)):
+            self.__release()
+            value = self.__parsed_content[key]
+
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.__detach()
+        self.__parsed_content[key] = value
+        self.__record_change((key,))
+        self.__index_set((key,), self.__parsed_content)
+
+    def __delitem__(self, key: Any) -> None:
+        self.__detach()
+        del self.__parsed_content[key]
+        self.__record_change(None)
+        self.__index_delete((key,), self.__parsed_content)
+
     def __str__(self) -> str:
-        return self.dumps(self.__parsed_content)
+        patched = self.__patch()
+        return patched if patched is not None else self.dumps(self.__parsed_content)
 
     def parse_file_contents(self) -> dict:
         """
@@ -114,12 +605,19 @@ class BaseParser(AbstractParser):
             ParsingError: If we're unable to parse the new file contents.
         """
         self.file_contents = file_contents
-        self.__parsed_content = self.parse_file_contents()
+        self.__use_parsed_content(self.parse_file_contents(), shared=False)
+        if self.__typing:
+            self.__convert_types()
 
-    def get(self, search_key: str) -> Any:
+    def get(self, search_key: Key) -> Any:
         """
         Retrieve a key from the parsed content.
 
+        A section or list that is retrieved can be modified without the
+        parser knowing, so from then on the parsed content is always
+        considered dirty, like with the array notation. Use `peek` to
+        retrieve values only to read them.
+
         Args:
             search_key: The key to search from in the
                 parsed content in a "dot" syntax.
@@ -132,20 +630,48 @@ class BaseParser(AbstractParser):
         Returns:
             The value of the key we're searching for.
         """
+        value = self.peek(search_key)
+
+        if isinstance(value, (dict, list)):
+            self.__release()
+            value = self.peek(search_key)
+
+        return value
+
+    def peek(self, search_key: Key) -> Any:
+        """
+        Retrieve a key from the parsed content only to read it, see `get`.
+
+        Sections and lists are returned as-is, so they must not be modified.
+
+        Args:
+            search_key: The key to search from in the
+                parsed content in a "dot" syntax.
+                i.e. "section.key"
+
+        Raises:
+            KeyError: If the key or one of the sections
+                we're subscripting into does not exist.
+
+        Returns:
+            The value of the key we're searching for.
+        """
+        index = self.__key_index()
+        if index is not None:
+            try:
+                return index[to_key_path(search_key)]
+            except (KeyError, TypeError):
+                # Find out which key is missing for the error message.
+                pass
+
         error_key = None
 
         try:
-            if "." not in search_key:
-                error_key = search_key
-                return self.__parsed_content[search_key]
-            else:
-                split_keys = split_on_dot(search_key)
-
             parsed_content = self.__parsed_content
-            for key in split_keys:
+            for key in to_key_path(search_key):
                 error_key = key
                 parsed_content = parsed_content[key]
-        except (KeyError, TypeError):
+        except (KeyError, IndexError, TypeError):
             raise KeyError(
                 f"cannot `get` {search_key} because "
                 f"{error_key} is not subscriptable."
@@ -153,48 +679,309 @@ class BaseParser(AbstractParser):
 
         return parsed_content
 
-    def set(self, key: str, value: Any) -> None:
-        if "." not in key:
-            self.__parsed_content[key] = value
-            return
+    def set(self, key: Key, value: Any) -> None:
+        keys = to_key_path(key)
+        self.__detach()
+        self.__record_change(keys)
 
-        keys = split_on_dot(key)
         parsed_content = self.__parsed_content
-        for index, key in enumerate(keys):
-            if index == len(keys) - 1:
-                parsed_content[key] = value
-                return
-
+        for end, section in enumerate(keys[:-1], 1):
             try:
-                parsed_content = parsed_content[key]
+                parsed_content = self.__own_child(keys[:end], parsed_content)
             except KeyError:
-                parsed_content[key] = {}
-                parsed_content = parsed_content[key]
+                parsed_content[section] = {}
+                parsed_content = self.__own(parsed_content[section])
+
+        parsed_content[keys[-1]] = value
+        self.__index_set(keys, parsed_content)
+
+    def find(self, name: Any) -> List[KeyPath]:
+        """
+        Find every key with the given name, however deeply nested,
+        including the ones in sections inside of lists.
+
+        Args:
+            name: The name of the keys to find.
+
+        Returns:
+            The path to every key with the name, where the index of a
+            section in a list is part of the path.
+        """
+        locations = self.__key_locations(build=True)
+        if locations is None:
+            locations = get_all_key_locations(self.__parsed_content)
+
+        return [KeyPath(path) for path in locations.get(name, ())]
+
+    def get_many(self, search_keys: Iterable[Key]) -> Dict[Key, Any]:
+        """
+        Retrieve many keys from the parsed content, visiting every
+        section shared by the keys only once.
+
+        Retrieving sections or lists makes the parsed content
+        always considered dirty, see `get`.
+
+        Args:
+            search_keys: The keys to retrieve.
+
+        Returns:
+            The value of every key that exists, keyed by the key
+            as it was given. Keys that do not exist are left out.
+        """
+        search_keys = list(search_keys)
+        values = self.peek_many(search_keys)
+
+        if any(isinstance(value, (dict, list)) for value in values.values()):
+            self.__release()
+            values = self.peek_many(search_keys)
+
+        return values
+
+    def peek_many(self, search_keys: Iterable[Key]) -> Dict[Key, Any]:
+        """
+        Retrieve many keys from the parsed content only to read them,
+        see `get_many` and `peek`.
+
+        Args:
+            search_keys: The keys to retrieve.
+
+        Returns:
+            The value of every key that exists, keyed by the key
+            as it was given. Keys that do not exist are left out.
+        """
+        values = {}
+        index = self.__key_index()
+
+        # Group the keys by the sections leading to them, so
+        # each section is only looked up once for all of them.
+        trie: dict = {}
+        for search_key in search_keys:
+            try:
+                keys = to_key_path(search_key)
+                if index is not None and keys in index:
+                    values[search_key] = index[keys]
+                else:
+                    trie_node(trie, keys).setdefault(_END, []).append(search_key)
+            except TypeError:
+                # Not a valid key, so it can't exist.
+                pass
+
+        for search_key in trie.pop(_END, ()):
+            values[search_key] = self.__parsed_content
+
+        nodes = [(trie, self.__parsed_content)]
+        while nodes:
+            node, section = nodes.pop()
+            for key, child in node.items():
+                if key is _END:
+                    continue
+
+                try:
+                    value = section[key]
+                except (KeyError, IndexError, TypeError):
+                    continue
+
+                for search_key in child.get(_END, ()):
+                    values[search_key] = value
+
+                if len(child) > (_END in child):
+                    nodes.append((child, value))
+
+        return values
+
+    def set_many(self, values: Mapping[Key, Any]) -> None:
+        """
+        Set many keys in the parsed content, visiting every section
+        shared by the keys only once.
+
+        A section is set before the keys inside of it, whatever
+        order they are given in.
+
+        Args:
+            values: The value to set every key to.
+        """
+        changes: dict = {}
+        for key, value in values.items():
+            trie_node(changes, to_key_path(key))[SET] = value
+
+        self.apply_changes(changes)
+
+    def apply_changes(self, changes: dict) -> None:
+        """
+        Apply a trie of changes, see `config_file.changes`, visiting
+        every section that changes only once.
+
+        The changes are checked before any of them is applied, so either
+        all of them are applied or, if one of them fails, none are.
+
+        Args:
+            changes: The changes to apply.
+
+        Raises:
+            IndexError: If a key is set past the end of a list.
+            TypeError: If a key is set in a value that is neither
+                a section nor a list.
+        """
+        if not changes:
+            return
+
+        check_changes(self.__parsed_content, changes)
+        self.__detach()
+
+        # The path to, changes of, and section of every key that changes.
+        nodes: List[Tuple[tuple, dict, Any]] = [((), changes, self.__parsed_content)]
+        while nodes:
+            path, node, section = nodes.pop()
+            for name, child in node.items():
+                if name is SET or name is DELETE:
+                    continue
+
+                keys = path + (name,)
+                if DELETE in child:
+                    self.__apply_delete(keys, section)
+
+                if SET in child:
+                    section[name] = child[SET]
+                    self.__record_change(keys)
+                    self.__index_set(keys, section)
+
+                if has_nested_changes(child):
+                    nodes.append((keys, child, self.__subsection(keys, section)))
+
+    def __apply_delete(self, keys: tuple, section: Any) -> None:
+        try:
+            del section[keys[-1]]
+        except (KeyError, IndexError):
+            # Deleting a key that was only going to be created.
+            return
+
+        self.__record_change(None)
+        self.__index_delete(keys, section)
+
+    def __subsection(self, keys: tuple, section: Any) -> Any:
+        """Retrieve the subsection at the end of keys, creating it if needed."""
+        try:
+            return self.__own_child(keys, section)
+        except KeyError:
+            section[keys[-1]] = {}
+            self.__index_set(keys, section)
+            return self.__own(section[keys[-1]])
+
+    def delete(self, key: Key) -> None:
+        self.__detach()
 
-    def delete(self, key: str) -> None:
         try:
-            if "." not in key:
-                del self.__parsed_content[key]
-            else:
-                indexes = split_on_dot(key)
-                indexes_length = len(indexes)
-
-                parsed_content = self.__parsed_content
-                for index, key in enumerate(indexes):
-                    if index == indexes_length - 1:
-                        del parsed_content[key]
-                        break
-
-                    parsed_content = parsed_content[key]
-        except (KeyError, TypeError):
+            keys = to_key_path(key)
+            parsed_content = self.__parsed_content
+            for end in range(1, len(keys)):
+                parsed_content = self.__own_child(keys[:end], parsed_content)
+
+            del parsed_content[keys[-1]]
+        except (KeyError, IndexError, TypeError):
             raise KeyError(f"The specified key '{key}' to delete was not found.")
 
-    def has(self, search_key: str, wild: bool = False) -> bool:
+        self.__record_change(None)
+        self.__index_delete(keys, parsed_content)
+
+    def has(self, search_key: Key, wild: bool = False) -> bool:
         if wild:
-            return get_occurrence_of_key(self.__parsed_content, key=search_key) > 0
+            if isinstance(search_key, KeyPath):
+                search_key = ".".join(search_key)
+
+            # A single search is cheaper than finding every key, so
+            # that is only done once the file is searched again.
+            self.__wild_searches += 1
+            locations = self.__key_locations(build=self.__wild_searches > 1)
+            if locations is None:
+                return has_key(self.__parsed_content, search_key)
+
+            paths = locations.get(search_key, {})
+            return any(value is not None for value in paths.values())
+
+        index = self.__key_index()
+        if index is not None:
+            try:
+                keys = to_key_path(search_key)
+                # Only sections are indexed, so a key made of anything
+                # but names could still be an index into a list.
+                if keys in index:
+                    return True
+                if all(isinstance(key, str) for key in keys):
+                    return False
+            except TypeError:
+                pass
 
         try:
-            self.get(search_key)
+            self.peek(search_key)
             return True
         except (KeyError, ParsingError):
             return False
+
+
+def _set_in_index(index: dict, keys: tuple, value: Any, section: Any) -> Optional[dict]:
+    """
+    Record the new value of a key in the index of every key, or None
+    if a section was added or removed and the index has to be built
+    again. Rather than finding every key in the section, that is
+    left until the index is needed. The same goes for the items of
+    lists, since deleting one moves the items after it.
+    """
+    if (
+        isinstance(section, abc.MutableSequence)
+        or isinstance(value, abc.Mapping)
+        or isinstance(index.get(keys), abc.Mapping)
+        or (len(keys) > 1 and keys[:-1] not in index)
+    ):
+        return None
+
+    index[keys] = value
+    return index
+
+
+def _delete_from_index(index: dict, keys: tuple, section: Any) -> Optional[dict]:
+    if isinstance(section, abc.MutableSequence) or isinstance(
+        index.get(keys), abc.Mapping
+    ):
+        return None
+
+    index.pop(keys, None)
+    return index
+
+
+def _set_in_locations(
+    locations: dict, keys: tuple, value: Any, section: Any
+) -> Optional[dict]:
+    """
+    Record the new value of a key in the paths of every key name,
+    or None if they have to be found again, like `_set_in_index`.
+    """
+    paths = locations.get(keys[-1], {})
+    if (
+        _in_list(keys, section)
+        or isinstance(value, (dict, list))
+        or isinstance(paths.get(keys), (dict, list))
+        or (len(keys) > 1 and keys[:-1] not in locations.get(keys[-2], ()))
+    ):
+        return None
+
+    locations.setdefault(keys[-1], {})[keys] = value
+    return locations
+
+
+def _delete_from_locations(
+    locations: dict, keys: tuple, section: Any
+) -> Optional[dict]:
+    paths = locations.get(keys[-1], {})
+    if _in_list(keys, section) or isinstance(paths.get(keys), (dict, list)):
+        return None
+
+    paths.pop(keys, None)
+    return locations
+
+
+def _in_list(keys: tuple, section: Any) -> bool:
+    """
+    Whether a key is an item of a list, or inside of one, whose position
+    is part of its path and moves when an item before it is deleted.
+    """
+    return isinstance(section, list) or any(isinstance(key, int) for key in keys)
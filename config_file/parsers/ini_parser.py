@@ -1,14 +1,25 @@
 import configparser
 from io import StringIO
-from typing import Any, Type
+from typing import Any, Dict, Iterable, Optional, Type
 
-from .base_parser import BaseParser
+from config_file.key_path import Key
+from config_file.parsers.parse_value import parse_string, parse_value
+
+from .base_parser import BaseParser, Span
 
 
 class IniParser(BaseParser):
+    # The sections of strings the typed values were parsed from, see `dumps`.
+    __sources: dict = {}
+
     def __init__(self, file_contents: str):
         super().__init__(file_contents)
 
+    def __copy__(self) -> "IniParser":
+        parser = super().__copy__()
+        parser.__sources = self.__sources
+        return parser
+
     @property
     def decode_error(self) -> Type[Exception]:
         return configparser.Error
@@ -23,11 +34,91 @@ class IniParser(BaseParser):
         parser = configparser.ConfigParser()
         buffer = StringIO()
 
+        if self.uses_types:
+            # Values that are the same as when they were read are written
+            # back as they were, e.g. "1.50" instead of "1.5".
+            loaded_contents = {
+                name: {
+                    key: self.__ini_value(name, key, value)
+                    for key, value in section.items()
+                }
+                for name, section in loaded_contents.items()
+            }
+
         parser.read_dict(loaded_contents)
         parser.write(buffer)
 
         return buffer.getvalue()
 
+    def value_spans(self, contents: str) -> Optional[Dict[tuple, Span]]:
+        # This follows how configparser reads files with its default settings.
+        spans: Dict[tuple, Span] = {}
+        section = None
+        option = None
+        indent_level = 0
+        line_start = 0
+
+        # configparser only breaks lines on "\n", unlike `str.splitlines`.
+        for line in contents.split("\n"):
+            indent = len(line) - len(line.lstrip())
+            value_start = line_start + indent
+            value = line.strip()
+            line_start += len(line) + 1
+
+            if not value or value.startswith(("#", ";")):
+                continue
+
+            if option is not None and indent > indent_level:
+                # A continuation line of a multiline value.
+                if option in spans:
+                    spans[option] = (spans[option][0], value_start + len(value))
+                continue
+
+            indent_level = indent
+            match = configparser.ConfigParser.SECTCRE.match(value)
+            if match:
+                section = match.group("header")
+                option = None
+                continue
+
+            match = configparser.ConfigParser.OPTCRE.match(value)
+            if match and section is not None:
+                option = (section, match.group("option").rstrip().lower())
+                if section != configparser.DEFAULTSECT:
+                    spans[option] = (
+                        value_start + match.start("value"),
+                        value_start + len(value),
+                    )
+
+        return spans
+
+    def dumps_value(self, value: Any, indent: str) -> Optional[str]:
+        # Sections are added or replaced with a full dump, and values
+        # with a `%` are left for configparser to validate.
+        if type(value) is dict or "%" in str(value):
+            return None
+
+        if self.uses_types:
+            value = _ini_value(value)
+
+        return str(value).replace("\n", "\n\t")
+
+    def convert_types(self, parsed_content: dict) -> Optional[dict]:
+        # Every value is a string, and configparser writes any value back
+        # with `str`, so the converted values are written as they were read.
+        self.__sources = parsed_content
+        return parse_value(parsed_content)
+
+    def __ini_value(self, name: str, key: str, value: Any) -> Any:
+        """Write a typed value the way it was read, if it is unchanged."""
+        source = self.__sources.get(name, {}).get(key)
+        if isinstance(source, str) and source != value:
+            parsed = parse_string(source)
+            if type(parsed) is type(value) and parsed == value:
+                return source
+
+        return _ini_value(value)
+
     def __create_configparser_dict(self, parser: configparser.ConfigParser) -> dict:
         result = {}
         items = dict(parser.items())
@@ -37,8 +128,32 @@ class IniParser(BaseParser):
 
         return result
 
-    def get(self, search_key: str) -> Any:
-        retrieved_value = super().get(search_key)
-        return (
-            retrieved_value if type(retrieved_value) is dict else str(retrieved_value)
-        )
+    def get(self, search_key: Key) -> Any:
+        return self.__ini_type(super().get(search_key))
+
+    def peek(self, search_key: Key) -> Any:
+        return self.__ini_type(super().peek(search_key))
+
+    def get_many(self, search_keys: Iterable[Key]) -> Dict[Key, Any]:
+        return self.__ini_types(super().get_many(search_keys))
+
+    def peek_many(self, search_keys: Iterable[Key]) -> Dict[Key, Any]:
+        return self.__ini_types(super().peek_many(search_keys))
+
+    def __ini_type(self, value: Any) -> Any:
+        """Retrieve values as strings, like configparser, unless typed."""
+        if self.uses_types or type(value) is dict:
+            return value
+
+        return str(value)
+
+    def __ini_types(self, values: Dict[Key, Any]) -> Dict[Key, Any]:
+        if self.uses_types:
+            return values
+
+        return {key: self.__ini_type(value) for key, value in values.items()}
+
+
+def _ini_value(value: Any) -> Any:
+    """Write booleans the way they are parsed from INI files."""
+    return str(value).lower() if isinstance(value, bool) else value
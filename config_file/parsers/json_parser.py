@@ -1,7 +1,17 @@
 import json
-from typing import Type
+import re
+from typing import Any, Dict, Optional, Type
 
-from .base_parser import BaseParser
+from .base_parser import BaseParser, Span
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Reads strings and scalars, including the `NaN` and `Infinity`
+# constants, the same way json.loads does.
+DECODER = json.JSONDecoder()
+
+
+class DuplicateKeyError(ValueError):
+    """A JSON object has the same key more than once."""
 
 
 class JsonParser(BaseParser):
@@ -17,3 +27,78 @@ class JsonParser(BaseParser):
 
     def dumps(self, loaded_contents: dict) -> str:
         return json.dumps(loaded_contents, indent=4)
+
+    def value_spans(self, contents: str) -> Optional[Dict[tuple, Span]]:
+        spans: Dict[tuple, Span] = {}
+
+        try:
+            self.__scan(contents, _skip_whitespace(contents, 0), (), spans)
+        except DuplicateKeyError:
+            # Only the last of the duplicates is kept when parsing, so
+            # the spans of the keys inside of the others are misleading.
+            return None
+
+        return spans
+
+    def dumps_value(self, value: Any, indent: str) -> Optional[str]:
+        return json.dumps(value, indent=4).replace("\n", "\n" + indent)
+
+    def __scan(
+        self, contents: str, index: int, key: Optional[tuple], spans: Dict
+    ) -> int:
+        """
+        Find the end of the value that starts at index, recording the span
+        of every member of the objects in it.
+
+        Args:
+            contents: The valid JSON contents to scan.
+            index: Where the value starts.
+            key: The split up key of the value, or None if it is inside a list.
+            spans: Where to record the spans of the members.
+
+        Returns:
+            The index right after the value.
+        """
+        if contents[index] == "{":
+            members = set()
+            index = _skip_whitespace(contents, index + 1)
+
+            while contents[index] != "}":
+                member, index = DECODER.raw_decode(contents, index)
+                if member in members:
+                    raise DuplicateKeyError(member)
+                members.add(member)
+
+                # Skip past the colon separating the member and its value.
+                index = _skip_whitespace(contents, index) + 1
+                start = _skip_whitespace(contents, index)
+                member_key = None if key is None else key + (member,)
+                index = self.__scan(contents, start, member_key, spans)
+
+                if member_key is not None:
+                    spans[member_key] = (start, index)
+
+                index = _skip_whitespace(contents, index)
+                if contents[index] == ",":
+                    index = _skip_whitespace(contents, index + 1)
+
+            return index + 1
+
+        if contents[index] == "[":
+            index = _skip_whitespace(contents, index + 1)
+
+            while contents[index] != "]":
+                index = self.__scan(contents, index, None, spans)
+                index = _skip_whitespace(contents, index)
+                if contents[index] == ",":
+                    index = _skip_whitespace(contents, index + 1)
+
+            return index + 1
+
+        return DECODER.raw_decode(contents, index)[1]
+
+
+def _skip_whitespace(contents: str, index: int) -> int:
+    """Find where the whitespace starting at index ends."""
+    match = WHITESPACE.match(contents, index)
+    return match.end() if match else index
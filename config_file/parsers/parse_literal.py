@@ -0,0 +1,159 @@
+"""This module parses list and dict literals, like `ast.literal_eval`, but faster."""
+import ast
+import re
+from typing import Any, List, Tuple
+
+# Python can't parse literals nested any deeper either.
+MAX_DEPTH = 200
+
+# Every token of a literal, one group per kind of token. Anything else
+# that isn't whitespace is caught by the last group.
+_TOKENS = re.compile(
+    r"""
+    \s*(?:
+        ("[^"\\\r\n]*(?:\\.[^"\\\r\n]*)*"|'[^'\\\r\n]*(?:\\.[^'\\\r\n]*)*')
+      | (-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)(?![\w.])
+      | (True|False|None)\b
+      | ([\[\]{},:])
+      | (\S)
+    )
+    """,
+    re.VERBOSE | re.ASCII,
+)
+_LEADING_ZERO = re.compile(r"-?0\d")
+_WORDS = {"True": True, "False": False, "None": None}
+
+# What is expected to come next while scanning.
+_VALUE, _ITEM, _KEY, _COLON, _COMMA, _DONE = range(6)
+
+
+class _Unsupported(Exception):
+    """The literal uses syntax that is left to `ast.literal_eval`."""
+
+
+def parse_literal(text: str) -> Any:
+    """Parse a literal the same way `ast.literal_eval` would.
+
+    parse_literal('["a", "b", 3]') -> ['a', 'b', 3]
+    parse_literal("{'key': None}") -> {'key': None}
+    parse_literal("{'key': (1, 2)}") -> {'key': (1, 2)}
+
+    Lists and dicts of strings, numbers, booleans, and None are parsed
+    in a single scan of the text, without building up a syntax tree. Any
+    other syntax, such as tuples, sets, or prefixed strings, is left to
+    `ast.literal_eval`.
+
+    Args:
+        text: The literal to parse.
+
+    Raises:
+        ValueError: If the literal is nested more than MAX_DEPTH deep.
+        Exception: Whatever `ast.literal_eval` raises for invalid literals.
+
+    Returns:
+        The value of the literal.
+    """
+    try:
+        # Whitespace around the literal is only sometimes valid Python.
+        if text[:1].isspace() or text[-1:].isspace():
+            raise _Unsupported
+
+        return _scan(text)
+    except _Unsupported:
+        return ast.literal_eval(text)
+
+
+def _scan(text: str) -> Any:
+    # The lists and dicts that are being filled in around the innermost
+    # one, with the key of the value each dict is waiting for.
+    stack: List[Tuple[Any, Any]] = []
+    container: Any = None
+    key: Any = None
+    expected = _VALUE
+
+    for string, number, word, punctuation, _ in _TOKENS.findall(text):
+        if string:
+            # Escape sequences are rare enough to leave to Python.
+            value = ast.literal_eval(string) if "\\" in string else string[1:-1]
+        elif number:
+            value = _number(number)
+        elif word:
+            value = _WORDS[word]
+        elif punctuation == "," or punctuation == ":":
+            expected = _separate(container, punctuation, expected)
+            continue
+        elif punctuation == "[" or punctuation == "{":
+            stack.append((container, key))
+            container, expected = _open(len(stack), punctuation, expected)
+            continue
+        elif _closes(container, punctuation, expected):
+            value = container
+            container, key = stack.pop()
+            expected = _ITEM if type(container) is list else _VALUE
+        else:
+            raise _Unsupported
+
+        if expected == _KEY:
+            key = value
+            expected = _COLON
+        elif expected > _KEY:
+            raise _Unsupported
+        elif container is None:
+            result, expected = value, _DONE
+        elif type(container) is list:
+            container.append(value)
+            expected = _COMMA
+        else:
+            container[key] = value
+            expected = _COMMA
+
+    if expected != _DONE:
+        raise _Unsupported
+
+    return result
+
+
+def _number(token: str) -> Any:
+    if token.isdigit():
+        if token[0] == "0" and len(token) > 1:
+            raise _Unsupported
+        return int(token)
+
+    if _LEADING_ZERO.match(token):
+        raise _Unsupported
+
+    return int(token) if token[1:].isdigit() else float(token)
+
+
+def _open(depth: int, token: str, expected: int) -> Tuple[Any, int]:
+    """Start a list or dict, and find out what comes next."""
+    if expected != _VALUE and expected != _ITEM:
+        raise _Unsupported
+
+    if depth > MAX_DEPTH:
+        raise ValueError("The literal is nested too deeply to parse.")
+
+    return ([], _ITEM) if token == "[" else ({}, _KEY)
+
+
+def _separate(container: Any, token: str, expected: int) -> int:
+    """Check the comma or colon is expected, and find out what comes next."""
+    if token == ":" and expected == _COLON:
+        return _VALUE
+
+    if token == "," and expected == _COMMA:
+        return _ITEM if type(container) is list else _KEY
+
+    raise _Unsupported
+
+
+def _closes(container: Any, token: str, expected: int) -> bool:
+    """Check if the token closes the innermost list or dict."""
+    if type(container) is list:
+        return token == "]" and (expected == _ITEM or expected == _COMMA)
+
+    return (
+        container is not None
+        and token == "}"
+        and (expected == _KEY or expected == _COMMA)
+    )
@@ -1,7 +1,15 @@
 """This module allows you to parse a string into its native type."""
 import ast
 import re
-from typing import Any
+from typing import Any, Iterator, List, Tuple, Union
+
+from config_file.parsers.parse_literal import parse_literal
+
+# A float without its sign, e.g. "5.5" or ".5".
+FLOAT_PATTERN = re.compile(r"\d*\.\d+")
+
+# The types of values that are never parsed.
+_NATIVE_TYPES = frozenset([int, float, bool, type(None)])
 
 
 def parse_value(value: Any) -> Any:
@@ -20,6 +28,11 @@ def parse_value(value: Any) -> Any:
 
     parse_value("  [ [ [ [] ]] ]  ") -> [[[[]]]] (list)
 
+    Dicts and lists are parsed without recursing into them, so they
+    can be nested arbitrarily deep. A dict or list is copied when there
+    are strings inside of it, and returned as-is otherwise, since all
+    of the values inside of it already have their native types.
+
     Args:
         value: The value to parse.
 
@@ -29,36 +42,96 @@ def parse_value(value: Any) -> Any:
         Otherwise, it simply returns the original
         passed in value.
     """
-    if isinstance(value, dict):
-        parsed = {}
+    if isinstance(value, str):
+        return parse_string(value)
 
-        for item in value:
-            parsed[item] = parse_value(value[item])
+    if not isinstance(value, (dict, list)):
+        return value
 
-        return parsed
+    # The dicts and lists being parsed, from the outermost to the innermost,
+    # as [the original, its remaining items, its copy if a value inside of
+    # it changed, and the key of the dict or list being parsed inside of it].
+    stack: List[List[Any]] = [[value, _items(value), None, None]]
+
+    while True:
+        frame = stack[-1]
+
+        for key, item in frame[1]:
+            if type(item) in _NATIVE_TYPES:
+                continue
+
+            if isinstance(item, str):
+                _replace(frame, key, parse_string(item))
+            elif isinstance(item, (dict, list)) and item:
+                frame[3] = key
+                stack.append([item, _items(item), None, None])
+                break
+        else:
+            stack.pop()
+            parsed = frame[0] if frame[2] is None else frame[2]
+            if not stack:
+                return parsed
+
+            if parsed is not frame[0]:
+                _replace(stack[-1], stack[-1][3], parsed)
 
-    if isinstance(value, list):
-        parsed = []
 
-        for item in value:
-            parsed.append(parse_value(item))
+def _items(container: Union[dict, list]) -> Iterator[Tuple[Any, Any]]:
+    if isinstance(container, dict):
+        return iter(container.items())
 
-        return parsed
+    return enumerate(container)
 
-    if can_be_parsed_as_int(value):
-        return int(value.strip()) if isinstance(value, str) else int(value)
 
-    if can_be_parsed_as_float(value):
-        return float(value.strip()) if isinstance(value, str) else float(value)
+def _replace(frame: list, key: Any, parsed: Any) -> None:
+    """Replace a value in the copy of a dict or list, copying it first."""
+    if frame[2] is None:
+        frame[2] = dict(frame[0]) if isinstance(frame[0], dict) else list(frame[0])
 
-    if can_be_parsed_as_bool(value):
-        return bool(value) if isinstance(value, bool) else bool(strtobool(value))
+    frame[2][key] = parsed
 
-    if can_be_parsed_as_dict(value):
-        return parse_value(ast.literal_eval(value.strip()))
 
-    if can_be_parsed_as_list(value):
-        return parse_value(ast.literal_eval(value.strip()))
+def parse_string(value: str) -> Any:
+    """Parse a string into its native type, see `parse_value`.
+
+    This gives the same results as checking it with every `can_be_parsed_as_*`
+    function in turn, but only looks at the string once. Which type it could
+    be is decided by its first character, and a dict or list is evaluated
+    only once.
+
+    Args:
+        value: The string to parse.
+
+    Returns:
+        The parsed value, or the original string if it could not be parsed.
+    """
+    stripped = value.strip()
+    if not stripped:
+        return value
+
+    first = stripped[0]
+
+    if first.isdigit() or first == "-" or first == ".":
+        unsigned = stripped[1:] if first == "-" else stripped
+        if unsigned.isdigit():
+            return int(stripped)
+        if FLOAT_PATTERN.fullmatch(unsigned):
+            return float(stripped)
+        return value
+
+    if first in "tTfF":
+        lowered = stripped.lower()
+        if lowered == "true" or lowered == "false":
+            return lowered == "true"
+        return value
+
+    if (first == "{" and stripped[-1] == "}") or (first == "[" and stripped[-1] == "]"):
+        try:
+            literal = parse_literal(stripped)
+        except Exception:
+            return value
+
+        return parse_value(literal)
 
     return value
 
@@ -106,8 +179,6 @@ def can_be_parsed_as_float(value: Any) -> bool:
     Returns:
         True if the value can be parsed as a float. False otherwise.
     """
-    FLOAT_REGEX = r"^\d*\.\d+$"
-
     if isinstance(value, float):
         return True
 
@@ -119,7 +190,7 @@ def can_be_parsed_as_float(value: Any) -> bool:
     if value.startswith("-"):
         value = value[1:]
 
-    return bool(re.match(FLOAT_REGEX, value))
+    return bool(FLOAT_PATTERN.fullmatch(value))
 
 
 def can_be_parsed_as_bool(value: Any) -> bool:
@@ -188,7 +259,7 @@ def can_be_parsed_as_dict(value: Any) -> bool:
 
     value = value.strip()
 
-    if value[0] == "{" and value[-1] == "}":
+    if value.startswith("{") and value.endswith("}"):
         try:
             ast.literal_eval(value)
             return True
@@ -223,7 +294,7 @@ def can_be_parsed_as_list(value: Any) -> bool:
 
     value = value.strip()
 
-    if value[0] == "[" and value[-1] == "]":
+    if value.startswith("[") and value.endswith("]"):
         try:
             ast.literal_eval(value)
             return True
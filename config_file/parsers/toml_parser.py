@@ -20,6 +20,15 @@ class TomlParser(BaseParser):
 
         return ParseError
 
+    def can_copy_sections(self, parsed_content: dict) -> bool:
+        from tomlkit.container import OutOfOrderTableProxy
+
+        # A table split up across the file is modified through a proxy
+        # to the parts of it, which a copy of the proxy still modifies.
+        return not any(
+            isinstance(value, OutOfOrderTableProxy) for value in parsed_content.values()
+        )
+
     def loads(self, contents: str) -> dict:
         import tomlkit
 
@@ -0,0 +1,141 @@
+"""
+Snapshots of parsed configuration files stored on disk.
+
+Parsing large YAML or TOML files is slow compared to unpickling the
+result of having parsed them. A snapshot is the pickled parsed content
+of a file, stored next to the file or in a cache directory, that is
+reused as long as the contents of the file are unchanged.
+
+Snapshots are unpickled, so only keep them in locations no one else
+can write to.
+"""
+import hashlib
+import os
+import pickle
+import sys
+from contextlib import suppress
+from importlib import import_module
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Optional, Tuple, Union
+
+from config_file.config_file_path import ConfigFilePath
+from config_file.parsers.abstract_parser import AbstractParser
+
+# Bump whenever the layout of a snapshot changes.
+SNAPSHOT_FORMAT = 1
+
+
+def load_parser(
+    path: ConfigFilePath, snapshot_dir: Union[str, Path, None] = None
+) -> AbstractParser:
+    """
+    Retrieve a parser for the file at path, using its snapshot
+    instead of parsing the file when the snapshot is up to date.
+
+    If there is no usable snapshot, because it is missing, corrupt,
+    or made for different contents or by different versions of
+    Python or the parsing library, the file is parsed and a new
+    snapshot is written. Failing to write the snapshot is not an error.
+
+    Args:
+        path: The path of the file to parse.
+        snapshot_dir: The directory to keep snapshots in. Defaults
+            to storing the snapshot as a hidden file next to the file.
+
+    Raises:
+        ValueError: If the extension of the file is not recognized.
+        ParsingError: If the file could not be parsed.
+
+    Returns:
+        A parser for the file.
+    """
+    parser_class = path.parser_class
+    contents = path.contents
+    digest = hashlib.blake2b(contents.encode("utf-8"), digest_size=16).hexdigest()
+    snapshot_path = _snapshot_path(path, digest, snapshot_dir)
+    header = (
+        SNAPSHOT_FORMAT,
+        tuple(sys.version_info[:2]),
+        f"{parser_class.__module__}.{parser_class.__qualname__}",
+        digest,
+    )
+
+    parsed_content = _read_snapshot(snapshot_path, header)
+    if parsed_content is not None:
+        return parser_class.from_parsed_content(contents, parsed_content, shared=False)
+
+    # The parser that parsed the file handed out its parsed content,
+    # so it is used by a new parser that can keep track of changes.
+    parsed_content = parser_class(contents).parsed_content
+    _write_snapshot(snapshot_path, header, parsed_content)
+    return parser_class.from_parsed_content(contents, parsed_content, shared=False)
+
+
+def _snapshot_path(
+    path: ConfigFilePath, digest: str, snapshot_dir: Union[str, Path, None]
+) -> Path:
+    if snapshot_dir is None:
+        return path.parent / f".{path.name}.snapshot"
+
+    return Path(snapshot_dir).expanduser() / f"{digest}.{path.extension}.snapshot"
+
+
+def _library_version(parsed_content: Any) -> Optional[Tuple[str, str]]:
+    """
+    Find the name and version of the library that created the parsed content.
+
+    e.g. a tomlkit.toml_document.TOMLDocument -> ("tomlkit", "0.12.2")
+    """
+    module_name = type(parsed_content).__module__
+
+    while module_name and module_name != "builtins":
+        version = getattr(sys.modules.get(module_name), "__version__", None)
+        if isinstance(version, str):
+            return module_name, version
+
+        module_name = module_name.rpartition(".")[0]
+
+    return None
+
+
+def _read_snapshot(snapshot_path: Path, header: tuple) -> Optional[dict]:
+    try:
+        with open(snapshot_path, "rb") as snapshot:
+            if pickle.load(snapshot) != header:
+                return None
+
+            library = pickle.load(snapshot)
+            if library is not None:
+                name, version = library
+                if getattr(import_module(name), "__version__", None) != version:
+                    return None
+
+            return pickle.load(snapshot)
+    except Exception:
+        # A missing, truncated, or otherwise unreadable snapshot
+        # just means the file has to be parsed again.
+        return None
+
+
+def _write_snapshot(snapshot_path: Path, header: tuple, parsed_content: dict) -> None:
+    temporary_path = None
+
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so a concurrent reader
+        # never sees a partially written snapshot.
+        with NamedTemporaryFile(
+            "wb", dir=snapshot_path.parent, prefix=".snapshot-", delete=False
+        ) as snapshot:
+            temporary_path = snapshot.name
+            pickle.dump(header, snapshot, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(_library_version(parsed_content), snapshot)
+            pickle.dump(parsed_content, snapshot, pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temporary_path, snapshot_path)
+    except Exception:
+        if temporary_path is not None:
+            with suppress(OSError):
+                os.unlink(temporary_path)
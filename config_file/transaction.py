@@ -0,0 +1,218 @@
+"""Changes to a ConfigFile that are applied all at once, or not at all."""
+from collections import abc
+from contextlib import suppress
+from typing import Any, Callable, Optional
+
+from config_file.changes import DELETE, SET, has_nested_changes, trie_node
+from config_file.key_path import Key, KeyPath, to_key_path
+from config_file.parsers.abstract_parser import AbstractParser
+from config_file.utils import Default
+
+# The value of a key that does not exist.
+_MISSING: Any = object()
+
+
+class Transaction:
+    """
+    Changes to a ConfigFile that are kept to the side until they are
+    committed, see `ConfigFile.transaction`.
+
+    The changes are kept as a trie of the keys that changed, so nothing
+    is copied and discarding them costs nothing. Retrieving keys from
+    the transaction sees the changes made so far, on top of the file.
+
+    Args:
+        parser: The parser of the ConfigFile to change.
+    """
+
+    def __init__(self, parser: AbstractParser) -> None:
+        self.__parser = parser
+        self.__changes: dict = {}
+
+    def get(self, key: Key, default: Any = Default(None)) -> Any:
+        """
+        Retrieve the value a key has with the changes made so far.
+
+        Sections with changes in them are returned as copies.
+
+        Args:
+            key: The key to retrieve.
+            default: The value to return if the key does not exist.
+
+        Raises:
+            KeyError: If the key does not exist and no default was given.
+
+        Returns:
+            The value of the key.
+        """
+        value = self.__lookup(to_key_path(key), self.__parser.get)
+        if value is not _MISSING:
+            return value
+
+        if isinstance(default, Default) and default.value is None:
+            raise KeyError(f"cannot `get` {key} because it does not exist.")
+
+        return default
+
+    def has(self, key: Key) -> bool:
+        """Check if a key exists with the changes made so far."""
+        return self.__lookup(to_key_path(key)) is not _MISSING
+
+    def set(self, key: Key, value: Any) -> None:
+        """
+        Set the value of a key when the transaction is committed,
+        creating it and the sections leading to it if needed.
+
+        Args:
+            key: The key to set.
+            value: The value to set the key to.
+
+        Raises:
+            TypeError: If one of the sections leading to the key
+                is a value that keys can not be set in.
+            IndexError: If one of the keys is past the end of a list.
+        """
+        keys = to_key_path(key)
+        for end in range(1, len(keys)):
+            section = self.__lookup(keys[:end])
+            if section is _MISSING:
+                break
+
+            if not _can_set_in(section, keys[end]):
+                raise TypeError(
+                    f"cannot `set` {key} because {keys[end - 1]} is not a section."
+                )
+
+            if isinstance(section, abc.MutableSequence) and not (
+                -len(section) <= keys[end] < len(section)
+            ):
+                raise IndexError(
+                    f"cannot `set` {key} because {keys[end]} is past "
+                    f"the end of {keys[end - 1]}."
+                )
+
+        node = trie_node(self.__changes, keys)
+        node.clear()
+        node[SET] = value
+
+    def delete(self, key: Key) -> None:
+        """
+        Delete a section or key when the transaction is committed.
+
+        Args:
+            key: The key to delete.
+
+        Raises:
+            KeyError: If the key does not exist.
+        """
+        keys = to_key_path(key)
+        if self.__lookup(keys) is _MISSING:
+            raise KeyError(f"The specified key '{key}' to delete was not found.")
+
+        node = trie_node(self.__changes, keys)
+        node.clear()
+        node[DELETE] = True
+
+    def commit(self) -> None:
+        """
+        Apply the changes to the ConfigFile, visiting every section once.
+
+        The changes are checked against the ConfigFile as it is now before
+        any of them is applied, since it may have changed since they were
+        made. If one of them can not be applied, none of them are.
+
+        Raises:
+            IndexError: If a key is set past the end of a list.
+            TypeError: If a key is set in a value that is neither
+                a section nor a list.
+        """
+        changes, self.__changes = self.__changes, {}
+        self.__parser.apply_changes(changes)
+
+    def rollback(self) -> None:
+        """Discard the changes made so far."""
+        self.__changes = {}
+
+    def __lookup(self, keys: tuple, retrieve: Optional[Callable] = None) -> Any:
+        """
+        Find the value of a key with the changes applied, or _MISSING.
+
+        Keys in the file are retrieved with retrieve, which defaults to
+        `peek` for when the value is only read and not handed out.
+        """
+        node: Optional[dict] = self.__changes
+        # The key in the file to look up, for as long as nothing replaced it.
+        unchanged: Optional[int] = 0
+        value = _MISSING
+
+        for depth, name in enumerate(keys, 1):
+            node = node.get(name) if node is not None else None
+
+            if node is not None and SET in node:
+                value, unchanged = node[SET], None
+            elif node is not None and DELETE in node:
+                value, unchanged = _MISSING, None
+            elif unchanged is not None:
+                unchanged = depth
+            else:
+                value = _subscript(value, name)
+
+        if unchanged is not None:
+            try:
+                value = (retrieve or self.__parser.peek)(KeyPath(keys[:unchanged]))
+            except KeyError:
+                value = _MISSING
+
+        if node is not None and has_nested_changes(node):
+            value = _with_changes(value, node)
+
+        return value
+
+
+def _can_set_in(section: Any, name: Any) -> bool:
+    if isinstance(section, abc.MutableSequence):
+        return isinstance(name, int)
+
+    return isinstance(section, abc.MutableMapping)
+
+
+def _subscript(value: Any, name: Any) -> Any:
+    if value is _MISSING:
+        return _MISSING
+
+    try:
+        return value[name]
+    except (KeyError, IndexError, TypeError):
+        return _MISSING
+
+
+def _with_changes(section: Any, node: dict) -> Any:
+    """Copy a section with the changes of the keys inside of it applied."""
+    if section is _MISSING:
+        section = {}
+    elif isinstance(section, abc.Mapping):
+        section = dict(section)
+    else:
+        section = list(section)
+
+    for name, child in node.items():
+        if name is SET or name is DELETE:
+            continue
+
+        if SET in child:
+            value = child[SET]
+        elif DELETE in child:
+            value = _MISSING
+        else:
+            value = _subscript(section, name)
+
+        if has_nested_changes(child):
+            value = _with_changes(value, child)
+
+        if value is not _MISSING:
+            section[name] = value
+        elif DELETE in child:
+            with suppress(KeyError, IndexError):
+                del section[name]
+
+    return section
@@ -0,0 +1,143 @@
+"""A cache of the typed values of keys, see `ConfigFile.get(parse_types=True)`."""
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Tuple
+
+# Marks the typed value of a key in the trie of cached keys.
+_VALUE = object()
+
+
+class TypedCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    invalidations: int
+    currsize: int
+
+
+class TypedValueCache:
+    """
+    The typed values of the keys of a file, kept until the file changes.
+
+    Values are kept in a trie of their split up keys, so that changing
+    a key only forgets the values of the key, the sections leading to
+    it, and the keys inside of it, and everything else is kept.
+
+    Every change to the file changes its version, see `ConfigFile.version`.
+    Changes that are reported with `invalidate` only forget the values
+    they affect; a version that changed any other way forgets every value.
+    """
+
+    def __init__(self) -> None:
+        self.__trie: dict = {}
+        self.__version: Optional[int] = None
+        self.__hits = 0
+        self.__misses = 0
+        self.__invalidations = 0
+        self.__size = 0
+
+    def get(
+        self, keys: Tuple[Any, ...], version: Optional[int], compute: Callable[[], Any]
+    ) -> Any:
+        """
+        Retrieve the typed value of a key, computing it if it is not cached.
+
+        Args:
+            keys: The split up key.
+            version: The current version of the file, or None if it has
+                none, in which case nothing is cached.
+            compute: Computes the typed value of the key.
+
+        Raises:
+            KeyError: If compute raises it, in which case nothing is cached.
+
+        Returns:
+            The typed value of the key.
+        """
+        if version != self.__version or version is None:
+            self.clear()
+            self.__version = version
+
+        node = _find(self.__trie, keys)
+        if node is not None and _VALUE in node:
+            self.__hits += 1
+            return node[_VALUE]
+
+        self.__misses += 1
+        value = compute()
+        if version is not None:
+            node = self.__trie
+            for name in keys:
+                node = node.setdefault(name, {})
+
+            self.__size += _VALUE not in node
+            node[_VALUE] = value
+
+        return value
+
+    def invalidate(
+        self,
+        changed: Iterable[Tuple[Any, ...]],
+        before: Optional[int],
+        after: Optional[int],
+    ) -> None:
+        """
+        Forget the typed values a change affected.
+
+        Args:
+            changed: The split up keys that were set or deleted.
+            before: The version of the file before the change.
+            after: The version of the file after the change.
+        """
+        if before is None or before != self.__version:
+            # Not every change since the values were cached is known.
+            return
+
+        for keys in changed:
+            # The sections leading to the key changed with it.
+            node = self.__trie
+            for name in keys[:-1]:
+                self.__forget(node.pop(_VALUE, _VALUE))
+                child = node.get(name)
+                if child is None:
+                    break
+                node = child
+            else:
+                self.__forget(node.pop(_VALUE, _VALUE))
+
+                # And so did every key inside of it.
+                removed = [node.pop(keys[-1], {})]
+                while removed:
+                    for name, child in removed.pop().items():
+                        if name is _VALUE:
+                            self.__forget(child)
+                        else:
+                            removed.append(child)
+
+        self.__version = after
+
+    def __forget(self, value: Any) -> None:
+        if value is not _VALUE:
+            self.__size -= 1
+            self.__invalidations += 1
+
+    def info(self) -> TypedCacheInfo:
+        """Report the statistics of the cache."""
+        return TypedCacheInfo(
+            self.__hits, self.__misses, self.__invalidations, self.__size
+        )
+
+    def clear(self) -> None:
+        """Forget every typed value."""
+        self.__invalidations += self.__size
+        self.__trie = {}
+        self.__size = 0
+
+
+def _find(trie: dict, keys: Iterable[Any]) -> Optional[dict]:
+    """Find the node of a key in a trie, or None if it has none."""
+    node = trie
+    for name in keys:
+        child = node.get(name)
+        if child is None:
+            return None
+        node = child
+
+    return node
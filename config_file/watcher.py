@@ -0,0 +1,213 @@
+"""Reload configuration files when they change on disk."""
+import logging
+from threading import Event, Lock, Thread, current_thread
+from time import monotonic
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from config_file.config_file_path import ConfigFilePath
+
+if TYPE_CHECKING:  # pragma: no cover
+    from config_file.config_file import ConfigFile
+
+logger = logging.getLogger(__name__)
+
+Callback = Callable[["ConfigFile"], None]
+Fingerprint = Optional[Tuple[int, int, int, int]]
+
+
+class _Watch:
+    """The state of a single watched ConfigFile."""
+
+    def __init__(self, config: "ConfigFile") -> None:
+        self.config = config
+        self.path = ConfigFilePath(config.path)
+        self.callbacks: List[Callback] = []
+        self.fingerprint = _fingerprint(self.path)
+        self.pending = self.fingerprint
+        self.changed_at = 0.0
+
+
+def _fingerprint(path: ConfigFilePath) -> Fingerprint:
+    try:
+        return path.fingerprint()
+    except OSError:
+        return None
+
+
+class ConfigWatcher:
+    """
+    Watch ConfigFiles and reload them when their file changes.
+
+    Every poll stats each watched file once and compares its device,
+    inode, modification time, and size to when it was last loaded.
+    A file is only reloaded once it has stopped changing for the debounce
+    period, so an editor saving a file in several steps causes a single
+    reload. Files written by the ConfigFile itself, with `save()` or
+    `asave()`, are not reloaded. A ConfigFile with unsaved changes, see
+    `ConfigFile.is_dirty`, is not reloaded either, since that would
+    discard them, until it is saved, which overwrites the changes on
+    disk, or it no longer has any.
+
+    Polling can be done in a background thread with `start()`, or
+    by calling `poll()` from your own loop. Files are reloaded, and
+    callbacks called, on the thread that polls. ConfigFiles are not
+    thread-safe, so while they are polled in the background thread
+    they must not be used from other threads, other than through
+    what the callbacks hand over to them, e.g. a `snapshot()`. To use
+    them from your own thread, call `poll()` from that thread instead.
+
+    Args:
+        interval: How many seconds the background thread waits between polls.
+        debounce: How many seconds a file must be unchanged before reloading it.
+    """
+
+    def __init__(self, interval: float = 1.0, debounce: float = 0.5) -> None:
+        self.interval = interval
+        self.debounce = debounce
+        self.__watches: Dict[int, _Watch] = {}
+        self.__lock = Lock()
+        self.__stopped = Event()
+        self.__thread: Optional[Thread] = None
+
+    def watch(self, config: "ConfigFile", callback: Callback) -> None:
+        """
+        Call callback with the config every time it is reloaded.
+
+        Changes made to the file before it is watched are not reported.
+
+        Args:
+            config: The ConfigFile to watch.
+            callback: The function to call after reloading the config.
+        """
+        with self.__lock:
+            watch = self.__watches.get(id(config))
+            if watch is None:
+                watch = self.__watches[id(config)] = _Watch(config)
+
+            watch.callbacks.append(callback)
+
+    def unwatch(
+        self, config: "ConfigFile", callback: Optional[Callback] = None
+    ) -> None:
+        """
+        Stop calling callback when config is reloaded.
+
+        Args:
+            config: The ConfigFile to stop watching.
+            callback: The callback to remove. Defaults to removing all of
+                them, which stops watching the ConfigFile.
+        """
+        with self.__lock:
+            watch = self.__watches.get(id(config))
+            if watch is None:
+                return
+
+            if callback is not None and callback in watch.callbacks:
+                watch.callbacks.remove(callback)
+
+            if callback is None or not watch.callbacks:
+                del self.__watches[id(config)]
+
+    def poll(self) -> List["ConfigFile"]:
+        """
+        Check every watched file once, reloading the ones that changed.
+
+        Returns:
+            The ConfigFiles that were reloaded.
+        """
+        with self.__lock:
+            watches = list(self.__watches.values())
+
+        reloaded = []
+        for watch in watches:
+            if self.__check(watch):
+                reloaded.append(watch.config)
+
+        return reloaded
+
+    def __check(self, watch: _Watch) -> bool:
+        now = monotonic()
+        fingerprint = _fingerprint(watch.path)
+
+        if fingerprint != watch.pending:
+            watch.pending = fingerprint
+            watch.changed_at = now
+
+        if (
+            fingerprint == watch.fingerprint
+            or fingerprint is None
+            or now - watch.changed_at < self.debounce
+        ):
+            return False
+
+        if fingerprint == watch.config.saved_fingerprint:
+            # The ConfigFile wrote the file itself, so it is up to date.
+            watch.fingerprint = fingerprint
+            return False
+
+        if watch.config.is_dirty:
+            # Check again on the next poll, once the changes may be saved.
+            return False
+
+        try:
+            watch.config.reload()
+        except Exception:
+            # Most likely the file is invalid while it is being edited. Keep
+            # the current contents and try again once the file changes again.
+            logger.exception("Unable to reload %s", watch.path)
+            watch.fingerprint = fingerprint
+            return False
+
+        watch.fingerprint = fingerprint
+        for callback in list(watch.callbacks):
+            try:
+                callback(watch.config)
+            except Exception:
+                logger.exception("Callback for %s failed", watch.path)
+
+        return True
+
+    def start(self) -> None:
+        """Start polling in a background thread, if it is not already."""
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+
+        self.__stopped.clear()
+        self.__thread = Thread(target=self.__run, name="ConfigWatcher", daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Stop polling in the background thread and wait for it to finish."""
+        self.__stopped.set()
+
+        if self.__thread is not None and self.__thread is not current_thread():
+            self.__thread.join()
+
+        self.__thread = None
+
+    def __run(self) -> None:
+        while not self.__stopped.wait(self.interval):
+            self.poll()
+
+    def __enter__(self) -> "ConfigWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+_default_watcher: Optional[ConfigWatcher] = None
+_default_watcher_lock = Lock()
+
+
+def default_watcher() -> ConfigWatcher:
+    """The watcher used by `ConfigFile.watch`, started on first use."""
+    global _default_watcher
+
+    with _default_watcher_lock:
+        if _default_watcher is None:
+            _default_watcher = ConfigWatcher()
+        _default_watcher.start()
+
+    return _default_watcher
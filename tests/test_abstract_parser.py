@@ -1,5 +1,6 @@
 import pytest
 
+from config_file.key_path import Key
 from config_file.parsers.abstract_parser import AbstractParser
 from config_file.parsers.base_parser import BaseParser
 
@@ -23,7 +24,7 @@ class ConcreteAbstractParser(AbstractParser):
     def delete(self, section_key):
         super().delete(section_key)
 
-    def has(self, section_key: str, wild: bool = False):
+    def has(self, section_key: Key, wild: bool = False):
         super().has(section_key)
 
     def __str__(self):
@@ -83,3 +84,16 @@ def test_that_abstract_and_base_parser_raises_not_implemented_errors(function, a
             function()
         else:
             function(*args)
+
+
+def test_from_parsed_content_parses_the_file_again_by_default():
+    """
+    config_file.abstract_parser.AbstractParser.from_parsed_content
+
+    Ensure that parsers that can not reuse parsed content
+    are created from the file contents instead.
+    """
+    parser = ConcreteAbstractParser.from_parsed_content("contents", {"a": 1})
+
+    assert isinstance(parser, ConcreteAbstractParser)
+    assert parser.file_contents == "contents"
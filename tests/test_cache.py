@@ -0,0 +1,159 @@
+import os
+
+import pytest
+
+from config_file.cache import ParsedDocumentCache, document_cache
+from config_file.config_file import ConfigFile
+from config_file.config_file_path import ConfigFilePath
+
+SUPPORTED_FILE_TYPES = ["ini", "json", "yaml", "toml"]
+
+
+@pytest.fixture(autouse=True)
+def clear_document_cache():
+    document_cache.clear()
+    yield
+    document_cache.clear()
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_cache_only_parses_an_unchanged_file_once(template_file, file_type):
+    """
+    config_file.cache.ParsedDocumentCache.load
+
+    Ensure that loading the same unchanged file twice
+    is a miss followed by a hit.
+    """
+    cache = ParsedDocumentCache()
+    path = ConfigFilePath(template_file(file_type))
+
+    first = cache.load(path)
+    second = cache.load(path)
+
+    assert str(first) == str(second)
+    assert cache.info()[:3] == (1, 1, 0)
+    assert cache.info().currsize == 1
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_cache_handoff_is_copy_on_write(template_file, file_type):
+    """
+    config_file.cache.ParsedDocumentCache.load
+
+    Ensure that modifying one parser handed out by the cache
+    does not change what other parsers or later loads see.
+    """
+    cache = ParsedDocumentCache()
+    path = ConfigFilePath(template_file(file_type))
+
+    first = cache.load(path)
+    second = cache.load(path)
+    first.set("header_one.number_key", 25)
+    del first.parsed_content["header_two"]
+
+    assert second.has("header_two")
+    assert str(second.get("header_one.number_key")) == "0"
+    assert str(cache.load(path).get("header_one.number_key")) == "0"
+
+
+def test_cache_misses_when_the_file_changes(template_file):
+    """
+    config_file.cache.ParsedDocumentCache.load
+
+    Ensure that a file that changed on disk is parsed again.
+    """
+    cache = ParsedDocumentCache()
+    path = ConfigFilePath(template_file("json"))
+    cache.load(path)
+
+    path.write_text('{"header_one": {"number_key": 1}}')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert cache.load(path).get("header_one.number_key") == 1
+    assert cache.info().misses == 2
+
+
+def test_cache_evicts_the_least_recently_used_file(template_file):
+    """
+    config_file.cache.ParsedDocumentCache.load
+
+    Ensure that the cache never holds more than maxsize files
+    and evicts the least recently used one first.
+    """
+    cache = ParsedDocumentCache(maxsize=2)
+    ini, json, toml = (
+        ConfigFilePath(template_file(t)) for t in ("ini", "json", "toml")
+    )
+
+    cache.load(ini)
+    cache.load(json)
+    cache.load(ini)
+    cache.load(toml)
+    cache.load(ini)
+
+    assert cache.info() == (2, 3, 1, 2, 2)
+
+
+def test_config_file_can_use_the_document_cache(template_file):
+    """
+    config_file.config_file.ConfigFile.__init__
+
+    Ensure that ConfigFiles created with cache=True share the
+    parsed file through the document cache without seeing
+    each other's changes.
+    """
+    path = template_file("toml")
+
+    first = ConfigFile(path, cache=True)
+    second = ConfigFile(path, cache=True)
+    first["header_one"] = {}
+
+    assert document_cache.info()[:2] == (1, 1)
+    assert second.get("header_one.number_key") == 0
+
+
+def test_typed_config_files_share_unconverted_sections(tmp_file):
+    """
+    config_file.parsers.base_parser.BaseParser.use_types
+
+    Ensure that typed ConfigFiles created with cache=True don't see
+    each other's changes to the sections that weren't converted.
+    """
+    path = tmp_file("typed.ini", "[names]\nfirst = a\n\n[numbers]\none = 1\n")
+
+    first = ConfigFile(path, cache=True, typed=True)
+    second = ConfigFile(path, cache=True, typed=True)
+    first.set("names.first", "b")
+    first.set("numbers.one", 2)
+
+    assert second.get("names.first") == "a"
+    assert second.get("numbers.one") == 1
+    assert first.get("names.first") == "b"
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_sections_from_cached_files_are_not_shared(template_file, file_type):
+    """
+    config_file.config_file.ConfigFile.get
+
+    Ensure that modifying the sections retrieved from a ConfigFile
+    created with cache=True changes neither the document cache nor
+    any other ConfigFile created with cache=True for the same file.
+    """
+    path = template_file(file_type)
+
+    first = ConfigFile(path, cache=True)
+    second = ConfigFile(path, cache=True)
+    first.get("header_one")["number_key"] = 25
+    first.get_many(["header_two"])["header_two"]["str_key"] = "leak"
+    first["header_two"]["new_key"] = "leak"
+    del first["header_one"]["number_key"]
+    third = ConfigFile(path, cache=True)
+
+    for config in (second, third):
+        assert str(config.peek("header_one.number_key")) == "0"
+        assert "leak" not in str(config.peek("header_two.str_key"))
+        assert not config.has("header_two.new_key")
+        assert not config.is_dirty
+    assert first.peek("header_one.number_key", default=None) is None
@@ -1,12 +1,16 @@
+import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Tuple
+from unittest.mock import patch
 
 import pytest
 
 from config_file.config_file import ConfigFile
 from config_file.config_file_path import ConfigFilePath
-from config_file.exceptions import ParsingError
+from config_file.exceptions import MissingKeysError, ParsingError
+from config_file.key_path import KeyPath
 from config_file.parsers.abstract_parser import AbstractParser
 from config_file.parsers.ini_parser import IniParser
 
@@ -113,6 +117,53 @@ def test_config_file_raises_error_if_path_is_directory():
         ConfigFile(".")
 
 
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_lazy_config_file_defers_parsing_until_first_access(template_file, file_type):
+    """
+    config_file.config_file.ConfigFile.__init__
+
+    Ensure that a lazy ConfigFile does not parse the file in its
+    constructor, so a malformed file only raises on first access.
+    """
+    config = ConfigFile(template_file(file_type, template_name="invalid"), lazy=True)
+
+    assert not config.is_parsed
+    assert config.parsed_at is None
+    assert config.parse_duration is None
+
+    with pytest.raises(ParsingError):
+        config.get("header_one")
+
+
+def test_lazy_config_file_records_when_it_was_parsed(templated_config_file):
+    """
+    config_file.config_file.ConfigFile.parsed_at
+    config_file.config_file.ConfigFile.parse_duration
+
+    Ensure that the first access of a lazy ConfigFile parses
+    the file and records when that happened and how long it took.
+    """
+    config = ConfigFile(templated_config_file().path, lazy=True)
+
+    assert config.has("header_one.number_key")
+    assert config.is_parsed
+    assert config.parsed_at is not None
+    assert config.parse_duration >= 0
+
+
+def test_config_file_is_parsed_eagerly_by_default(templated_config_file):
+    """
+    config_file.config_file.ConfigFile.__init__
+
+    Ensure that a ConfigFile parses its file in the constructor
+    unless it is lazy.
+    """
+    config = templated_config_file()
+
+    assert config.is_parsed
+    assert config.parsed_at is not None
+
+
 @pytest.mark.parametrize(
     "key, value",
     [
@@ -157,6 +208,155 @@ def test_config_file_can_save(template_and_config_file):
     assert str(config) == template_file.read_text()
 
 
+def test_save_does_nothing_without_changes(template_and_config_file):
+    """
+    config_file.config_file.ConfigFile.save
+
+    Ensure that saving a ConfigFile that has not been
+    changed does not write the file.
+    """
+    template_file, config = template_and_config_file()
+    template_file.write_text("changed on disk")
+
+    assert not config.is_dirty
+    config.save()
+
+    assert template_file.read_text() == "changed on disk"
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda config: config.set("header_one.number_key", 1),
+        lambda config: config.delete("header_one.number_key"),
+        lambda config: config.__setitem__("header_one", {}),
+        lambda config: config.__delitem__("header_one"),
+    ],
+)
+def test_changes_make_the_config_file_dirty_until_saved(templated_config_file, change):
+    """
+    config_file.config_file.ConfigFile.is_dirty
+
+    Ensure that changing the ConfigFile makes it dirty
+    and saving it makes it clean again.
+    """
+    config = templated_config_file()
+
+    change(config)
+    assert config.is_dirty
+
+    config.save()
+    assert not config.is_dirty
+
+
+@pytest.mark.parametrize(
+    "file_name, contents, expected",
+    [
+        (
+            "compact.json",
+            '{"header_one": {"number_key": 0}, "other": [1, 2]}\n',
+            '{"header_one": {"number_key": 25}, "other": [1, 2]}\n',
+        ),
+        (
+            "comments.ini",
+            "; comment\n[header_one]\nNumber_Key=0  \n[other]\nkey: 1\n",
+            "; comment\n[header_one]\nNumber_Key=25  \n[other]\nkey: 1\n",
+        ),
+    ],
+)
+def test_save_only_rewrites_changed_values(tmp_file, file_name, contents, expected):
+    """
+    config_file.config_file.ConfigFile.save
+
+    Ensure that saving a changed value of an existing key
+    keeps the formatting of the rest of the file.
+    """
+    path = tmp_file(file_name, contents)
+    config = ConfigFile(path)
+
+    config.set("header_one.number_key", 25)
+    config.save()
+
+    assert path.read_text() == expected
+
+
+def test_retrieving_a_section_with_array_notation_keeps_it_dirty(
+    template_and_config_file,
+):
+    """
+    config_file.config_file.ConfigFile.is_dirty
+
+    Ensure that once a section was retrieved with the array
+    notation, the ConfigFile is always saved since the section
+    may be modified without the ConfigFile knowing.
+    """
+    template_file, config = template_and_config_file()
+
+    section = config["header_one"]
+    config.save()
+    section["number_key"] = 5
+
+    assert config.is_dirty
+    config.save()
+    assert config.get("header_one.number_key", parse_types=True) == 5
+    assert str(config) == template_file.read_text()
+
+
+@pytest.mark.parametrize("file_type", ["ini", "json", "yaml", "toml"])
+def test_sections_retrieved_with_get_are_saved_once_modified(template_file, file_type):
+    """
+    config_file.config_file.ConfigFile.save
+
+    Ensure that sections and lists retrieved with get and get_many
+    are written when they are modified, and peek keeps tracking changes.
+    """
+    path = template_file(file_type)
+    config = ConfigFile(path)
+
+    config.peek("header_one")
+    assert not config.is_dirty
+    assert config.version is not None
+
+    config.get("header_one")["number_key"] = "changed"
+    config.get_many(["header_two"])["header_two"]["str_key"] = "also changed"
+    assert config.is_dirty
+    config.save()
+
+    saved = ConfigFile(path)
+    assert saved.get("header_one.number_key") == "changed"
+    assert saved.get("header_two.str_key") == "also changed"
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_sections_retrieved_with_get_are_only_dirty_once_modified(
+    template_file, file_type
+):
+    """
+    config_file.config_file.ConfigFile.save
+
+    Ensure that a ConfigFile that handed out a section is only
+    dirty, and written, when that section was modified.
+    """
+    path = template_file(file_type)
+    config = ConfigFile(path)
+    section = config.get("header_one")
+    config.save()
+    path.write_text("changed on disk")
+
+    assert not config.is_dirty
+    config.save()
+    assert path.read_text() == "changed on disk"
+
+    section["number_key"] = 5
+    assert config.is_dirty
+    config.save()
+    assert not config.is_dirty
+    assert ConfigFile(path).get("header_one.number_key", parse_types=True) == 5
+
+    config.reload()
+    assert not config.is_dirty
+
+
 def test_restore_original_can_restore_with_calculated_in_path(
     templated_config_file, template_original_file
 ):
@@ -405,3 +605,709 @@ def test_the_config_file_can_be_stringified(template_and_config_file):
     template, config = template_and_config_file()
     assert template.read_text() == str(config)
     assert f"{str(template)}\n\n{str(config)}" == repr(config)
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_load_many_loads_files_in_order_and_collects_errors(template_file, executor):
+    """
+    config_file.config_file.ConfigFile.load_many
+
+    Ensure that load_many returns a ConfigFile for every path
+    in the order they were given, and collects the errors
+    of the paths that could not be loaded instead of raising.
+    """
+    paths = [template_file(file_type) for file_type in SUPPORTED_FILE_TYPES]
+    invalid = template_file("json", template_name="invalid")
+    paths[1:1] = [invalid, "does-not-exist.ini"]
+
+    result = ConfigFile.load_many(paths, executor=executor, chunksize=2)
+
+    assert [config and config.path for config in result.configs] == [
+        paths[0],
+        None,
+        None,
+        *paths[3:],
+    ]
+    assert isinstance(result.errors[1], ParsingError)
+    assert isinstance(result.errors[2], FileNotFoundError)
+    assert result.files_per_second > 0
+
+    config = result.configs[0]
+    assert config.is_parsed
+    assert config.get("header_one.number_key") == "0"
+
+
+def test_load_many_can_use_an_existing_executor(template_file):
+    """
+    config_file.config_file.ConfigFile.load_many
+
+    Ensure that load_many can use an executor that is passed in
+    and that the loaded ConfigFiles can be changed and saved.
+    """
+    path = template_file("toml")
+
+    with ThreadPoolExecutor(2) as executor:
+        (config,) = ConfigFile.load_many([path], executor=executor).configs
+
+    config.set("header_one.number_key", 5)
+    config.save()
+
+    assert ConfigFile(path).get("header_one.number_key") == 5
+
+
+def test_load_many_raises_error_on_unrecognized_executor():
+    """
+    config_file.config_file.ConfigFile.load_many
+
+    Ensure that an executor that is not recognized raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        ConfigFile.load_many([], executor="fiber")
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_aload_shares_concurrent_loads_of_the_same_file(template_file, file_type):
+    """
+    config_file.config_file.ConfigFile.aload
+
+    Ensure that concurrent loads of the same file only parse
+    it once and that every ConfigFile can still be changed
+    without affecting the others.
+    """
+    path = template_file(file_type)
+    configs = [ConfigFile(path, lazy=True) for _ in range(3)]
+
+    async def load_all():
+        return await asyncio.gather(*(config.aload() for config in configs))
+
+    with patch.object(
+        ConfigFile,
+        "_ConfigFile__parse",
+        autospec=True,
+        side_effect=ConfigFile._ConfigFile__parse,
+    ) as parse:
+        assert run(load_all()) == configs
+
+    assert parse.call_count == 1
+    assert all(config.is_parsed for config in configs)
+
+    configs[0].set("header_one.number_key", 5)
+    del configs[1]["header_two"]
+
+    assert str(configs[0].get("header_one.number_key")) == "5"
+    assert str(configs[2].get("header_one.number_key")) == "0"
+    assert configs[0].has("header_two") and configs[2].has("header_two")
+    assert str(configs[2]) == path.read_text()
+
+
+def test_aload_raises_parsing_error_to_every_caller(template_file):
+    """
+    config_file.config_file.ConfigFile.aload
+
+    Ensure that a file that can not be parsed raises
+    a ParsingError to every caller waiting on it.
+    """
+    path = template_file("json", template_name="invalid")
+    configs = [ConfigFile(path, lazy=True) for _ in range(2)]
+
+    async def load_all():
+        return await asyncio.gather(
+            *(config.aload() for config in configs), return_exceptions=True
+        )
+
+    errors = run(load_all())
+
+    assert all(isinstance(error, ParsingError) for error in errors)
+    assert not any(config.is_parsed for config in configs)
+
+
+def test_async_with_loads_and_saves_the_file(template_and_config_file):
+    """
+    config_file.config_file.ConfigFile.__aenter__
+    config_file.config_file.ConfigFile.__aexit__
+
+    Ensure that using a ConfigFile as an async context manager
+    loads it on entry and saves it on exit, unless an error
+    was raised.
+    """
+    template, _ = template_and_config_file()
+
+    async def change(number, error=None):
+        async with ConfigFile(template, lazy=True) as config:
+            assert config.is_parsed
+            config.set("header_one.number_key", number)
+            if error:
+                raise error
+
+    run(change(5))
+    assert str(ConfigFile(template).get("header_one.number_key")) == "5"
+
+    with pytest.raises(RuntimeError):
+        run(change(6, RuntimeError()))
+    assert str(ConfigFile(template).get("header_one.number_key")) == "5"
+
+
+def test_asave_writes_changes_in_an_executor(template_file):
+    """
+    config_file.config_file.ConfigFile.asave
+
+    Ensure that asave writes the changes using the given
+    executor and leaves the ConfigFile clean.
+    """
+    path = template_file("toml")
+    config = ConfigFile(path)
+    config.set("header_one.number_key", 5)
+
+    with ThreadPoolExecutor(1) as executor:
+        run(config.asave(executor))
+
+    assert not config.is_dirty
+    assert ConfigFile(path).get("header_one.number_key") == 5
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_index_agrees_with_walking_the_file(template_file, file_type):
+    """
+    config_file.config_file.ConfigFile.__init__
+
+    Ensure that a ConfigFile created with index=True
+    retrieves and finds the same keys as one without
+    while keys and sections are set and deleted.
+    """
+    path = template_file(file_type)
+    indexed, walked = ConfigFile(path, index=True), ConfigFile(path)
+    keys = [
+        "header_one",
+        "header_one.number_key",
+        "header_one.missing",
+        "header_two.list_key",
+        "header_two.list_key.0",
+        "header_three.nested.key",
+        "missing",
+    ]
+
+    def assert_same():
+        for key in keys:
+            assert indexed.has(key) == walked.has(key), key
+            if walked.has(key):
+                assert indexed.get(key) == walked.get(key), key
+            else:
+                with pytest.raises(KeyError):
+                    indexed.get(key)
+
+    changes = [
+        lambda config: config.set("header_one.number_key", 5),
+        lambda config: config.set("header_one.missing", "now here"),
+        lambda config: config.set("header_three.nested.key", 1),
+        lambda config: config.delete("header_one.number_key"),
+        lambda config: config.delete("header_three"),
+        lambda config: config.__setitem__("header_one", {"number_key": 2}),
+        lambda config: config.__delitem__("header_two"),
+    ]
+
+    assert_same()
+    for change in changes:
+        change(indexed)
+        change(walked)
+        assert_same()
+
+
+@pytest.mark.parametrize("file_type", ["json", "yaml"])
+def test_index_agrees_with_walking_the_file_when_lists_change(tmp_file, file_type):
+    """
+    config_file.config_file.ConfigFile.__init__
+
+    Ensure that a ConfigFile created with index=True retrieves the
+    same keys as one without while the items of lists are set and
+    deleted, moving the items after them.
+    """
+    contents = {
+        "json": '{"srv": [{"name": "a"}, {"name": "b"}, 3]}',
+        "yaml": "srv:\n- name: a\n- name: b\n- 3\n",
+    }[file_type]
+    path = tmp_file(f"lists.{file_type}", contents)
+    indexed, walked = ConfigFile(path, index=True), ConfigFile(path)
+    keys = [
+        KeyPath(("srv", 0)),
+        KeyPath(("srv", 1)),
+        KeyPath(("srv", 0, "name")),
+        KeyPath(("srv", 1, "name")),
+    ]
+
+    changes = [
+        lambda config: config.set(KeyPath(("srv", 1)), 5),
+        lambda config: config.delete(KeyPath(("srv", 0))),
+        lambda config: config.set(KeyPath(("srv", 1)), {"name": "c"}),
+        lambda config: config.set(KeyPath(("srv", 1, "name")), "d"),
+        lambda config: config.delete(KeyPath(("srv", 0))),
+    ]
+
+    for change in changes:
+        indexed.peek("srv")
+        change(indexed)
+        change(walked)
+        for key in keys:
+            assert indexed.has(key) == walked.has(key), key
+            assert indexed.peek(key, default=None) == walked.peek(key, default=None)
+
+
+def test_index_is_not_used_once_a_section_was_handed_out(template_file):
+    """
+    config_file.config_file.ConfigFile.__getitem__
+
+    Ensure that changes made to a section retrieved with the
+    array notation are seen by a ConfigFile with an index.
+    """
+    config = ConfigFile(template_file("json"), index=True)
+    assert config.get("header_one.number_key") == 0
+
+    config["header_one"]["number_key"] = 1
+    config["header_one"]["new_key"] = 2
+
+    assert config.get("header_one.number_key") == 1
+    assert config.has("header_one.new_key")
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+@pytest.mark.parametrize("index", [False, True])
+def test_get_many_retrieves_the_same_values_as_get(template_file, file_type, index):
+    """
+    config_file.config_file.ConfigFile.get_many
+
+    Ensure that get_many returns the same values as get,
+    in the order the keys were given.
+    """
+    config = ConfigFile(template_file(file_type), index=index)
+    keys = [
+        "header_two.str_key",
+        "header_one.number_key",
+        KeyPath("header_two.list_key"),
+        "header_one",
+    ]
+
+    values = config.get_many(keys)
+
+    assert list(values) == keys
+    assert values == {key: config.get(key) for key in keys}
+    assert config.get_many(keys, parse_types=True)["header_one.number_key"] == 0
+    assert config.get_many(["header_one.number_key"], return_type=str) == {
+        "header_one.number_key": "0"
+    }
+
+
+@pytest.mark.parametrize("index", [False, True])
+def test_get_many_reports_every_missing_key(template_file, index):
+    """
+    config_file.config_file.ConfigFile.get_many
+
+    Ensure that every key that does not exist is reported at once,
+    along with the values of the ones that do, unless a default
+    is given.
+    """
+    config = ConfigFile(template_file("toml"), index=index)
+    keys = [
+        "header_one.number_key",
+        "header_one.missing",
+        "missing.section",
+        "header_two.str_key.too_deep",
+        0,
+    ]
+
+    with pytest.raises(MissingKeysError) as error:
+        config.get_many(keys)
+
+    assert error.value.keys == keys[1:]
+    assert list(error.value.found) == ["header_one.number_key"]
+    assert isinstance(error.value, KeyError)
+
+    values = config.get_many(keys, default=None)
+    assert values == {**dict.fromkeys(keys), "header_one.number_key": 0}
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+@pytest.mark.parametrize("index", [False, True])
+def test_set_many_is_the_same_as_setting_every_key(template_file, file_type, index):
+    """
+    config_file.config_file.ConfigFile.set_many
+
+    Ensure that set_many sets existing and new keys the same
+    way set does, setting sections before the keys inside of them.
+    """
+    path = template_file(file_type)
+    config, expected = ConfigFile(path, index=index), ConfigFile(path)
+    values = {
+        "header_three.nested.key": "value",
+        "header_one.number_key": 5,
+        "header_two.str_key": "changed",
+        "header_three": {"other": "key"},
+        KeyPath("header_one.new_key"): "new",
+    }
+
+    config.get("header_one.number_key")
+    config.set_many(values)
+    expected.set("header_three", {"other": "key"})
+    for key, value in values.items():
+        if key != "header_three":
+            expected.set(key, value)
+
+    assert str(config) == str(expected)
+    assert config.get_many(values) == expected.get_many(values)
+    assert config.is_dirty
+
+
+@pytest.mark.parametrize("file_type", ["json", "yaml", "toml"])
+def test_set_many_sets_nothing_if_a_key_fails(template_file, file_type):
+    """
+    config_file.config_file.ConfigFile.set_many
+
+    Ensure that if one of the keys can not be set, none of them are.
+    """
+    config = ConfigFile(template_file(file_type))
+    original = str(config)
+
+    with pytest.raises(IndexError):
+        config.set_many(
+            {
+                "header_one.number_key": 5,
+                KeyPath(("header_two", "list_key", 3)): 4,
+                "header_three.key": "new",
+            }
+        )
+
+    with pytest.raises(TypeError):
+        config.set_many({"header_one.new_key": 1, "header_one.number_key.key": 2})
+
+    assert str(config) == original
+    assert not config.is_dirty
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_wild_has_stays_correct_once_keys_are_indexed(template_file, file_type):
+    """
+    config_file.config_file.ConfigFile.has
+
+    Ensure that repeated wild searches, which index every key by
+    its name, find the same keys as a single search while keys
+    and sections are set and deleted.
+    """
+    config = ConfigFile(template_file(file_type))
+    names = ["number_key", "str_key", "header_two", "nested", "new_key", "missing"]
+
+    def assert_found(*expected):
+        for name in names:
+            assert config.has(name, wild=True) == (name in expected), name
+
+    assert_found("number_key", "str_key", "header_two")
+
+    config.set("header_one.new_key", 1)
+    config.delete("header_two.str_key")
+    assert_found("number_key", "header_two", "new_key")
+
+    config.set("header_three", {"nested": {"number_key": 2}})
+    config.delete("header_one")
+    assert_found("number_key", "header_two", "header_three", "nested")
+
+    config["header_two"] = "replaced"
+    del config["header_three"]
+    assert_found("header_two")
+
+
+def test_find_lists_every_location_of_a_key(tmp_file):
+    """
+    config_file.config_file.ConfigFile.find
+
+    Ensure that find returns the path to every key with
+    a name, including the ones in sections inside of lists.
+    """
+    config = ConfigFile(
+        tmp_file(
+            "config.json",
+            json.dumps(
+                {
+                    "host": "a",
+                    "database": {"host": "b", "port": 1},
+                    "replicas": [{"host": "c"}, {"port": 2}],
+                }
+            ),
+        )
+    )
+
+    assert sorted(config.find("host"), key=str) == [
+        ("database", "host"),
+        ("host",),
+        ("replicas", 0, "host"),
+    ]
+    assert config.find("missing") == []
+
+    config.set("database.host", None)
+    config.delete("host")
+
+    assert sorted(config.find("host"), key=str) == [
+        ("database", "host"),
+        ("replicas", 0, "host"),
+    ]
+
+
+def test_find_stays_correct_once_the_items_of_a_list_change(tmp_file):
+    """
+    config_file.config_file.ConfigFile.find
+
+    Ensure that repeated searches, which index every key by its
+    name, find the keys in lists again once items of the lists are
+    set and deleted, moving the items after them.
+    """
+    config = ConfigFile(
+        tmp_file(
+            "config.json",
+            json.dumps({"servers": [{"name": "a"}, {"name": "b"}], "port": 1}),
+        )
+    )
+    assert sorted(config.find("name"), key=str) == [
+        ("servers", 0, "name"),
+        ("servers", 1, "name"),
+    ]
+
+    config.delete(KeyPath(("servers", 0)))
+    assert config.find("name") == [("servers", 0, "name")]
+
+    config.set(KeyPath(("servers", 0)), 5)
+    assert config.find("name") == []
+    assert config.find(0) == []
+    assert not config.has("name", wild=True)
+
+    config.set(KeyPath(("servers", 0)), {"name": "c"})
+    assert config.find("name") == [("servers", 0, "name")]
+    assert config.has("name", wild=True)
+
+
+def test_version_changes_with_the_file(templated_config_file):
+    """
+    config_file.config_file.ConfigFile.version
+
+    Ensure that the version of a file changes whenever it
+    is modified or reloaded, and not when it is only read.
+    """
+    config = templated_config_file()
+    versions = [config.version]
+
+    config.get("header_one.number_key")
+    config.get("header_one", parse_types=True)
+    config.has("header_two.str_key")
+    assert config.version == versions[-1]
+
+    config.set("header_one.number_key", 5)
+    versions.append(config.version)
+    config.delete("header_one.number_key")
+    versions.append(config.version)
+    config.reload()
+    versions.append(config.version)
+
+    assert len(set(versions)) == 4
+
+    config["header_one"]
+    assert config.version is None
+
+    config.reload()
+    config.get("header_one")
+    assert config.version is None
+
+
+def test_typed_values_are_cached(templated_config_file):
+    """
+    config_file.config_file.ConfigFile.get
+
+    Ensure that the parsed values of keys retrieved with
+    parse_types are cached, and only parsed once.
+    """
+    config = templated_config_file("all_strings")
+
+    section = config.get("header", parse_types=True)
+    with patch("config_file.config_file.parse_value", side_effect=AssertionError):
+        assert config.get("header", parse_types=True) == section
+
+    assert config.get("header.num", parse_types=True) == 5
+    assert config.get_many(["header.num"], parse_types=True) == {"header.num": 5}
+    assert config.get("header.missing", parse_types=True, default="5") == 5
+    assert config.typed_cache_info() == (2, 3, 0, 2)
+
+
+def test_changing_keys_forgets_their_typed_values(templated_config_file):
+    """
+    config_file.config_file.ConfigFile.typed_cache_info
+
+    Ensure that changing a key only forgets the typed values of
+    the key, the sections leading to it, and the keys inside of it.
+    """
+    config = templated_config_file("all_strings")
+    keys = ["header", "header.num", "header.bool", "header.float"]
+    for key in keys:
+        config.get(key, parse_types=True)
+
+    config.set("header.num", "6")
+    assert config.typed_cache_info().currsize == 2
+    assert config.get("header.num", parse_types=True) == 6
+    assert config.get("header", parse_types=True)["num"] == 6
+
+    config.set_many({"header.bool": "true"})
+    config.delete("header.float")
+    assert config.typed_cache_info().currsize == 1
+    assert config.get("header.bool", parse_types=True) is True
+    assert "float" not in config.get("header", parse_types=True)
+
+    config["header"] = {"num": "7"}
+    assert config.typed_cache_info().currsize == 0
+    assert config.get("header.num", parse_types=True) == 7
+
+
+def test_other_changes_forget_every_typed_value(templated_config_file):
+    """
+    config_file.config_file.ConfigFile.get
+
+    Ensure that typed values are forgotten when the file changes
+    other than key by key, and are not cached while its sections
+    can be modified without the file knowing.
+    """
+    config = templated_config_file("all_strings")
+    assert config.get("header.num", parse_types=True) == 5
+
+    with config.transaction() as transaction:
+        transaction.set("header.num", "6")
+    assert config.get("header.num", parse_types=True) == 6
+
+    config.reload()
+    assert config.get("header.num", parse_types=True) == 5
+
+    section = config["header"]
+    assert config.get("header.num", parse_types=True) == 5
+    section["num"] = "8"
+    assert config.get("header.num", parse_types=True) == 8
+    assert config.typed_cache_info().currsize == 0
+
+
+@pytest.mark.parametrize("file_type", ["ini", "json", "yaml", "toml"])
+def test_modifying_typed_values_changes_nothing(template_file, file_type):
+    """
+    config_file.config_file.ConfigFile.get
+
+    Ensure that modifying a section retrieved with parse_types changes
+    neither what is retrieved later with parse_types nor the file.
+    """
+    config = ConfigFile(template_file(file_type, template_name="all_strings"))
+    num = config.get("header.num", parse_types=True)
+
+    config.get("header", parse_types=True)["num"] = "changed"
+    config.get("header.list", parse_types=True).append("changed")
+    config.get_many(["header"], parse_types=True)["header"]["bool"] = "changed"
+
+    assert config.get("header", parse_types=True)["num"] == num
+    assert config.get("header.list", parse_types=True) == []
+    assert config.get("header.bool", parse_types=True) != "changed"
+    assert config.get("header.num") != "changed"
+    assert not config.is_dirty
+
+
+def test_typed_sections_of_strings_are_copies(tmp_file):
+    """
+    config_file.config_file.ConfigFile.get
+
+    Ensure that a section of strings retrieved with parse_types is
+    not the section of the file, even if none of its strings parse.
+    """
+    path = tmp_file("strings.ini", "[section]\nname = value\n")
+    config = ConfigFile(path)
+
+    section = config.get("section", parse_types=True)
+    section["name"] = "changed"
+
+    assert config.get("section.name") == "value"
+    assert not config.is_dirty
+
+
+def test_typed_files_return_native_types(template_file):
+    """
+    config_file.config_file.ConfigFile.__init__
+
+    Ensure that an INI ConfigFile created with typed=True returns
+    the same values from get as get(parse_types=True) does.
+    """
+    path = template_file("ini", template_name="all_strings")
+    typed, untyped = ConfigFile(path, typed=True), ConfigFile(path)
+
+    assert typed.get("header.num") == untyped.get("header.num", parse_types=True)
+    assert typed.get_many(["header.bool"]) == {"header.bool": False}
+    assert not typed.is_dirty
+    assert typed.get("header") == untyped.get("header", parse_types=True)
+    assert str(typed) == path.read_text()
+
+
+def test_typed_ini_files_are_written_the_way_they_were_read(tmp_file):
+    """
+    config_file.parsers.ini_parser.IniParser.convert_types
+
+    Ensure that the values of a typed INI file are written back
+    the way they were read, including when the file is dumped.
+    """
+    contents = "[section]\nnum = 5\nflag = true\nitems = [1, 2]\nempty = \n"
+    path = tmp_file("typed.ini", contents)
+    config = ConfigFile(path, typed=True)
+
+    config.set("section.flag", False)
+    assert str(config) == contents.replace("true", "false")
+
+    config.set("other.key", True)
+    config.save()
+    config.reload()
+
+    assert config.get("section") == {
+        "num": 5,
+        "flag": False,
+        "items": [1, 2],
+        "empty": "",
+    }
+    assert config.get("other.key") is True
+    assert "flag = false" in path.read_text()
+
+
+def test_typed_ini_files_keep_unchanged_values_when_dumped(tmp_file):
+    """
+    config_file.parsers.ini_parser.IniParser.dumps
+
+    Ensure that dumping a typed INI file writes the values that
+    didn't change exactly as they were read, not as their types
+    would write them.
+    """
+    contents = "[section]\nprice = 1.50\ncode = 007\nflag = TRUE\nmore = 2.0\n\n"
+    path = tmp_file("typed.ini", contents)
+    config = ConfigFile(path, typed=True)
+
+    assert config.get("section.price") == 1.5
+    config.delete("section.more")
+    assert str(config) == contents.replace("more = 2.0\n", "")
+
+    config.set("section.code", 8)
+    config.set("section.flag", False)
+    config.delete("section.price")
+    assert str(config) == "[section]\ncode = 8\nflag = false\n\n"
+
+
+@pytest.mark.parametrize("file_type", ["json", "yaml", "toml"])
+def test_typed_leaves_natively_typed_formats_as_they_are(template_file, file_type):
+    """
+    config_file.config_file.ConfigFile.__init__
+
+    Ensure that typed=True does not convert the values of formats
+    that have native types, such as strings that look like numbers.
+    """
+    path = template_file(file_type, template_name="all_strings")
+    typed, untyped = ConfigFile(path, typed=True), ConfigFile(path)
+
+    assert typed.get("header") == untyped.get("header")
+    assert typed.get("header.num") == "5"
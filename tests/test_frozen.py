@@ -0,0 +1,237 @@
+from threading import Thread
+from unittest.mock import patch
+
+import pytest
+
+from config_file import ConfigFile, FrozenConfig, KeyPath
+from config_file.frozen import FrozenList, freeze
+
+SUPPORTED_FILE_TYPES = ["ini", "json", "yaml", "toml"]
+
+
+def modify(config):
+    config.set("header_one.number_key", 5)
+    config.set("header_one.new_section.key", "value")
+    config.delete("header_two.str_key")
+    config.set_many({"header_three.key": 1, "header_one.other": 2})
+    with config.transaction() as transaction:
+        transaction.delete("header_three")
+    config["header_four"] = {"key": "value"}
+    del config["header_four"]
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_snapshot_does_not_see_later_changes(template_file, file_type):
+    """
+    config_file.config_file.ConfigFile.snapshot
+
+    Ensure that modifying the file after taking a snapshot leaves the
+    snapshot as it was, and modifies the file the same way as without it.
+    """
+    path = template_file(file_type)
+    config, expected = ConfigFile(path), ConfigFile(path)
+    before = ConfigFile(path).snapshot()
+
+    snapshot = config.snapshot()
+    modify(config)
+    modify(expected)
+
+    assert snapshot == before
+    assert str(snapshot.get("header_one.number_key")) == "0"
+    assert snapshot.has("header_two.str_key")
+    assert not snapshot.has("header_one.new_section")
+    assert str(config) == str(expected)
+    assert config.snapshot() == expected.snapshot()
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_snapshot_does_not_copy_the_file(template_file, file_type):
+    """
+    config_file.config_file.ConfigFile.snapshot
+
+    Ensure that neither taking snapshots nor modifying the
+    file afterwards copies all of the parsed file.
+    """
+    config = ConfigFile(template_file(file_type))
+
+    with patch("copy.deepcopy", side_effect=AssertionError):
+        first = config.snapshot()
+        config.set("header_one.number_key", 5)
+        second = config.snapshot()
+        config.set("header_one.number_key", 6)
+        config.delete("header_two")
+
+    assert str(first.get("header_one.number_key")) == "0"
+    assert str(second.get("header_one.number_key")) == "5"
+    assert second.has("header_two")
+
+
+def test_snapshot_is_reused_until_the_file_changes(template_file):
+    """
+    config_file.config_file.ConfigFile.snapshot
+
+    Ensure that snapshots taken without the file changing in
+    between are the same, and that they are hashable.
+    """
+    config = ConfigFile(template_file("json"))
+
+    snapshot = config.snapshot()
+    assert config.snapshot() is snapshot
+
+    config.set("header_one.number_key", 0)
+    assert config.snapshot() is not snapshot
+    assert config.snapshot() == snapshot
+    assert hash(config.snapshot()) == hash(snapshot)
+    assert len({snapshot, config.snapshot()}) == 1
+
+    config.set("header_one.number_key", 1)
+    assert config.snapshot() != snapshot
+
+
+def test_snapshot_is_read_only(template_file):
+    """
+    config_file.frozen.FrozenConfig
+
+    Ensure that the sections and lists in a snapshot can't be modified.
+    """
+    snapshot = ConfigFile(template_file("yaml")).snapshot()
+    section = snapshot["header_two"]
+
+    assert isinstance(section, FrozenConfig)
+    assert isinstance(section["list_key"], FrozenList)
+    assert section["list_key"] == [1, 2, 3]
+    assert section["list_key"][1:] == [2, 3]
+    assert section == {"str_key": "string", "list_key": [1, 2, 3]}
+
+    with pytest.raises(TypeError):
+        section["str_key"] = "changed"
+
+    with pytest.raises(TypeError):
+        section["list_key"][0] = 5
+
+    with pytest.raises(AttributeError):
+        section["list_key"].append(4)
+
+
+def test_snapshot_get_follows_keys(template_file):
+    """
+    config_file.frozen.FrozenConfig.get
+    config_file.frozen.FrozenConfig.has
+
+    Ensure that keys are retrieved from a snapshot
+    the same way as from the file.
+    """
+    snapshot = ConfigFile(template_file("toml")).snapshot()
+
+    assert snapshot.get("header_two.str_key") == "string"
+    assert snapshot.get(KeyPath(("header_two", "list_key", 2))) == 3
+    assert snapshot.get("header_two.missing", default=None) is None
+    assert snapshot.has("header_one")
+    assert not snapshot.has("header_one.number_key.too_deep")
+
+    with pytest.raises(KeyError):
+        snapshot.get("header_two.missing")
+
+
+def test_snapshot_of_modified_sections_is_a_copy(template_file):
+    """
+    config_file.config_file.ConfigFile.snapshot
+
+    Ensure that a snapshot taken after a section was handed out, and
+    so could be modified at any time, does not see changes made to it.
+    """
+    config = ConfigFile(template_file("json"))
+    section = config["header_one"]
+
+    snapshot = config.snapshot()
+    section["number_key"] = 5
+
+    assert snapshot.get("header_one.number_key") == 0
+    assert config.get("header_one.number_key") == 5
+
+
+def test_snapshot_with_split_up_tables(tmp_file):
+    """
+    config_file.parsers.toml_parser.TomlParser.can_copy_sections
+
+    Ensure that modifying a toml file with a table split up
+    across the file after taking a snapshot keeps its layout.
+    """
+    contents = "[a.x]\nkey = 1\n\n[b]\nkey = 2\n\n[a.y]\nkey = 3\n"
+    config = ConfigFile(tmp_file("split.toml", contents))
+
+    snapshot = config.snapshot()
+    config.set("a.x.key", 5)
+
+    assert snapshot.get("a.x.key") == 1
+    assert str(config) == contents.replace("key = 1", "key = 5")
+
+
+def test_snapshots_can_be_read_while_the_file_changes(template_file):
+    """
+    config_file.config_file.ConfigFile.snapshot
+
+    Ensure that snapshots read from other threads always see the
+    changes made to the file in between taking them at once.
+    """
+    config = ConfigFile(template_file("yaml"))
+    config.set_many({"header_one.first": 0, "header_one.second": 0})
+    published = [config.snapshot()]
+    done = False
+    mismatches = []
+
+    def read():
+        while not done:
+            snapshot = published[-1]
+            section = snapshot["header_one"]
+            if section["first"] != section["second"]:
+                mismatches.append(snapshot)
+
+    readers = [Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+
+    for value in range(1, 500):
+        config.set("header_one.first", value)
+        config.set("header_one.second", value)
+        published.append(config.snapshot())
+
+    done = True
+    for reader in readers:
+        reader.join()
+
+    assert not mismatches
+    assert published[0].get("header_one.first") == 0
+    assert published[-1].get("header_one.first") == 499
+
+
+def test_snapshot_with_sets_can_be_hashed(tmp_file):
+    """
+    config_file.frozen.FrozenConfig.__hash__
+
+    Ensure that snapshots of yaml files with sets in them
+    hash the same when their contents are equal.
+    """
+    contents = "section:\n  hosts: !!set\n    ? a\n    ? b\n"
+    config = ConfigFile(tmp_file("sets.yaml", contents))
+    other = ConfigFile(tmp_file("other.yaml", contents))
+
+    snapshot = config.snapshot()
+
+    assert snapshot.get("section.hosts") == frozenset({"a", "b"})
+    assert hash(snapshot) == hash(other.snapshot())
+    assert snapshot == other.snapshot()
+
+
+def test_freeze_leaves_values_as_they_are():
+    """
+    config_file.frozen.freeze
+
+    Ensure that only sections, lists, and sets are wrapped.
+    """
+    assert freeze("string") == "string"
+    assert freeze(5) == 5
+    assert isinstance(freeze({"key": "value"}), FrozenConfig)
+    assert isinstance(freeze([1, 2]), FrozenList)
+    assert freeze({1, 2}) == frozenset({1, 2})
+    assert repr(freeze({"key": [1]})) == "FrozenConfig({'key': [1]})"
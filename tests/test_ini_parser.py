@@ -0,0 +1,117 @@
+import copy
+
+from config_file.parsers.ini_parser import IniParser
+
+CONTENTS = """[DEFAULT]
+default = 1
+
+[section]
+# comment
+Number = 1
+multiline : two
+  lines
+
+  more
+empty =
+[percent]
+key = %(default)s
+"""
+
+
+def test_value_spans_locates_the_values_of_options():
+    """
+    config_file.parsers.ini_parser.IniParser.value_spans
+
+    Ensure that the spans of every option's value are found,
+    including multiline values, keyed by the lowercased option.
+    """
+    spans = IniParser(CONTENTS).value_spans(CONTENTS)
+    values = {key: CONTENTS[start:end] for key, (start, end) in spans.items()}
+
+    assert values == {
+        ("section", "number"): "1",
+        ("section", "multiline"): "two\n  lines\n\n  more",
+        ("section", "empty"): "",
+        ("percent", "key"): "%(default)s",
+    }
+
+
+def test_changed_values_are_patched_in_place():
+    """
+    config_file.parsers.ini_parser.IniParser.__str__
+
+    Ensure that changing the value of an existing option only
+    replaces the text of that value, keeping comments and the
+    DEFAULT section.
+    """
+    parser = IniParser(CONTENTS)
+    parser.set("section.number", 5)
+    parser.set("section.multiline", "one\nline")
+    parser.set("section.empty", True)
+
+    assert str(parser) == CONTENTS.replace("Number = 1", "Number = 5").replace(
+        "two\n  lines\n\n  more", "one\n\tline"
+    ).replace("empty =", "empty =True")
+
+
+def test_values_are_patched_across_characters_that_only_look_like_line_breaks():
+    """
+    config_file.parsers.ini_parser.IniParser.value_spans
+
+    Ensure that characters like form feeds, which configparser
+    does not break lines on, are patched as part of their value.
+    """
+    contents = "[s]\nk = a\x0cb\u2028c\r\nother = 1\n"
+    parser = IniParser(contents)
+    parser.set("s.k", "Z")
+    parser.set("s.other", 2)
+
+    assert str(parser) == "[s]\nk = Z\r\nother = 2\n"
+    assert IniParser(str(parser)).get("s.k") == "Z"
+
+
+def test_options_only_in_the_default_section_dump_the_whole_document():
+    """
+    config_file.parsers.ini_parser.IniParser.__str__
+
+    Ensure that an option inherited from the DEFAULT section
+    falls back to dumping the document.
+    """
+    parser = IniParser(CONTENTS)
+    parser.set("section.default", 2)
+
+    assert str(parser) == parser.dumps(parser.parsed_content)
+
+
+def test_copies_of_typed_parsers_keep_unchanged_values_when_dumped():
+    """
+    config_file.parsers.ini_parser.IniParser.__copy__
+
+    Ensure that a copy of a typed parser still writes the values
+    that didn't change exactly as they were read.
+    """
+    contents = "[section]\nprice = 1.50\nflag = TRUE\n\n"
+    parser = IniParser(contents)
+    parser.use_types()
+
+    copied = copy.copy(parser)
+    copied.delete("section.flag")
+
+    assert str(copied) == "[section]\nprice = 1.50\n\n"
+    assert str(parser) == contents
+
+
+def test_peek_retrieves_values_as_strings_like_get():
+    """
+    config_file.parsers.ini_parser.IniParser.peek
+
+    Ensure that peek and peek_many retrieve values the
+    same way get and get_many do.
+    """
+    parser = IniParser(CONTENTS)
+    parser.set("section.number", 5)
+
+    assert parser.peek("section.number") == parser.get("section.number") == "5"
+    assert parser.peek_many(["section.number", "section"]) == parser.get_many(
+        ["section.number", "section"]
+    )
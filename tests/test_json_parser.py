@@ -0,0 +1,75 @@
+import pytest
+
+from config_file.parsers.json_parser import JsonParser
+
+CONTENTS = """{
+  "a": {"b": 1, "c": [1, {"d": 2}], "e": "x\\"y"},
+  "f": -1.5e3, "g": null
+}
+"""
+
+
+def test_value_spans_locates_the_values_of_object_members():
+    """
+    config_file.parsers.json_parser.JsonParser.value_spans
+
+    Ensure that the spans of every object member's value
+    are found, except for the ones inside of lists.
+    """
+    spans = JsonParser(CONTENTS).value_spans(CONTENTS)
+    values = {key: CONTENTS[start:end] for key, (start, end) in spans.items()}
+
+    assert values == {
+        ("a",): '{"b": 1, "c": [1, {"d": 2}], "e": "x\\"y"}',
+        ("a", "b"): "1",
+        ("a", "c"): '[1, {"d": 2}]',
+        ("a", "e"): '"x\\"y"',
+        ("f",): "-1.5e3",
+        ("g",): "null",
+    }
+
+
+def test_value_spans_gives_up_on_duplicate_keys():
+    """
+    config_file.parsers.json_parser.JsonParser.value_spans
+
+    Ensure that no spans are returned for objects with
+    duplicate keys, since only the last one is parsed.
+    """
+    contents = '{"a": {"b": 1}, "a": {"c": 2}}'
+    assert JsonParser(contents).value_spans(contents) is None
+
+
+@pytest.mark.parametrize(
+    "key, value, expected",
+    [
+        ("a.b", 2, '"b": 2, "c"'),
+        ("f", "hi", '"f": "hi", "g"'),
+        ("a.c", [], '"c": [], "e"'),
+    ],
+)
+def test_changed_values_are_patched_in_place(key, value, expected):
+    """
+    config_file.parsers.json_parser.JsonParser.__str__
+
+    Ensure that changing the value of an existing key only
+    replaces the text of that value.
+    """
+    parser = JsonParser(CONTENTS)
+    parser.set(key, value)
+
+    assert expected in str(parser)
+    assert str(parser).startswith('{\n  "a": {"b": ')
+    assert JsonParser(str(parser)).get(key) == value
+
+
+def test_added_keys_dump_the_whole_document():
+    """
+    config_file.parsers.json_parser.JsonParser.__str__
+
+    Ensure that adding a key falls back to dumping the document.
+    """
+    parser = JsonParser(CONTENTS)
+    parser.set("a.new", 1)
+
+    assert str(parser) == parser.dumps(parser.parsed_content)
@@ -0,0 +1,99 @@
+import pytest
+
+from config_file import ConfigFile, KeyPath
+from config_file.key_path import to_key_path
+
+
+@pytest.mark.parametrize(
+    "key, names",
+    [
+        ("section", ("section",)),
+        ("section.sub_section.key", ("section", "sub_section", "key")),
+        ("hosts.example\\.com", ("hosts", "example.com")),
+        ("double\\\\.backslash", ("double\\", "backslash")),
+        ("C:\\Users.name", ("C:\\Users", "name")),
+        ("trailing\\", ("trailing\\",)),
+        ("", ("",)),
+    ],
+)
+def test_key_path_splits_dotted_keys(key, names):
+    """
+    config_file.key_path.KeyPath
+
+    Ensure that a dotted key is split on the dots that are not escaped
+    and that turning the KeyPath back into a string round trips.
+    """
+    key_path = KeyPath(key)
+
+    assert key_path == names
+    assert KeyPath(str(key_path)) == key_path
+
+
+def test_key_path_can_be_built_from_names():
+    """
+    config_file.key_path.KeyPath
+
+    Ensure that a KeyPath can be built from the names
+    directly, escaping them when written out.
+    """
+    key_path = KeyPath(["hosts", "example.com"])
+
+    assert key_path == ("hosts", "example.com")
+    assert str(key_path) == "hosts.example\\.com"
+    assert repr(key_path) == "KeyPath('hosts.example\\\\.com')"
+
+
+def test_to_key_path_reuses_split_keys():
+    """
+    config_file.key_path.to_key_path
+
+    Ensure that splitting the same key twice returns the same
+    KeyPath and that a KeyPath is returned as-is.
+    """
+    key_path = to_key_path("section.key")
+
+    assert to_key_path("section.key") is key_path
+    assert to_key_path(key_path) is key_path
+
+
+def test_key_paths_can_be_used_as_keys(template_file):
+    """
+    config_file.config_file.ConfigFile
+
+    Ensure that a KeyPath can be used to get, set, check,
+    and delete keys, including keys with dots in their names.
+    """
+    config = ConfigFile(template_file("json"))
+    key_path = KeyPath(["header_one", "example.com"])
+
+    config.set(key_path, 5)
+
+    assert config.get(key_path) == 5
+    assert config.get("header_one.example\\.com") == 5
+    assert config["header_one"]["example.com"] == 5
+    assert config.has(key_path)
+    assert config.has(KeyPath("example\\.com"), wild=True)
+
+    config.delete(key_path)
+
+    assert not config.has(key_path)
+    assert config.get(KeyPath("header_one.number_key")) == 0
+
+
+@pytest.mark.parametrize("index", [False, True])
+def test_key_paths_past_the_end_of_a_list_do_not_exist(template_file, index):
+    """
+    config_file.config_file.ConfigFile
+
+    Ensure that a KeyPath with an index past the end of a list
+    is a missing key, like any other.
+    """
+    config = ConfigFile(template_file("json"), index=index)
+    key_path = KeyPath(("header_two", "list_key", 3))
+
+    assert config.has(KeyPath(("header_two", "list_key", 2)))
+    assert not config.has(key_path)
+    assert config.get(key_path, default=None) is None
+    assert config.get_many([key_path], default=None) == {key_path: None}
+    with pytest.raises(KeyError):
+        config.delete(key_path)
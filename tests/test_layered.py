@@ -0,0 +1,173 @@
+from types import MappingProxyType
+from unittest.mock import patch
+
+import pytest
+
+from config_file import ConfigFile, KeyPath, LayeredConfig
+from config_file.layered import LayeredSection
+
+
+@pytest.fixture
+def layers(tmp_file):
+    site = ConfigFile(
+        tmp_file(
+            "site.toml",
+            '[database]\nhost = "db.example.com"\nport = 5432\n\n'
+            '[cache]\nttl = 60\n\n[logging]\nlevel = "info"\n',
+        )
+    )
+    host = ConfigFile(
+        tmp_file("host.yaml", "database:\n  port: 6543\nlogging: quiet\n")
+    )
+    return {
+        "environment": {"database": {"user": "admin"}},
+        "host": host,
+        "site": site,
+        "defaults": {"database": {"timeout": 30}, "cache": {"ttl": 10, "size": 5}},
+    }
+
+
+def test_get_retrieves_from_the_first_layer_with_the_key(layers):
+    """
+    config_file.layered.LayeredConfig.get
+    config_file.layered.LayeredConfig.source
+
+    Ensure that a key is retrieved from the layer with the highest
+    priority that has it, and that the layer is reported.
+    """
+    config = LayeredConfig(layers)
+
+    assert config.get("database.port") == 6543
+    assert config.source("database.port") == "host"
+    assert config.get("database.host") == "db.example.com"
+    assert config.source("database.host") == "site"
+    assert config.get(KeyPath("database.timeout")) == 30
+    assert config.source("database.timeout") == "defaults"
+    assert config.get("database.user") == "admin"
+    assert config.get("database.missing", default=None) is None
+    assert config.has("cache.size")
+    assert not config.has("cache.missing")
+
+    with pytest.raises(KeyError):
+        config.get("database.missing")
+
+    with pytest.raises(KeyError):
+        config.source("database.missing")
+
+
+def test_sections_are_combined_from_every_layer(layers):
+    """
+    config_file.layered.LayeredSection
+
+    Ensure that sections are views of the section in every layer
+    that has it, up until a layer where the key is not a section.
+    """
+    config = LayeredConfig(layers)
+    database = config.get("database")
+
+    assert isinstance(database, LayeredSection)
+    assert dict(database) == {
+        "user": "admin",
+        "port": 6543,
+        "host": "db.example.com",
+        "timeout": 30,
+    }
+    assert len(database) == 4
+    assert database.source("timeout") == "defaults"
+    assert config.source("database") == "environment"
+    assert dict(config.get("cache")) == {"ttl": 60, "size": 5}
+    assert config.get("logging") == "quiet"
+
+    layers["defaults"]["database"]["timeout"] = 10
+    assert database["timeout"] == 10
+
+
+def test_lookups_are_cached_until_a_layer_changes(layers):
+    """
+    config_file.layered.LayeredConfig.get
+
+    Ensure that keys are looked up again only once one of the
+    file layers changed, or the layers were invalidated.
+    """
+    config = LayeredConfig(layers)
+    assert config.get("cache.ttl") == 60
+
+    assert dict(config.get("cache")) == {"ttl": 60, "size": 5}
+    with patch("config_file.layered._lookup", side_effect=AssertionError):
+        assert config.get("cache.ttl") == 60
+
+    layers["site"].set("cache.ttl", 120)
+    assert config.get("cache.ttl") == 120
+
+    layers["environment"]["cache"] = {"ttl": 1}
+    assert config.get("cache.ttl") == 120
+    config.invalidate()
+    assert config.get("cache.ttl") == 1
+    assert config.source("cache.ttl") == "environment"
+
+
+def test_files_that_can_change_unnoticed_are_not_cached(layers):
+    """
+    config_file.config_file.ConfigFile.version
+
+    Ensure that keys are not cached while a file layer could
+    be modified without the file knowing.
+    """
+    config = LayeredConfig(layers)
+    logging = layers["site"]["logging"]
+    assert layers["site"].version is None
+
+    assert config.get("logging.level") == "info"
+
+    logging["level"] = "debug"
+    assert config.get("logging.level") == "debug"
+
+
+def test_changes_are_made_to_a_single_layer(layers):
+    """
+    config_file.layered.LayeredConfig.set
+    config_file.layered.LayeredConfig.delete
+
+    Ensure that changes are only made to the chosen layer.
+    """
+    config = LayeredConfig(layers, write_to="host")
+
+    config.set("database.port", 7000)
+    assert layers["host"].get("database.port") == 7000
+    assert layers["site"].get("database.port") == 5432
+
+    config.set("database.user", "guest")
+    assert config.get("database.user") == "admin"
+    assert layers["host"].get("database.user") == "guest"
+
+    config.set("database.user", "root", layer="environment")
+    config.set("new.key", "value", layer="defaults")
+    assert config.get("database.user") == "root"
+    assert config.source("new.key") == "defaults"
+
+    config.delete("database.user", layer="environment")
+    assert config.get("database.user") == "guest"
+
+    with pytest.raises(KeyError):
+        config.delete("database.user", layer="environment")
+
+    with pytest.raises(KeyError):
+        config.set("key", "value", layer="missing")
+
+    read_only = LayeredConfig({"defaults": MappingProxyType({"key": 1})})
+    with pytest.raises(TypeError):
+        read_only.set("key", 2)
+
+
+def test_layers_are_required():
+    """
+    config_file.layered.LayeredConfig
+
+    Ensure that a LayeredConfig can't be created
+    without layers, or writing to a missing one.
+    """
+    with pytest.raises(ValueError):
+        LayeredConfig({})
+
+    with pytest.raises(ValueError):
+        LayeredConfig({"defaults": {}}, write_to="missing")
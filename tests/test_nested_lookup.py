@@ -1,10 +1,14 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
 from config_file.nested_lookup import (
+    get_all_key_locations,
     get_all_keys,
     get_occurrence_of_key,
     get_occurrence_of_value,
     get_occurrences_and_values,
+    has_key,
     nested_alter,
     nested_delete,
     nested_lookup,
@@ -140,6 +144,40 @@ class TestNestedLookup(TestCase):
         }
         self.assertIn(match2, result)
 
+    def test_nested_lookup_many_keys(self):
+        class CountingDict(dict):
+            walks = 0
+
+            def items(self):
+                self.walks += 1
+                return super().items()
+
+        document = CountingDict(self.subject_dict)
+        self.assertEqual([1, 100, 200], nested_lookup(["a", "d", "missing"], document))
+        self.assertEqual(1, document.walks)
+        self.assertEqual(
+            {"a": [1], "d": [100, 200]},
+            nested_lookup({"a", "d"}, self.subject_dict, with_keys=True),
+        )
+        self.assertEqual([], nested_lookup([], self.subject_dict))
+        self.assertEqual([], nested_lookup([["unhashable"]], self.subject_dict))
+
+    def test_wild_nested_lookup_many_keys(self):
+        matches = nested_lookup(
+            ["RECOVERY", "address"], self.subject_dict2, wild=True, with_keys=True
+        )
+        self.assertEqual(
+            {
+                "email_address": ["test1@example.com", "test4@example.com"],
+                "EMAIL_RECOVERY": ["test3@example.com"],
+            },
+            matches,
+        )
+        self.assertEqual(
+            nested_lookup("mail", self.subject_dict2, wild=True),
+            nested_lookup(["mail", "email"], self.subject_dict2, wild=True),
+        )
+
 
 class TestGetAllKeys(TestCase):
     def setUp(self):
@@ -1003,6 +1041,33 @@ class TestNestedAlter(BaseLookUpApi):
         self.assertEqual(altered_document["salsa"][0]["burrito"]["key"], 120)
         self.assertEqual(altered_document["key"], 150)
 
+    def test_nested_alter_many_keys_in_one_walk(self):
+        class CountingDict(dict):
+            walks = 0
+
+            def items(self):
+                self.walks += 1
+                return super().items()
+
+        document = CountingDict({"a": 1, "b": {"a": 2, "c": 3}})
+        altered_document = nested_alter(
+            document, ["a", "c", "a"], lambda data: data * 10, in_place=True
+        )
+
+        self.assertEqual({"a": 100, "b": {"a": 200, "c": 30}}, altered_document)
+        self.assertEqual(1, document.walks)
+
+    def test_wild_nested_alter_inside_of_altered_value(self):
+        document = {"a": {"ab": 1}, "b": {"ab": 2}}
+
+        def callback(data):
+            return data + 1 if isinstance(data, int) else "section"
+
+        altered_document = nested_alter(document, "a", callback, wild_alter=True)
+
+        self.assertEqual({"a": "section", "b": {"ab": 3}}, altered_document)
+        self.assertEqual({"a": {"ab": 1}, "b": {"ab": 2}}, document)
+
     def test_sample_data4(self):
         result = {
             "modelversion": "1.1.0",
@@ -1055,3 +1120,161 @@ class TestNestedAlter(BaseLookUpApi):
 
         self.maxDiff = None
         self.assertEqual(result, nested_alter(self.sample_data4, "plz", callback))
+
+
+class TestShareUnchanged(BaseLookUpApi):
+    def assertSharesUnchanged(self, result):
+        self.assertIsNot(self.sample_data4, result)
+        self.assertEqual(82269, self.sample_data4["plz"])
+
+        first, second = result["vertragsteile"]
+        original_first, original_second = self.sample_data4["vertragsteile"]
+        self.assertIsNot(original_first, first)
+        self.assertIsNot(original_first["beitragsDaten"], first["beitragsDaten"])
+        self.assertIs(original_first["deckung"], first["deckung"])
+        self.assertIs(original_second, second)
+
+    def test_nested_update(self):
+        result = nested_update(self.sample_data4, "plz", 1, share_unchanged=True)
+        self.assertEqual(nested_update(self.sample_data4, "plz", 1), result)
+        self.assertSharesUnchanged(result)
+
+    def test_nested_delete(self):
+        result = nested_delete(self.sample_data4, "plz", share_unchanged=True)
+        self.assertEqual(nested_delete(self.sample_data4, "plz"), result)
+        self.assertSharesUnchanged(result)
+
+    def test_nested_alter(self):
+        def callback(data):
+            return data + 1
+
+        result = nested_alter(self.sample_data4, "plz", callback, share_unchanged=True)
+        self.assertEqual(nested_alter(self.sample_data4, "plz", callback), result)
+        self.assertSharesUnchanged(result)
+
+    def test_nothing_to_change(self):
+        result = nested_update(self.sample_data4, "missing", 1, share_unchanged=True)
+        self.assertEqual(self.sample_data4, result)
+        self.assertIsNot(self.sample_data4, result)
+
+    def test_inside_of_updated_value(self):
+        document = {"a": {"a": 1}, "b": [{"a": 2}]}
+        result = nested_update(document, "a", {"a": 3}, share_unchanged=True)
+        self.assertEqual({"a": {"a": 3}, "b": [{"a": {"a": 3}}]}, result)
+        self.assertEqual({"a": {"a": 1}, "b": [{"a": 2}]}, document)
+
+
+class TestHasKeyAndKeyLocations(TestCase):
+    def setUp(self):
+        self.document = {
+            "a": 1,
+            "b": {"a": 2, "c": None},
+            "d": [{"a": 3}, "a", [{"a": 4}]],
+            "e": {"f": {"c": 5}},
+        }
+
+    def test_has_key_matches_get_occurrence_of_key(self):
+        for key in ["a", "b", "c", "f", "missing"]:
+            self.assertEqual(
+                get_occurrence_of_key(self.document, key) > 0,
+                has_key(self.document, key),
+                key,
+            )
+
+    def test_has_key_ignores_none_values(self):
+        self.assertFalse(has_key({"b": {"c": None}}, "c"))
+
+    def test_get_all_key_locations(self):
+        locations = get_all_key_locations(self.document)
+        self.assertEqual({("a",): 1, ("b", "a"): 2, ("d", 0, "a"): 3}, locations["a"])
+        self.assertEqual({("b", "c"): None, ("e", "f", "c"): 5}, locations["c"])
+        self.assertNotIn("missing", locations)
+
+
+class TestOccurrencesAcrossThreads(TestCase):
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        # Switch threads as often as possible to provoke interleaving.
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def document(self, number):
+        return [
+            {
+                "id": number,
+                "tags": [str(number), {"tag": str(number)}],
+                "nested": {"value": str(number), "other": {"value": str(number)}},
+            }
+            for _ in range(number % 5 + 1)
+        ]
+
+    def test_get_occurrences_and_values_from_many_threads(self):
+        documents = {number: self.document(number) for number in range(16)}
+        expected = {
+            number: get_occurrences_and_values(document, str(number))
+            for number, document in documents.items()
+        }
+
+        def search(number):
+            for _ in range(200):
+                result = get_occurrences_and_values(documents[number], str(number))
+                if result != expected[number]:
+                    return result
+            return expected[number]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = dict(zip(documents, executor.map(search, documents)))
+
+        self.assertEqual(expected, results)
+        self.assertEqual(4 * 5, expected[4][str(4)]["occurrences"])
+        self.assertEqual(3 * 5, len(expected[4][str(4)]["values"]))
+
+    def test_get_occurrences_and_values_only_in_lists(self):
+        result = get_occurrences_and_values([{"a": [1, 2]}, {"b": 1}], 1)
+        self.assertEqual({1: {"occurrences": 2, "values": [{"b": 1}]}}, result)
+
+
+class TestDeepDocuments(TestCase):
+    def setUp(self):
+        self.depth = sys.getrecursionlimit() * 2
+        self.document = {"key": "leaf", "value": 1}
+        for level in range(self.depth):
+            self.document = {
+                "key": level,
+                "list": [[{"value": 1}]],
+                "child": self.document,
+            }
+
+    def test_lookups_in_deep_documents(self):
+        self.assertEqual(
+            list(range(self.depth - 1, -1, -1)) + ["leaf"],
+            nested_lookup("key", self.document),
+        )
+        self.assertEqual(
+            self.depth + 1, len(nested_lookup("KEY", self.document, wild=True))
+        )
+        self.assertEqual(4 * self.depth + 2, len(get_all_keys(self.document)))
+        self.assertEqual(self.depth + 1, get_occurrence_of_key(self.document, "key"))
+        self.assertEqual(1, get_occurrence_of_value(self.document, "leaf"))
+        self.assertTrue(has_key(self.document, "value"))
+        self.assertEqual(
+            self.depth + 1, len(get_all_key_locations(self.document)["key"])
+        )
+
+    def test_changes_to_deep_documents(self):
+        nested_update(self.document, "key", "updated", in_place=True)
+        self.assertEqual({"updated"}, set(nested_lookup("key", self.document)))
+
+        nested_delete(self.document, "value", in_place=True)
+        self.assertEqual([], nested_lookup("value", self.document))
+
+    def test_copies_of_deep_documents(self):
+        updated = nested_update(self.document, "key", "updated", share_unchanged=True)
+        self.assertEqual({"updated"}, set(nested_lookup("key", updated)))
+
+        deleted = nested_delete(updated, "value", share_unchanged=True)
+        self.assertEqual([], nested_lookup("value", deleted))
+        self.assertEqual(self.depth + 1, len(nested_lookup("value", updated)))
+        self.assertEqual("leaf", nested_lookup("key", self.document)[-1])
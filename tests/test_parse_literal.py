@@ -0,0 +1,86 @@
+import ast
+from unittest.mock import patch
+
+import pytest
+
+from config_file.parsers.parse_literal import MAX_DEPTH, parse_literal
+
+
+@pytest.mark.parametrize(
+    "literal",
+    [
+        "[]",
+        "{}",
+        "['a', \"b\", 'c d']",
+        "[1, -2, 3.5, -0.25, 1e3, 2E-2, True, False, None]",
+        "{'key': [1, {'nested': \"value\"}], 2: None, True: 'yes'}",
+        "[\n    'multiline',\n    'value',\n]",
+        "{'trailing': 'comma',}",
+        "[[[]], [{}]]",
+        "{'duplicate': 1, 'duplicate': 2}",
+    ],
+)
+def test_parse_literal_parses_lists_and_dicts(literal):
+    """
+    config_file.parsers.parse_literal.parse_literal
+
+    Ensure that lists and dicts of strings, numbers, booleans, and None
+    are parsed the same as ast.literal_eval, without using it.
+    """
+    expected = ast.literal_eval(literal)
+
+    with patch("ast.literal_eval", side_effect=AssertionError):
+        assert parse_literal(literal) == expected
+
+
+@pytest.mark.parametrize(
+    "literal",
+    [
+        "[(1, 2), (3, 4)]",
+        "{1, 2}",
+        "['escaped\\nnewline', 'quote\\'s']",
+        "[r'raw', b'bytes']",
+        "['implicit' 'concatenation']",
+        "[0x1F, 1_000, 1j, 00.5]",
+        "[1, # comment\n 2]",
+        "[+1, - 2]",
+    ],
+)
+def test_parse_literal_leaves_other_syntax_to_literal_eval(literal):
+    """
+    config_file.parsers.parse_literal.parse_literal
+
+    Ensure that syntax besides plain lists and dicts is still parsed.
+    """
+    assert parse_literal(literal) == ast.literal_eval(literal)
+
+
+@pytest.mark.parametrize(
+    "literal",
+    ["[", "[1,,]", "[,]", "{'a' 1}", "{'a': }", "[1] [2]", "[01]", "[true]", "[1 2]"],
+)
+def test_parse_literal_rejects_invalid_literals(literal):
+    """
+    config_file.parsers.parse_literal.parse_literal
+
+    Ensure that literals Python can't parse raise an error.
+    """
+    with pytest.raises(Exception):
+        ast.literal_eval(literal)
+
+    with pytest.raises(Exception):
+        parse_literal(literal)
+
+
+def test_parse_literal_limits_nesting():
+    """
+    config_file.parsers.parse_literal.parse_literal
+
+    Ensure that literals can be nested as deeply as Python
+    allows, and that anything deeper raises a ValueError.
+    """
+    deepest = "[" * MAX_DEPTH + "]" * MAX_DEPTH
+    assert parse_literal(deepest) == ast.literal_eval(deepest)
+
+    with pytest.raises(ValueError):
+        parse_literal("[" * (MAX_DEPTH + 1) + "]" * (MAX_DEPTH + 1))
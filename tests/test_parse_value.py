@@ -1,3 +1,4 @@
+import sys
 from datetime import datetime
 
 import pytest
@@ -23,6 +24,8 @@ from config_file.parsers.parse_value import (
         ("TRUE", True),
         ("true", True),
         ("false", False),
+        ("  true  ", True),
+        (" -.5 ", -0.5),
     ],
 )
 def test_parse_value_parses_ints_floats_and_bools(test_input, expected):
@@ -63,7 +66,52 @@ def test_parse_value_parses_dicts_and_lists(test_input, expected):
     assert parse_value(test_input) == expected
 
 
-@pytest.mark.parametrize("test_input", ["blah", datetime(2020, 1, 1)])
+def test_parse_value_parses_deeply_nested_values():
+    """
+    config_file.parse_value.parse_value
+
+    Ensure that values nested deeper than the recursion limit are parsed.
+    """
+    value = expected = "5"
+    for index in range(sys.getrecursionlimit() * 2):
+        value = {"key": value} if index % 2 else [value]
+        expected = {"key": expected} if index % 2 else [expected]
+
+    parsed = parse_value(value)
+    for _ in range(sys.getrecursionlimit() * 2):
+        parsed = parsed["key"] if isinstance(parsed, dict) else parsed[0]
+
+    assert parsed == 5
+
+
+def test_parse_value_only_copies_what_has_strings():
+    """
+    config_file.parse_value.parse_value
+
+    Ensure that dicts and lists are only copied if there are strings
+    inside of them, and the original value is never modified.
+    """
+    typed = {"list": [1, 2.5, True, None], "empty": {}}
+    value = {"typed": typed, "strings": {"num": "5", "names": ["a", "b"]}}
+
+    parsed = parse_value(value)
+
+    assert parsed == {
+        "typed": typed,
+        "strings": {"num": 5, "names": ["a", "b"]},
+    }
+    assert parsed["typed"] is typed
+    assert parsed["strings"]["names"] is not value["strings"]["names"]
+    assert value["strings"]["num"] == "5"
+    assert parse_value(typed) is typed
+
+    unparsed = {"name": "unparsed", "names": ["a", "b"]}
+    assert parse_value(unparsed) == unparsed
+    assert parse_value(unparsed) is not unparsed
+    assert parse_value(unparsed)["names"] is not unparsed["names"]
+
+
+@pytest.mark.parametrize("test_input", ["blah", "", "   ", datetime(2020, 1, 1)])
 def test_parse_value_returns_values_that_cannot_be_parsed(test_input):
     """
     config_file.parse_value.parse_value
@@ -0,0 +1,138 @@
+from unittest.mock import patch
+
+import pytest
+
+from config_file.config_file import ConfigFile
+from config_file.config_file_path import ConfigFilePath
+from config_file.sidecar import load_parser
+
+SUPPORTED_FILE_TYPES = ["ini", "json", "yaml", "toml"]
+
+
+def snapshot_of(path):
+    return path.parent / f".{path.name}.snapshot"
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_load_parser_reuses_an_up_to_date_snapshot(template_file, file_type):
+    """
+    config_file.sidecar.load_parser
+
+    Ensure that the first load writes a snapshot next to the file
+    and the next load uses it instead of parsing the file again.
+    """
+    path = ConfigFilePath(template_file(file_type))
+    parsed = load_parser(path)
+
+    assert snapshot_of(path).exists()
+
+    with patch.object(path.parser_class, "loads", side_effect=AssertionError):
+        loaded = load_parser(path)
+
+    assert str(loaded) == str(parsed) == path.read_text()
+
+
+@pytest.mark.parametrize("snapshot_contents", [b"", b"corrupt", b"\x80\x05\x95garbage"])
+def test_load_parser_falls_back_on_a_corrupt_snapshot(template_file, snapshot_contents):
+    """
+    config_file.sidecar.load_parser
+
+    Ensure that a corrupt snapshot makes the file be parsed
+    again and the snapshot be replaced.
+    """
+    path = ConfigFilePath(template_file("toml"))
+    snapshot_of(path).write_bytes(snapshot_contents)
+
+    assert load_parser(path).get("header_one.number_key") == 0
+
+    with patch.object(path.parser_class, "loads", side_effect=AssertionError):
+        assert load_parser(path).get("header_one.number_key") == 0
+
+
+def test_load_parser_ignores_a_snapshot_of_different_contents(template_file):
+    """
+    config_file.sidecar.load_parser
+
+    Ensure that a snapshot is not used once the file changed.
+    """
+    path = ConfigFilePath(template_file("yaml"))
+    load_parser(path)
+
+    path.write_text(path.read_text().replace("number_key: 0", "number_key: 1"))
+
+    assert load_parser(path).get("header_one.number_key") == 1
+
+
+def test_load_parser_ignores_a_snapshot_from_another_version(template_file):
+    """
+    config_file.sidecar.load_parser
+
+    Ensure that a snapshot written with a different snapshot
+    format or library version is not used.
+    """
+    path = ConfigFilePath(template_file("toml"))
+
+    with patch("config_file.sidecar.SNAPSHOT_FORMAT", -1):
+        load_parser(path)
+
+    with patch.object(path.parser_class, "loads", side_effect=AssertionError):
+        with pytest.raises(AssertionError):
+            load_parser(path)
+
+    load_parser(path)
+
+    with patch("tomlkit.__version__", "0.0.0"):
+        with patch.object(path.parser_class, "loads", side_effect=AssertionError):
+            with pytest.raises(AssertionError):
+                load_parser(path)
+
+
+def test_load_parser_can_keep_snapshots_in_a_directory(template_file, tmp_path):
+    """
+    config_file.sidecar.load_parser
+
+    Ensure that snapshots can be stored in a cache directory
+    instead of next to the file.
+    """
+    path = ConfigFilePath(template_file("json"))
+    snapshot_dir = tmp_path / "snapshots"
+
+    load_parser(path, snapshot_dir)
+
+    assert not snapshot_of(path).exists()
+    assert len(list(snapshot_dir.glob("*.json.snapshot"))) == 1
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_load_parser_keeps_track_of_changes_without_a_snapshot(
+    template_file, file_type
+):
+    """
+    config_file.sidecar.load_parser
+
+    Ensure that a parser loaded without an up to date snapshot starts
+    out unchanged, just like one loaded from the snapshot.
+    """
+    path = ConfigFilePath(template_file(file_type))
+    parsed = load_parser(path)
+
+    assert not parsed.is_dirty
+    assert parsed.version is not None
+    assert not load_parser(path).is_dirty
+
+
+def test_config_file_can_use_sidecar_snapshots(template_file):
+    """
+    config_file.config_file.ConfigFile.__init__
+
+    Ensure that a ConfigFile created with sidecar=True loads
+    from the snapshot and can still be modified and saved.
+    """
+    path = template_file("toml")
+    ConfigFile(path, sidecar=True)
+
+    config = ConfigFile(path, sidecar=True)
+    config.set("header_one.number_key", 5)
+    config.save()
+
+    assert ConfigFile(path, sidecar=True).get("header_one.number_key") == 5
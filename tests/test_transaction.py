@@ -0,0 +1,166 @@
+from unittest.mock import patch
+
+import pytest
+
+from config_file.config_file import ConfigFile
+from config_file.key_path import KeyPath
+
+SUPPORTED_FILE_TYPES = ["ini", "json", "yaml", "toml"]
+
+CHANGES = [
+    ("set", "header_one.number_key", 5),
+    ("set", "header_three.nested.key", "value"),
+    ("delete", "header_two.str_key", None),
+    ("delete", "header_three", None),
+    ("set", "header_three.other", "again"),
+    ("set", KeyPath("header_one.new_key"), "new"),
+    ("delete", "header_one.new_key", None),
+]
+
+
+def apply(target, changes):
+    for operation, key, value in changes:
+        if operation == "set":
+            target.set(key, value)
+        else:
+            target.delete(key)
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_transaction_applies_the_changes_on_exit(template_file, file_type):
+    """
+    config_file.config_file.ConfigFile.transaction
+
+    Ensure that the changes made in a transaction are only
+    applied once it is exited, with the same result as making
+    them one at a time.
+    """
+    path = template_file(file_type)
+    config, expected = ConfigFile(path), ConfigFile(path)
+    original = str(config)
+
+    with config.transaction() as transaction:
+        apply(transaction, CHANGES)
+        assert str(config) == original
+
+    apply(expected, CHANGES)
+    assert str(config) == str(expected)
+    assert config.is_dirty
+    assert path.read_text() == original
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_transaction_sees_its_own_changes(template_file, file_type):
+    """
+    config_file.transaction.Transaction.get
+
+    Ensure that retrieving keys from a transaction sees
+    the changes made so far.
+    """
+    config = ConfigFile(template_file(file_type))
+
+    with config.transaction() as transaction:
+        transaction.set("header_one.number_key", 5)
+        transaction.delete("header_two")
+        transaction.set("header_two.str_key", "recreated")
+
+        assert transaction.get("header_one.number_key") == 5
+        assert transaction.has("header_one")
+        assert transaction.get("header_two") == {"str_key": "recreated"}
+        assert not transaction.has("header_two.list_key")
+        assert transaction.get("missing", default=None) is None
+        with pytest.raises(KeyError):
+            transaction.get("header_two.list_key")
+
+        assert str(config.get("header_one.number_key")) == "0"
+        assert config.has("header_two.list_key")
+
+
+def test_transaction_is_discarded_on_error(template_file):
+    """
+    config_file.config_file.ConfigFile.transaction
+
+    Ensure that an error raised in the transaction discards
+    every change made in it, without copying the parsed file.
+    """
+    path = template_file("toml")
+    config = ConfigFile(path)
+    original = str(config)
+
+    with patch("copy.deepcopy", side_effect=AssertionError):
+        with pytest.raises(RuntimeError):
+            with config.transaction(save=True) as transaction:
+                transaction.set("header_one.number_key", 5)
+                transaction.delete("header_two")
+                raise RuntimeError
+
+    assert str(config) == original
+    assert not config.is_dirty
+    assert path.read_text() == original
+
+
+def test_transaction_can_save_once_done(template_file):
+    """
+    config_file.config_file.ConfigFile.transaction
+
+    Ensure that a transaction created with save=True
+    saves the file after applying the changes.
+    """
+    path = template_file("json")
+    config = ConfigFile(path)
+
+    with config.transaction(save=True) as transaction:
+        transaction.set("header_one.number_key", 5)
+
+    assert not config.is_dirty
+    assert ConfigFile(path).get("header_one.number_key") == 5
+
+
+def test_transaction_rejects_invalid_changes_when_made(template_file):
+    """
+    config_file.transaction.Transaction.set
+    config_file.transaction.Transaction.delete
+
+    Ensure that changes that could not be applied raise
+    when they are made instead of when they are committed.
+    """
+    config = ConfigFile(template_file("yaml"))
+
+    with config.transaction() as transaction:
+        with pytest.raises(TypeError):
+            transaction.set("header_two.str_key.too_deep", 1)
+
+        with pytest.raises(IndexError):
+            transaction.set(KeyPath(("header_two", "list_key", 3)), 4)
+
+        with pytest.raises(KeyError):
+            transaction.delete("header_one.missing")
+
+        transaction.set("header_one.number_key", 1)
+        transaction.rollback()
+
+    assert not config.is_dirty
+
+
+@pytest.mark.parametrize("file_type", ["json", "yaml", "toml"])
+def test_transaction_is_discarded_if_a_change_fails(template_file, file_type):
+    """
+    config_file.transaction.Transaction.commit
+
+    Ensure that if one of the changes can no longer be applied
+    once the transaction is exited, none of them are applied.
+    """
+    config = ConfigFile(template_file(file_type))
+
+    with pytest.raises(IndexError):
+        with config.transaction(save=True) as transaction:
+            transaction.set("header_one.number_key", 5)
+            transaction.set(KeyPath(("header_two", "list_key", 2)), 4)
+            transaction.set("header_three.key", "new")
+
+            config.delete(KeyPath(("header_two", "list_key", 2)))
+            config.save()
+            original = str(config)
+
+    assert str(config) == original
+    assert not config.is_dirty
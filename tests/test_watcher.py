@@ -0,0 +1,267 @@
+import asyncio
+import os
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from config_file.config_file import ConfigFile
+from config_file.watcher import ConfigWatcher
+
+SUPPORTED_FILE_TYPES = ["ini", "json", "yaml", "toml"]
+
+
+def touch(path, stat):
+    """Make sure the modification time changed since stat."""
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def rewrite(path, contents):
+    stat = os.stat(path)
+    with open(path, "w") as file:
+        file.write(contents)
+    touch(path, stat)
+
+
+@pytest.mark.parametrize("file_type", SUPPORTED_FILE_TYPES)
+def test_poll_reloads_a_changed_file(template_file, file_type):
+    """
+    config_file.watcher.ConfigWatcher.poll
+
+    Ensure that a file that changed on disk is reloaded
+    and the callback is called with its ConfigFile.
+    """
+    config = ConfigFile(template_file(file_type))
+    callback = Mock()
+    watcher = ConfigWatcher(debounce=0)
+    watcher.watch(config, callback)
+
+    assert watcher.poll() == []
+
+    stat = os.stat(config.path)
+    other = ConfigFile(config.path)
+    other.set("header_one.number_key", 5)
+    other.save()
+    touch(config.path, stat)
+
+    assert watcher.poll() == [config]
+    assert str(config.get("header_one.number_key")) == "5"
+    callback.assert_called_once_with(config)
+
+    assert watcher.poll() == []
+    callback.assert_called_once()
+
+
+def test_poll_waits_for_the_file_to_stop_changing(template_file):
+    """
+    config_file.watcher.ConfigWatcher.poll
+
+    Ensure that a file is only reloaded once it was unchanged
+    for the debounce period.
+    """
+    config = ConfigFile(template_file("json"))
+    callback = Mock()
+    watcher = ConfigWatcher(debounce=1.0)
+    watcher.watch(config, callback)
+
+    with patch("config_file.watcher.monotonic", return_value=100.0):
+        rewrite(config.path, '{"header_one": {"number_key": 1}}')
+        assert watcher.poll() == []
+
+    with patch("config_file.watcher.monotonic", return_value=100.5):
+        rewrite(config.path, '{"header_one": {"number_key": 22}}')
+        assert watcher.poll() == []
+
+    with patch("config_file.watcher.monotonic", return_value=101.0):
+        assert watcher.poll() == []
+
+    with patch("config_file.watcher.monotonic", return_value=101.5):
+        assert watcher.poll() == [config]
+
+    assert config.get("header_one.number_key") == 22
+    callback.assert_called_once_with(config)
+
+
+def test_poll_keeps_the_contents_of_an_invalid_file(template_file):
+    """
+    config_file.watcher.ConfigWatcher.poll
+
+    Ensure that a file that can not be parsed keeps its previous
+    contents, does not call the callback, and is reloaded once
+    it is fixed.
+    """
+    config = ConfigFile(template_file("json"))
+    callback = Mock()
+    watcher = ConfigWatcher(debounce=0)
+    watcher.watch(config, callback)
+
+    rewrite(config.path, '{"header_one": ')
+    assert watcher.poll() == []
+    assert config.get("header_one.number_key") == 0
+    callback.assert_not_called()
+
+    rewrite(config.path, '{"header_one": {"number_key": 3}}')
+    assert watcher.poll() == [config]
+    assert config.get("header_one.number_key") == 3
+
+
+@pytest.mark.parametrize("save", ["save", "asave"])
+def test_poll_does_not_reload_files_the_config_file_saved(template_file, save):
+    """
+    config_file.watcher.ConfigWatcher.poll
+
+    Ensure that a file written by its own ConfigFile is not
+    reloaded, keeping the changes made to it since then.
+    """
+    config = ConfigFile(template_file("json"))
+    callback = Mock()
+    watcher = ConfigWatcher(debounce=0)
+    watcher.watch(config, callback)
+
+    config.set("header_one.number_key", 25)
+    if save == "save":
+        config.save()
+    else:
+        asyncio.run(config.asave())
+    config.set("header_one.other_key", "unsaved")
+
+    assert watcher.poll() == []
+    callback.assert_not_called()
+    assert config.get("header_one.other_key") == "unsaved"
+    assert config.is_dirty
+
+    rewrite(config.path, '{"header_one": {"number_key": 3}}')
+    assert watcher.poll() == []
+    assert config.get("header_one.other_key") == "unsaved"
+
+
+def test_poll_reloads_a_config_file_once_it_has_no_unsaved_changes(template_file):
+    """
+    config_file.watcher.ConfigWatcher.poll
+
+    Ensure that a file that changed while its ConfigFile had unsaved
+    changes is reloaded once they are gone, and not once they are saved.
+    """
+    config = ConfigFile(template_file("json"))
+    watcher = ConfigWatcher(debounce=0)
+    watcher.watch(config, Mock())
+
+    config.set("header_one.number_key", 25)
+    rewrite(config.path, '{"header_one": {"number_key": 3}}')
+    assert watcher.poll() == []
+
+    config.save()
+    assert watcher.poll() == []
+    assert config.get("header_one.number_key") == 25
+
+    config.get("header_one")
+    rewrite(config.path, '{"header_one": {"number_key": 3}}')
+    assert watcher.poll() == [config]
+    assert config.get("header_one.number_key") == 3
+
+
+def test_poll_ignores_a_missing_file(template_file):
+    """
+    config_file.watcher.ConfigWatcher.poll
+
+    Ensure that a file that is temporarily removed is not
+    reloaded until it exists again.
+    """
+    config = ConfigFile(template_file("json"))
+    contents = str(config)
+    watcher = ConfigWatcher(debounce=0)
+    watcher.watch(config, Mock())
+
+    os.remove(config.path)
+    assert watcher.poll() == []
+
+    with open(config.path, "w") as file:
+        file.write(contents.replace('"number_key": 0', '"number_key": 7'))
+
+    assert watcher.poll() == [config]
+    assert config.get("header_one.number_key") == 7
+
+
+def test_callback_errors_do_not_stop_other_callbacks(template_file):
+    """
+    config_file.watcher.ConfigWatcher.poll
+
+    Ensure that a failing callback does not keep the other
+    callbacks from being called.
+    """
+    config = ConfigFile(template_file("json"))
+    failing, callback = Mock(side_effect=RuntimeError), Mock()
+    watcher = ConfigWatcher(debounce=0)
+    watcher.watch(config, failing)
+    watcher.watch(config, callback)
+
+    rewrite(config.path, '{"header_one": {"number_key": 1}}')
+
+    assert watcher.poll() == [config]
+    failing.assert_called_once_with(config)
+    callback.assert_called_once_with(config)
+
+
+def test_unwatch(template_file):
+    """
+    config_file.watcher.ConfigWatcher.unwatch
+
+    Ensure that unwatching a callback stops it from being called
+    and unwatching every callback stops reloading the file.
+    """
+    config = ConfigFile(template_file("json"))
+    first, second = Mock(), Mock()
+    watcher = ConfigWatcher(debounce=0)
+    watcher.watch(config, first)
+    watcher.watch(config, second)
+
+    watcher.unwatch(config, first)
+    rewrite(config.path, '{"header_one": {"number_key": 1}}')
+    assert watcher.poll() == [config]
+    first.assert_not_called()
+    second.assert_called_once_with(config)
+
+    watcher.unwatch(config)
+    rewrite(config.path, '{"header_one": {"number_key": 2}}')
+    assert watcher.poll() == []
+    assert config.get("header_one.number_key") == 1
+
+
+def test_background_thread_reloads_the_file(template_file):
+    """
+    config_file.watcher.ConfigWatcher.start
+
+    Ensure that the background thread polls until it is stopped.
+    """
+    config = ConfigFile(template_file("json"))
+    callback = Mock()
+
+    with ConfigWatcher(interval=0.01, debounce=0) as watcher:
+        config.watch(callback, watcher=watcher)
+        rewrite(config.path, '{"header_one": {"number_key": 1}}')
+
+        deadline = time.monotonic() + 5
+        while not callback.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    callback.assert_called_once_with(config)
+    assert config.get("header_one.number_key") == 1
+
+    config.unwatch(callback, watcher=watcher)
+    assert watcher.poll() == []
+
+
+def test_reload_discards_unsaved_changes(template_file):
+    """
+    config_file.config_file.ConfigFile.reload
+
+    Ensure that reloading reads the file again and
+    discards any unsaved changes.
+    """
+    config = ConfigFile(template_file("toml"))
+    config.set("header_one.number_key", 5)
+
+    config.reload()
+
+    assert config.get("header_one.number_key") == 0
+    assert not config.is_dirty